@@ -8,6 +8,7 @@ Cloud Functions 진입점: 카카오 웹툰 주간 차트 수집 파이프라인
 - Load Refined: BigQuery에 정제된 데이터 저장
 """
 
+import hashlib
 import json
 import logging
 import os
@@ -35,33 +36,32 @@ else:
     if src_path.exists():
         sys.path.insert(0, str(src_path))
 
-from src.extract import extract_webtoon_chart, try_api_endpoints, SORT_OPTIONS
-from src.parse import parse_html_file
-from src.parse_api import parse_api_response
-from src.transform import transform_and_save
-from src.utils import setup_logging, get_chart_jsonl_path, get_dim_webtoon_jsonl_path
+# 콜드 스타트 시간 단축: 모듈 로드 시점에는 JSON API 경로에 필요한 가벼운 모듈만 import
+# (bs4/lxml, pandas/pyarrow, GCP 클라이언트 라이브러리는 실제로 사용하는 시점에 로드,
+#  scripts/benchmark/profile_function_imports.py로 측정)
+from src.extract import try_api_endpoints, SORT_OPTIONS
+from src.parse_api import parse_api_response, project_api_response
+from src.transform import TransformRun, get_fact_weekly_chart_path
+from src.utils import setup_logging, is_module_available
+from src.clients import get_client_stats
+from src.warm_cache import WarmCache, get_warm_cache_stats, invalidate_all_warm_caches
 
 # 로깅 설정 (먼저 설정)
 setup_logging()
 logger = logging.getLogger(__name__)
 
-# GCS/BigQuery 업로드는 선택적으로 import (로컬 테스트 시 없을 수 있음)
-try:
+# GCS/BigQuery 업로드는 선택적으로 사용 (로컬 테스트 시 없을 수 있음)
+# 설치 여부만 확인하고, 클라이언트 라이브러리는 업로드 시점에 import됨
+UPLOAD_GCS_AVAILABLE = is_module_available('google.cloud.storage')
+if UPLOAD_GCS_AVAILABLE:
     from src.upload_gcs import upload_chart_data_to_gcs
-    UPLOAD_GCS_AVAILABLE = True
-except ImportError:
-    UPLOAD_GCS_AVAILABLE = False
+else:
     logger.warning("GCS 업로드 모듈을 사용할 수 없습니다. (로컬 테스트 모드)")
 
-try:
-    from src.upload_bigquery import (
-        upload_dim_webtoon,
-        upload_fact_weekly_chart,
-        get_bigquery_client,
-    )
-    UPLOAD_BIGQUERY_AVAILABLE = True
-except ImportError:
-    UPLOAD_BIGQUERY_AVAILABLE = False
+UPLOAD_BIGQUERY_AVAILABLE = is_module_available('google.cloud.bigquery')
+if UPLOAD_BIGQUERY_AVAILABLE:
+    from src.upload_bigquery import upload_dim_webtoon_delta, upload_fact_weekly_chart, upload_to_bigquery
+else:
     logger.warning("BigQuery 업로드 모듈을 사용할 수 없습니다. (로컬 테스트 모드)")
 
 # 환경 변수
@@ -69,12 +69,140 @@ GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'kakao-webtoon-raw')
 BIGQUERY_PROJECT_ID = os.getenv('BIGQUERY_PROJECT_ID', 'kakao-webtoon-collector')
 BIGQUERY_DATASET_ID = os.getenv('BIGQUERY_DATASET_ID', 'kakao_webtoon')
 
-# 로깅 설정
-setup_logging()
-logger = logging.getLogger(__name__)
+# 마지막으로 성공한 실행의 payload fingerprint
+# (warm 인스턴스에서 같은 날짜/정렬 키/API 응답으로 다시 호출되면 저장/업로드를 생략)
+_LAST_PAYLOAD_CACHE = WarmCache('last_payload', ttl=3600)
+
+
+def compute_payload_fingerprint(payload: bytes, chart_date: date, sort_keys: list) -> str:
+    """
+    직렬화된 API 응답과 실행 파라미터의 fingerprint를 계산합니다.
+    
+    Args:
+        payload: 직렬화된 API 응답 (GCS 아카이브와 같은 바이트)
+        chart_date: 수집 날짜
+        sort_keys: 정렬 키 리스트
+    
+    Returns:
+        SHA-256 hex 문자열
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{chart_date.isoformat()}|{','.join(sorted(map(str, sort_keys)))}|".encode('utf-8'))
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+def is_payload_unchanged(fingerprint: str, chart_date: date, sort_keys: list) -> bool:
+    """
+    이전 호출이 같은 payload로 성공했고 그 결과 파일이 /tmp에 남아 있는지 확인합니다.
+    
+    Args:
+        fingerprint: 이번 호출의 payload fingerprint
+        chart_date: 수집 날짜
+        sort_keys: 처리할 정렬 키 리스트
+    
+    Returns:
+        같은 payload를 이미 처리했으면 True
+    """
+    return _LAST_PAYLOAD_CACHE.peek(
+        lambda cached: cached == fingerprint and all(
+            get_fact_weekly_chart_path(chart_date, sort_key).exists()
+            for sort_key in sort_keys if sort_key in SORT_OPTIONS
+        )
+    ) is not None
+
+
+def upload_dim_to_bigquery(records: list) -> bool:
+    """
+    이번 실행에서 추가/변경된 dim_webtoon 레코드를 BigQuery에 업로드합니다.
+    BigQuery에 같은 fingerprint로 이미 반영된 레코드는 건너뛰고, 변경이 없으면 MERGE도 생략합니다.
+    콜드 스타트로 DATA_DIR에 manifest가 없으면 BigQuery dim_webtoon에서 manifest를 다시 만듭니다.
+    
+    Args:
+        records: 추가/변경된 dim_webtoon 레코드 리스트
+    
+    Returns:
+        업로드 성공 여부
+    """
+    logger.info(f"dim_webtoon BigQuery 업로드 시작: {len(records)}개 변경")
+    try:
+        upload_success = upload_dim_webtoon_delta(records, dry_run=False)
+        if upload_success:
+            logger.info("✅ dim_webtoon BigQuery 업로드 성공")
+        else:
+            logger.error("dim_webtoon BigQuery 업로드 실패")
+        return upload_success
+    except Exception as e:
+        logger.error(f"dim_webtoon BigQuery 업로드 중 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+def upload_fact_to_bigquery(chart_date: date, sort_key: str) -> bool:
+    """
+    정렬 키 하나의 fact_weekly_chart를 BigQuery에 업로드합니다.
+    저장 형식(DATA_FORMAT)에 맞는 파티션을 읽으며, 올릴 레코드가 없으면 실패로 처리합니다.
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_key: 정렬 키
+    
+    Returns:
+        업로드 성공 여부
+    """
+    sort_name = SORT_OPTIONS[sort_key]
+    logger.info(f"fact_weekly_chart BigQuery 업로드 시작 ({sort_name})")
+    try:
+        upload_success = upload_fact_weekly_chart(
+            chart_date=chart_date,
+            sort_key=sort_key,
+            dry_run=False
+        )
+        if upload_success:
+            logger.info(f"✅ fact_weekly_chart BigQuery 업로드 성공 ({sort_name})")
+        else:
+            logger.error(f"fact_weekly_chart BigQuery 업로드 실패 ({sort_name})")
+        return upload_success
+    except Exception as e:
+        logger.error(f"fact_weekly_chart BigQuery 업로드 중 오류 발생 ({sort_name}): {e}")
+        import traceback
+        traceback.print_exc()
+        return False
 
-# GCS/BigQuery 업로드 모듈 import 전에 logger 설정 필요
-# (위에서 이미 설정됨)
+
+def upload_all_to_bigquery(chart_date: date, sort_keys: list, dim_records: list, fact_batches: dict = None) -> bool:
+    """
+    dim_webtoon 변경분과 여러 정렬 키의 fact_weekly_chart.jsonl을 BigQuery에 업로드합니다.
+    두 테이블의 임시 테이블 적재를 동시에 실행하고, MERGE는 적재가 끝난 테이블부터 실행합니다
+    (fact_weekly_chart는 임시 테이블 하나와 MERGE 한 번).
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_keys: 정렬 키 리스트
+        dim_records: 이번 실행에서 추가/변경된 dim_webtoon 레코드 리스트
+        fact_batches: 정렬 키별 fact_weekly_chart Arrow 배치 (TransformRun.fact_batches, 있으면 파일을 다시 읽지 않음)
+    
+    Returns:
+        업로드 성공 여부
+    """
+    sort_names = ', '.join(SORT_OPTIONS[sort_key] for sort_key in sort_keys)
+    logger.info(f"BigQuery 업로드 시작: dim_webtoon {len(dim_records)}개 변경, fact_weekly_chart {sort_names}")
+    try:
+        upload_jobs = upload_to_bigquery(
+            [chart_date], sort_keys, dim_delta=dim_records, fact_batches={chart_date: fact_batches or {}}
+        )
+        upload_jobs.log_summary()
+        if upload_jobs.success:
+            logger.info(f"✅ BigQuery 업로드 성공 (dim_webtoon, fact_weekly_chart: {sort_names})")
+        else:
+            logger.error(f"BigQuery 업로드 실패: {upload_jobs.to_dict()['jobs']}")
+        return upload_jobs.success
+    except Exception as e:
+        logger.error(f"BigQuery 업로드 중 오류 발생 ({sort_names}): {e}")
+        import traceback
+        traceback.print_exc()
+        return False
 
 
 @functions_framework.http
@@ -108,6 +236,9 @@ def main(request):
         sort_keys = request_json.get('sort_keys', ['popularity'])  # 기본값: 전체 인기순
         collect_all_weekdays = request_json.get('collect_all_weekdays', False)
         limit = request_json.get('limit')  # 테스트용 제한
+        parallel = bool(request_json.get('parallel', False))  # 정렬 키 병렬 처리
+        workers = request_json.get('workers')  # 병렬 처리 워커 수 (기본값: 정렬 키 수)
+        force = bool(request_json.get('force', False))  # 같은 payload여도 다시 처리
         
         # 실행 날짜의 요일 계산 (0=월요일, 6=일요일)
         weekday_index = chart_date.weekday()  # 0=Monday, 6=Sunday
@@ -144,15 +275,23 @@ def main(request):
         
         if api_data is None:
             logger.error("데이터 수집 실패")
+            _LAST_PAYLOAD_CACHE.invalidate('데이터 수집 실패')
             return {'error': 'Failed to collect data'}, 500
         
+        # 원본은 한 번만 직렬화 (fingerprint 계산과 GCS 아카이브에 같이 사용, 공백 없는 JSON)
+        payload = json.dumps(api_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        payload_fingerprint = compute_payload_fingerprint(payload, chart_date, sort_keys)
+        if not force and is_payload_unchanged(payload_fingerprint, chart_date, sort_keys):
+            logger.info("이전 호출과 같은 payload입니다. 저장/업로드를 생략합니다. (다시 처리하려면 force=true)")
+            return {'status': 'success', 'date': str(chart_date), 'skipped': 'unchanged_payload'}, 200
+        
         # Step 1: Load Raw (GCS에 JSON 원본 저장)
         if UPLOAD_GCS_AVAILABLE:
             logger.info("GCS에 원본 데이터 저장 중...")
             from tempfile import NamedTemporaryFile
             
-            with NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as tmp_file:
-                json.dump(api_data, tmp_file, ensure_ascii=False, indent=2)
+            with NamedTemporaryFile(mode='wb', suffix='.json', delete=False) as tmp_file:
+                tmp_file.write(payload)
                 tmp_path = Path(tmp_file.name)
             
             try:
@@ -172,6 +311,11 @@ def main(request):
         else:
             logger.info("GCS 업로드 모듈이 없습니다. 로컬 테스트 모드로 진행합니다.")
         
+        # 이후 단계에서 사용하는 필드만 남긴 작업용 payload로 교체
+        # (원본 트리는 아카이브 후 더 이상 유지하지 않음)
+        api_data = project_api_response(api_data)
+        del payload
+        
         # Step 2 & 3: Parse & Transform & Load Refined (각 정렬 옵션별로 처리)
         # 주의: parse_api_response는 각 sort_key별로 호출되므로 여기서는 호출하지 않음
         # 임시 디렉토리 사용 (Cloud Functions의 /tmp 사용)
@@ -182,7 +326,53 @@ def main(request):
         # 환경 변수 설정 (로컬 파일 저장 경로)
         os.environ['DATA_DIR'] = str(temp_dir)
         
-        # 각 정렬 옵션별로 처리
+        # 정렬 옵션별 변환 결과를 모아 두었다가 한 번에 저장
+        # (dim_webtoon은 정렬 옵션과 무관하므로 실행당 한 번만 병합/저장)
+        # BigQuery 업로드용으로 저장한 fact_weekly_chart를 Arrow 배치로도 보관 (업로드 시 파일을 다시 읽지 않음)
+        transform_run = TransformRun(chart_date, keep_batches=UPLOAD_BIGQUERY_AVAILABLE and not parallel)
+        
+        if parallel:
+            # 정렬 키별 파싱 → 저장 → BigQuery 업로드를 워커 풀에서 병렬 처리
+            # (dim_webtoon은 모든 정렬 키 변환 후 단일 writer가 한 번만 저장/업로드)
+            from src.parallel import run_sort_keys_parallel
+            
+            valid_sort_keys = []
+            for sort_key in sort_keys:
+                if sort_key not in SORT_OPTIONS:
+                    logger.warning(f"알 수 없는 정렬 키: {sort_key}, 건너뜁니다.")
+                    continue
+                valid_sort_keys.append(sort_key)
+            
+            report = run_sort_keys_parallel(
+                transform_run,
+                valid_sort_keys,
+                parse=lambda sort_key: parse_api_response(api_data, sort_key=sort_key),
+                upload_fact=(lambda sort_key: upload_fact_to_bigquery(chart_date, sort_key)) if UPLOAD_BIGQUERY_AVAILABLE else None,
+                upload_dim=upload_dim_to_bigquery if UPLOAD_BIGQUERY_AVAILABLE else None,
+                workers=int(workers) if workers else None,
+                sort_names=SORT_OPTIONS,
+            )
+            
+            saved_sort_keys = report.saved_sort_keys
+            status = 'success' if saved_sort_keys and len(saved_sort_keys) == len(valid_sort_keys) else 'partial_failure'
+            # 업로드까지 모두 성공한 payload만 기억 (실패한 업로드는 다음 호출에서 다시 시도)
+            if status == 'success' and report.success:
+                _LAST_PAYLOAD_CACHE.put(payload_fingerprint)
+            else:
+                _LAST_PAYLOAD_CACHE.invalidate('일부 정렬 키 처리 실패')
+            if status == 'success':
+                logger.info("🎉 파이프라인 실행 완료!")
+            else:
+                logger.error("❌ 파이프라인 실행 중 일부 오류 발생")
+            logger.info(f"warm 캐시 상태: {get_warm_cache_stats()}")
+            logger.info(f"GCP 클라이언트 생성/재사용: {get_client_stats()}")
+            return {
+                'status': status,
+                'date': str(chart_date),
+                'timings': report.to_dict(),
+            }, 200 if status == 'success' else 500
+        
+        # 각 정렬 옵션별로 파싱 및 변환
         for sort_key in sort_keys:
             if sort_key not in SORT_OPTIONS:
                 logger.warning(f"알 수 없는 정렬 키: {sort_key}, 건너뜁니다.")
@@ -194,12 +384,8 @@ def main(request):
             logger.info(f"{'='*60}")
             
             try:
-                # API 데이터에 정렬 키 추가
-                api_data_with_sort = api_data.copy()
-                api_data_with_sort['_sort_key'] = sort_key
-                
-                # 정렬된 데이터 파싱 (parse_api_response가 sort_key를 받아서 정렬함)
-                sorted_parsed_data = parse_api_response(api_data_with_sort, sort_key=sort_key)
+                # 정렬된 데이터 파싱 (parse_api_response가 sort_key를 받아서 정렬함, 입력은 수정하지 않음)
+                sorted_parsed_data = parse_api_response(api_data, sort_key=sort_key)
                 
                 if len(sorted_parsed_data) == 0:
                     logger.warning(f"정렬된 데이터가 없습니다 ({sort_name})")
@@ -207,90 +393,13 @@ def main(request):
                 
                 # 정렬 정보 추가
                 for item in sorted_parsed_data:
-                    item['_sort_key'] = sort_key
-                    item['_sort_name'] = sort_name
-                
-                # 데이터 변환 및 저장
-                logger.info(f"데이터 변환 및 저장 시작 ({sort_name})...")
-                success = transform_and_save(sorted_parsed_data, chart_date, sort_key)
+                    item.set_sort(sort_key, sort_name)
                 
-                if success:
-                    # 저장된 JSONL 파일을 BigQuery에 업로드
-                    if UPLOAD_BIGQUERY_AVAILABLE:
-                        from src.utils import get_dim_webtoon_jsonl_path, get_chart_jsonl_path
-                        
-                        # dim_webtoon 업로드 (첫 번째 정렬 옵션일 때만)
-                        if sort_key == sort_keys[0]:
-                            dim_jsonl_path = get_dim_webtoon_jsonl_path()
-                            if dim_jsonl_path.exists():
-                                logger.info(f"dim_webtoon.jsonl 파일 발견, BigQuery 업로드 시작: {dim_jsonl_path}")
-                                try:
-                                    upload_success = upload_dim_webtoon(jsonl_path=dim_jsonl_path, dry_run=False)
-                                    if upload_success:
-                                        logger.info("✅ dim_webtoon BigQuery 업로드 성공")
-                                    else:
-                                        logger.error("dim_webtoon BigQuery 업로드 실패")
-                                except Exception as e:
-                                    logger.error(f"dim_webtoon BigQuery 업로드 중 오류 발생: {e}")
-                                    import traceback
-                                    traceback.print_exc()
-                        
-                        # fact_weekly_chart 업로드
-                        fact_jsonl_path = get_chart_jsonl_path(chart_date, sort_key)
-                        if fact_jsonl_path.exists():
-                            logger.info(f"fact_weekly_chart.jsonl 파일 발견, BigQuery 업로드 시작: {fact_jsonl_path}")
-                            try:
-                                upload_success = upload_fact_weekly_chart(
-                                    chart_date=chart_date,
-                                    sort_key=sort_key,
-                                    jsonl_path=fact_jsonl_path,
-                                    dry_run=False
-                                )
-                                if upload_success:
-                                    logger.info(f"✅ fact_weekly_chart BigQuery 업로드 성공 ({sort_name})")
-                                else:
-                                    logger.error(f"fact_weekly_chart BigQuery 업로드 실패 ({sort_name})")
-                            except Exception as e:
-                                logger.error(f"fact_weekly_chart BigQuery 업로드 중 오류 발생 ({sort_name}): {e}")
-                                import traceback
-                                traceback.print_exc()
-                        else:
-                            logger.warning(f"fact_weekly_chart.jsonl 파일이 존재하지 않습니다: {fact_jsonl_path}")
-                    else:
-                        logger.info("BigQuery 업로드 모듈이 없습니다. 로컬 테스트 모드로 진행합니다.")
-                    
-                    # 정렬별 GCS 업로드
-                    if UPLOAD_GCS_AVAILABLE:
-                        logger.info(f"정렬별 GCS 업로드 시작 ({sort_name})...")
-                        # 정렬된 데이터를 임시 파일에 저장
-                        from tempfile import NamedTemporaryFile
-                        with NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as tmp_file:
-                            # 정렬된 API 데이터 재구성
-                            sorted_api_data = api_data.copy()
-                            sorted_api_data['_sort_key'] = sort_key
-                            json.dump(sorted_api_data, tmp_file, ensure_ascii=False, indent=2)
-                            tmp_path = Path(tmp_file.name)
-                        
-                        try:
-                            gcs_success = upload_chart_data_to_gcs(
-                                chart_date,
-                                sort_key=sort_key,
-                                json_file_path=tmp_path,
-                                dry_run=False
-                            )
-                            if gcs_success:
-                                logger.info(f"✅ GCS 업로드 완료 ({sort_name})")
-                            else:
-                                logger.warning(f"GCS 업로드 실패 ({sort_name}), 계속 진행...")
-                        finally:
-                            if tmp_path.exists():
-                                tmp_path.unlink()
-                    
-                    logger.info(f"✅ 정렬 옵션 '{sort_name}' 수집 완료!")
-                else:
-                    logger.error(f"데이터 변환 및 저장 실패 ({sort_name})")
+                # 데이터 변환 (저장은 모든 정렬 옵션 처리 후 한 번에)
+                logger.info(f"데이터 변환 시작 ({sort_name})...")
+                if not transform_run.add(sorted_parsed_data, sort_key):
+                    logger.error(f"데이터 변환 실패 ({sort_name})")
                     all_success = False
-                    continue
                     
             except Exception as e:
                 logger.error(f"정렬 옵션 '{sort_name}' 처리 중 오류 발생: {e}")
@@ -298,6 +407,40 @@ def main(request):
                 traceback.print_exc()
                 all_success = False
         
+        if not transform_run.sort_keys:
+            logger.error("저장할 데이터가 없습니다.")
+            _LAST_PAYLOAD_CACHE.invalidate('저장할 데이터 없음')
+            return {'status': 'partial_failure', 'date': str(chart_date)}, 500
+        
+        # 데이터 저장 (dim_webtoon 한 번, fact_weekly_chart는 정렬 키별)
+        logger.info("데이터 저장 시작...")
+        if not transform_run.flush():
+            logger.error("데이터 저장 실패")
+            _LAST_PAYLOAD_CACHE.invalidate('데이터 저장 실패')
+            return {'status': 'partial_failure', 'date': str(chart_date)}, 500
+        
+        # 저장된 데이터를 BigQuery에 업로드
+        # (업로드까지 모두 성공한 payload만 기억하여, 실패한 업로드는 다음 호출에서 다시 시도)
+        uploads_success = True
+        if UPLOAD_BIGQUERY_AVAILABLE:
+            # dim_webtoon(이번 실행에서 추가/변경된 레코드만)과 fact_weekly_chart(모든 정렬 키를
+            # 임시 테이블 하나와 MERGE 한 번으로)를 동시에 업로드
+            uploads_success = upload_all_to_bigquery(
+                chart_date, transform_run.sort_keys, transform_run.dim_delta, transform_run.fact_batches
+            )
+        else:
+            logger.info("BigQuery 업로드 모듈이 없습니다. 로컬 테스트 모드로 진행합니다.")
+        
+        for sort_key in transform_run.sort_keys:
+            logger.info(f"✅ 정렬 옵션 '{SORT_OPTIONS[sort_key]}' 수집 완료!")
+        
+        if all_success and uploads_success:
+            _LAST_PAYLOAD_CACHE.put(payload_fingerprint)
+        else:
+            _LAST_PAYLOAD_CACHE.invalidate('일부 정렬 키 처리 실패')
+        logger.info(f"warm 캐시 상태: {get_warm_cache_stats()}")
+        logger.info(f"GCP 클라이언트 생성/재사용: {get_client_stats()}")
+        
         if all_success:
             logger.info("🎉 파이프라인 실행 완료!")
             return {'status': 'success', 'date': str(chart_date)}, 200
@@ -307,6 +450,8 @@ def main(request):
             
     except Exception as e:
         logger.error(f"파이프라인 실행 중 오류 발생: {e}")
+        # 예상하지 못한 오류 후에는 세션/클라이언트/인덱스를 모두 버리고 다음 호출을 새로 시작
+        invalidate_all_warm_caches(f"파이프라인 오류: {e}")
         import traceback
         traceback.print_exc()
         return {'error': str(e)}, 500
@@ -0,0 +1,267 @@
+"""
+GCP 클라이언트 제공 모듈
+
+BigQuery/GCS 클라이언트와 인증 정보, GCS 버킷 핸들을 프로세스(warm 인스턴스)당 한 번만 만들고
+모든 업로드 함수와 업로드 스레드가 공유합니다.
+- 인증 정보: ADC 조회(google.auth.default)와 gcloud 확인을 한 번만 수행하고 BigQuery/GCS가 같이 사용
+- BigQuery Storage Write API 클라이언트는 google-cloud-bigquery-storage가 있을 때만 사용 (src/bigquery_write.py)
+- 클라이언트: WarmCache로 캐시 (TTL/헬스 체크, 오류 시 invalidate_*로 버림)
+- 버킷 핸들: 버킷 이름별로 캐시 (클라이언트가 바뀌면 새로 만듦)
+- get_client_stats(): 종류별 생성/재사용 횟수
+
+여러 스레드가 동시에 요청해도 클라이언트는 한 번만 만들어집니다 (WarmCache 잠금).
+
+사용 예:
+    client = get_bigquery_client()
+    bucket = get_gcs_bucket(GCS_BUCKET_NAME)
+"""
+
+import logging
+import os
+import subprocess
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils import LazyModule
+from src.warm_cache import WarmCache
+
+logger = logging.getLogger(__name__)
+
+# GCP 클라이언트 라이브러리는 실제로 클라이언트를 만들 때 import (Cloud Function 콜드 스타트 단축)
+bigquery = LazyModule('google.cloud.bigquery')
+storage = LazyModule('google.cloud.storage')
+bigquery_storage = LazyModule('google.cloud.bigquery_storage_v1')
+
+
+# GCP 설정 (환경 변수 또는 기본값)
+BIGQUERY_PROJECT_ID = os.getenv('BIGQUERY_PROJECT_ID', 'kakao-webtoon-collector')
+GCS_PROJECT_ID = os.getenv('GCS_PROJECT_ID', 'kakao-webtoon-collector')
+
+# 종류별 생성 횟수 (재사용 횟수는 캐시 적중 수)
+_CREATED: Dict[str, int] = {
+    'gcp_credentials': 0, 'bigquery_client': 0, 'bigquery_write_client': 0, 'gcs_client': 0, 'gcs_bucket': 0,
+}
+_BUCKET_REUSED = [0]
+_COUNTER_LOCK = threading.Lock()
+
+
+def _count_created(kind: str) -> None:
+    with _COUNTER_LOCK:
+        _CREATED[kind] += 1
+
+
+def resolve_credentials() -> Tuple[Optional[Any], Optional[str]]:
+    """
+    GCP 인증 정보를 조회합니다.
+    ADC가 없으면 gcloud 인증을 확인하고, 클라이언트 라이브러리의 기본 인증을 사용하도록 None을 반환합니다.
+
+    Returns:
+        (credentials, project) 튜플 (gcloud 인증 사용 시 (None, None))
+    """
+    from google.auth import default as default_auth
+
+    try:
+        # 먼저 ADC 시도
+        credentials, project = default_auth()
+    except Exception as e:
+        logger.warning(f"ADC 인증 실패, gcloud 인증 사용 시도: {e}")
+        # gcloud 인증 사용
+        try:
+            account_result = subprocess.run(
+                ['gcloud', 'config', 'get-value', 'account'],
+                capture_output=True,
+                text=True,
+                check=True
+            )
+        except Exception as e2:
+            logger.error(f"gcloud 인증도 실패: {e2}")
+            raise Exception("GCP 인증 실패. 'gcloud auth application-default login'을 실행하세요.")
+        logger.info(f"gcloud 계정 사용: {account_result.stdout.strip()}")
+        credentials, project = None, None
+    _count_created('gcp_credentials')
+    return credentials, project
+
+
+# ADC 조회와 gcloud 호출은 프로세스당 한 번 (토큰 갱신은 credentials가 알아서 처리)
+_CREDENTIALS_CACHE = WarmCache('gcp_credentials', resolve_credentials, ttl=3600)
+
+
+def get_credentials() -> Tuple[Optional[Any], Optional[str]]:
+    """
+    캐시된 GCP 인증 정보를 반환합니다
+    (TTL: WARM_CACHE_TTL_GCP_CREDENTIALS_SECONDS, 기본 3600초).
+
+    Returns:
+        (credentials, project) 튜플
+    """
+    return _CREDENTIALS_CACHE.get()
+
+
+def create_bigquery_client() -> 'bigquery.Client':
+    """
+    BigQuery 클라이언트를 생성합니다 (캐시된 인증 정보 사용).
+
+    Returns:
+        BigQuery 클라이언트 객체
+    """
+    credentials, _ = get_credentials()
+    client = bigquery.Client(project=BIGQUERY_PROJECT_ID, credentials=credentials)
+    _count_created('bigquery_client')
+    logger.info(f"BigQuery 클라이언트 생성: {BIGQUERY_PROJECT_ID}")
+    return client
+
+
+def create_bigquery_write_client() -> 'bigquery_storage.BigQueryWriteClient':
+    """
+    BigQuery Storage Write API 클라이언트를 생성합니다 (캐시된 인증 정보 사용).
+
+    Returns:
+        BigQueryWriteClient 객체
+    """
+    credentials, _ = get_credentials()
+    client = bigquery_storage.BigQueryWriteClient(credentials=credentials)
+    _count_created('bigquery_write_client')
+    logger.info("BigQuery Storage Write API 클라이언트 생성")
+    return client
+
+
+def create_gcs_client() -> 'storage.Client':
+    """
+    GCS 클라이언트를 생성합니다 (캐시된 인증 정보 사용).
+
+    Returns:
+        GCS 클라이언트 객체
+    """
+    credentials, _ = get_credentials()
+    client = storage.Client(project=GCS_PROJECT_ID, credentials=credentials)
+    _count_created('gcs_client')
+    logger.info(f"GCS 클라이언트 생성: {GCS_PROJECT_ID}")
+    return client
+
+
+# 클라이언트는 여러 업로드 스레드가 공유하므로 버릴 때 close하지 않음
+_BIGQUERY_CLIENT_CACHE = WarmCache(
+    'bigquery_client',
+    create_bigquery_client,
+    ttl=1800,
+    health_check=lambda client: client.project == BIGQUERY_PROJECT_ID,
+)
+_BIGQUERY_WRITE_CLIENT_CACHE = WarmCache('bigquery_write_client', create_bigquery_write_client, ttl=1800)
+_GCS_CLIENT_CACHE = WarmCache(
+    'gcs_client',
+    create_gcs_client,
+    ttl=1800,
+    health_check=lambda client: client.project == GCS_PROJECT_ID,
+)
+
+# 버킷 이름 → 버킷 핸들 (핸들을 만든 클라이언트가 캐시에서 바뀌면 새로 만듦)
+_BUCKETS: Dict[str, Any] = {}
+_BUCKET_LOCK = threading.Lock()
+
+
+def get_bigquery_client() -> 'bigquery.Client':
+    """
+    BigQuery 클라이언트를 반환합니다.
+    프로세스(warm 인스턴스)당 한 번 만들어 재사용합니다
+    (TTL: WARM_CACHE_TTL_BIGQUERY_CLIENT_SECONDS, 기본 1800초).
+
+    Returns:
+        BigQuery 클라이언트 객체
+    """
+    return _BIGQUERY_CLIENT_CACHE.get()
+
+
+def set_bigquery_client(client: Any) -> None:
+    """
+    BigQuery 클라이언트를 주입합니다 (오프라인 벤치마크/회귀 확인용, 예: scripts/benchmark/local_bigquery.py의 LocalBigQueryClient).
+    이후 get_bigquery_client()는 TTL이 지나거나 invalidate될 때까지 이 클라이언트를 반환합니다.
+
+    Args:
+        client: BigQuery 클라이언트 호환 객체 (project 속성이 BIGQUERY_PROJECT_ID와 같아야 함)
+    """
+    _BIGQUERY_CLIENT_CACHE.put(client)
+
+
+def get_bigquery_write_client() -> 'bigquery_storage.BigQueryWriteClient':
+    """
+    BigQuery Storage Write API 클라이언트를 반환합니다.
+    프로세스(warm 인스턴스)당 한 번 만들어 재사용합니다
+    (TTL: WARM_CACHE_TTL_BIGQUERY_WRITE_CLIENT_SECONDS, 기본 1800초).
+
+    Returns:
+        BigQueryWriteClient 객체
+    """
+    return _BIGQUERY_WRITE_CLIENT_CACHE.get()
+
+
+def get_gcs_client() -> 'storage.Client':
+    """
+    GCS 클라이언트를 반환합니다.
+    프로세스(warm 인스턴스)당 한 번 만들어 재사용합니다
+    (TTL: WARM_CACHE_TTL_GCS_CLIENT_SECONDS, 기본 1800초).
+
+    Returns:
+        GCS 클라이언트 객체
+    """
+    return _GCS_CLIENT_CACHE.get()
+
+
+def get_gcs_bucket(bucket_name: str) -> 'storage.Bucket':
+    """
+    GCS 버킷 핸들을 반환합니다. 같은 클라이언트로 만든 핸들이 있으면 재사용합니다.
+
+    Args:
+        bucket_name: 버킷 이름
+
+    Returns:
+        GCS 버킷 객체
+    """
+    client = get_gcs_client()
+    with _BUCKET_LOCK:
+        bucket = _BUCKETS.get(bucket_name)
+        if bucket is not None and bucket.client is client:
+            _BUCKET_REUSED[0] += 1
+            return bucket
+        bucket = client.bucket(bucket_name)
+        _BUCKETS[bucket_name] = bucket
+    _count_created('gcs_bucket')
+    return bucket
+
+
+def invalidate_bigquery_client(reason: str = '오류') -> None:
+    """캐시된 BigQuery 클라이언트와 인증 정보를 버립니다 (업로드 오류 후 다음 호출에서 새로 인증)."""
+    _BIGQUERY_CLIENT_CACHE.invalidate(reason)
+    _CREDENTIALS_CACHE.invalidate(reason)
+
+
+def invalidate_bigquery_write_client(reason: str = '오류') -> None:
+    """캐시된 BigQuery Storage Write API 클라이언트와 인증 정보를 버립니다."""
+    _BIGQUERY_WRITE_CLIENT_CACHE.invalidate(reason)
+    _CREDENTIALS_CACHE.invalidate(reason)
+
+
+def invalidate_gcs_client(reason: str = '오류') -> None:
+    """캐시된 GCS 클라이언트, 버킷 핸들과 인증 정보를 버립니다 (업로드 오류 후 다음 호출에서 새로 인증)."""
+    _GCS_CLIENT_CACHE.invalidate(reason)
+    _CREDENTIALS_CACHE.invalidate(reason)
+    with _BUCKET_LOCK:
+        _BUCKETS.clear()
+
+
+def get_client_stats() -> Dict[str, Dict[str, int]]:
+    """
+    종류별 생성/재사용 횟수를 반환합니다 (응답/로그용).
+
+    Returns:
+        종류 → {created, reused}
+    """
+    with _COUNTER_LOCK:
+        created = dict(_CREATED)
+    reused = {
+        'gcp_credentials': _CREDENTIALS_CACHE.hits,
+        'bigquery_client': _BIGQUERY_CLIENT_CACHE.hits,
+        'bigquery_write_client': _BIGQUERY_WRITE_CLIENT_CACHE.hits,
+        'gcs_client': _GCS_CLIENT_CACHE.hits,
+        'gcs_bucket': _BUCKET_REUSED[0],
+    }
+    return {kind: {'created': created[kind], 'reused': reused[kind]} for kind in created}
@@ -0,0 +1,222 @@
+"""
+정렬 키 병렬 처리 모듈
+
+정렬 키별 작업(파싱 → 변환 → fact 저장 → fact 업로드)을 워커 풀에서 동시에 실행합니다.
+- 한 정렬 키의 업로드(네트워크 대기)가 다른 정렬 키의 파싱/변환과 겹치므로
+  전체 소요 시간이 가장 느린 정렬 키 하나의 소요 시간에 가까워집니다.
+- dim_webtoon은 정렬 키와 무관한 공유 출력이므로, 모든 정렬 키의 변환이 끝나면
+  단일 writer 스레드에서 한 번만 병합/저장/업로드합니다 (fact 업로드와 동시에 진행).
+- 정렬 키별 단계 소요 시간을 기록하여 로그로 남깁니다.
+
+사용 예:
+    report = run_sort_keys_parallel(
+        transform_run, sort_keys,
+        parse=lambda sort_key: parse_api_response(api_data, sort_key=sort_key),
+        upload_fact=lambda sort_key: upload_fact_weekly_chart(chart_date, sort_key=sort_key),
+        upload_dim=lambda records: upload_dim_webtoon_delta(records),
+    )
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from src.models import WebtoonCard
+from src.transform import TransformRun
+from src.utils import get_pipeline_workers
+
+logger = logging.getLogger(__name__)
+
+
+# 정렬 키별 단계 이름 (로그 출력 순서)
+STAGES = ['parse', 'transform', 'save', 'upload']
+
+
+class SortKeyResult:
+    """정렬 키 하나의 처리 결과와 단계별 소요 시간(초)입니다."""
+
+    __slots__ = ('sort_key', 'success', 'rows', 'timings', 'error')
+
+    def __init__(self, sort_key: str) -> None:
+        self.sort_key = sort_key
+        self.success = False
+        self.rows = 0
+        self.timings: Dict[str, float] = {}
+        self.error: Optional[str] = None
+
+    @property
+    def elapsed(self) -> float:
+        return sum(self.timings.values())
+
+    def to_dict(self) -> Dict:
+        return {
+            'sort_key': self.sort_key,
+            'success': self.success,
+            'rows': self.rows,
+            'timings': {stage: round(seconds, 3) for stage, seconds in self.timings.items()},
+            'elapsed': round(self.elapsed, 3),
+            'error': self.error,
+        }
+
+
+class ParallelRunReport:
+    """병렬 실행 전체 결과입니다."""
+
+    def __init__(self) -> None:
+        self.results: Dict[str, SortKeyResult] = {}
+        self.dim_timings: Dict[str, float] = {}
+        self.dim_success = True
+        self.elapsed = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.dim_success and all(result.success for result in self.results.values())
+
+    @property
+    def saved_sort_keys(self) -> List[str]:
+        """fact_weekly_chart 저장까지 끝난 정렬 키 목록"""
+        return [sort_key for sort_key, result in self.results.items() if 'save' in result.timings]
+
+    def to_dict(self) -> Dict:
+        return {
+            'elapsed': round(self.elapsed, 3),
+            'dim': {stage: round(seconds, 3) for stage, seconds in self.dim_timings.items()},
+            'sort_keys': [result.to_dict() for result in self.results.values()],
+        }
+
+    def log_summary(self) -> None:
+        """정렬 키별 단계 소요 시간을 로그로 남깁니다."""
+        logger.info(f"정렬 키별 소요 시간 (전체 {self.elapsed:.2f}초):")
+        for result in self.results.values():
+            stages = ', '.join(
+                f"{stage} {result.timings[stage]:.2f}s" for stage in STAGES if stage in result.timings
+            )
+            status = '✅' if result.success else f"❌ {result.error}"
+            logger.info(f"  {result.sort_key}: {result.elapsed:.2f}s ({stages}) {status}")
+        if self.dim_timings:
+            stages = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in self.dim_timings.items())
+            logger.info(f"  dim_webtoon: {stages} {'✅' if self.dim_success else '❌'}")
+
+
+def _timed(timings: Dict[str, float], stage: str, func: Callable, *args):
+    start = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+def run_sort_keys_parallel(
+    transform_run: TransformRun,
+    sort_keys: List[str],
+    parse: Callable[[str], List[WebtoonCard]],
+    upload_fact: Optional[Callable[[str], bool]] = None,
+    upload_dim: Optional[Callable[[List[Dict]], bool]] = None,
+    workers: Optional[int] = None,
+    sort_names: Optional[Dict[str, str]] = None
+) -> ParallelRunReport:
+    """
+    정렬 키별 파싱/변환/저장/업로드를 워커 풀에서 병렬로 실행합니다.
+
+    - 각 워커: parse(sort_key) → transform_run.add → transform_run.flush_fact → upload_fact(sort_key)
+    - 단일 writer: 모든 정렬 키의 변환이 끝나면 transform_run.flush_dim → upload_dim(dim_delta)
+
+    한 정렬 키의 실패는 다른 정렬 키 처리에 영향을 주지 않습니다.
+
+    Args:
+        transform_run: 변환 결과를 모을 TransformRun
+        sort_keys: 처리할 정렬 키 리스트
+        parse: 정렬 키를 받아 파싱된 카드 리스트를 반환하는 함수
+        upload_fact: 정렬 키를 받아 fact_weekly_chart를 업로드하는 함수 (None이면 업로드 생략)
+        upload_dim: 변경된 dim_webtoon 레코드를 업로드하는 함수 (None이면 업로드 생략)
+        workers: 워커 수 (None이면 환경 변수 PIPELINE_WORKERS 또는 정렬 키 수)
+        sort_names: 정렬 키 → 표시 이름 (카드의 sort_name 메타데이터용)
+
+    Returns:
+        ParallelRunReport
+    """
+    report = ParallelRunReport()
+    sort_names = sort_names or {}
+    if not sort_keys:
+        return report
+
+    workers = max(1, min(workers or get_pipeline_workers(len(sort_keys)), len(sort_keys)))
+    logger.info(f"정렬 키 병렬 처리 시작: {len(sort_keys)}개 정렬 키, 워커 {workers}개")
+
+    for sort_key in sort_keys:
+        report.results[sort_key] = SortKeyResult(sort_key)
+
+    dim_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='dim-writer')
+    dim_future: List[Future] = []
+    pending = [len(sort_keys)]
+    pending_lock = threading.Lock()
+
+    def dim_stage() -> None:
+        try:
+            if not transform_run.dim_records:
+                logger.warning("저장할 dim_webtoon 레코드가 없습니다.")
+                return
+            delta = _timed(report.dim_timings, 'save', transform_run.flush_dim)
+            logger.info(f"dim_webtoon 저장 완료: {len(transform_run.dim_records)}개 (변경 {len(delta)}개)")
+            if upload_dim is not None:
+                if not _timed(report.dim_timings, 'upload', upload_dim, delta):
+                    logger.warning("⚠️ dim_webtoon 업로드 실패")
+                    report.dim_success = False
+        except Exception as e:
+            logger.error(f"dim_webtoon 처리 실패: {e}")
+            report.dim_success = False
+
+    def transformed() -> None:
+        # 마지막 정렬 키의 변환이 끝나면 dim_webtoon 단계를 단일 writer에 넘김
+        with pending_lock:
+            pending[0] -= 1
+            if pending[0] == 0:
+                dim_future.append(dim_writer.submit(dim_stage))
+
+    def process(sort_key: str) -> None:
+        result = report.results[sort_key]
+        is_transformed = False
+        try:
+            cards = _timed(result.timings, 'parse', parse, sort_key)
+            if not cards:
+                result.error = '파싱된 데이터 없음'
+                return
+            for card in cards:
+                card.set_sort(sort_key, sort_names.get(sort_key))
+
+            added = _timed(result.timings, 'transform', transform_run.add, cards, sort_key)
+            is_transformed = True
+            transformed()
+            if not added:
+                result.error = '변환된 레코드 없음'
+                return
+            result.rows = len(transform_run.fact_records.get(sort_key, []))
+
+            _timed(result.timings, 'save', transform_run.flush_fact, sort_key)
+
+            if upload_fact is not None and not _timed(result.timings, 'upload', upload_fact, sort_key):
+                result.error = '업로드 실패'
+                return
+            result.success = True
+        except Exception as e:
+            logger.error(f"정렬 옵션 '{sort_key}' 처리 중 오류 발생: {e}")
+            result.error = str(e)
+        finally:
+            if not is_transformed:
+                transformed()
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sort-key') as pool:
+            for future in [pool.submit(process, sort_key) for sort_key in sort_keys]:
+                future.result()
+        for future in dim_future:
+            future.result()
+    finally:
+        dim_writer.shutdown(wait=True)
+        report.elapsed = time.perf_counter() - start
+
+    report.log_summary()
+    return report
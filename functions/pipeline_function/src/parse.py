@@ -11,11 +11,13 @@ Parse 모듈: HTML에서 차트 데이터 파싱
 여러 선택자를 시도하여 유연하게 대응합니다.
 """
 
+import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
-from bs4 import BeautifulSoup
+from src.models import WebtoonCard
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +41,7 @@ def load_html_from_file(file_path: Path) -> Optional[str]:
         return None
 
 
-def parse_webtoon_chart_html(html: str) -> List[Dict[str, any]]:
+def parse_webtoon_chart_html(html: str) -> List[WebtoonCard]:
     """
     HTML에서 웹툰 차트 데이터를 파싱합니다.
     
@@ -50,9 +52,11 @@ def parse_webtoon_chart_html(html: str) -> List[Dict[str, any]]:
         html: 파싱할 HTML 문자열
     
     Returns:
-        웹툰 차트 데이터 리스트
-        각 항목은 {'rank': int, 'title': str, 'webtoon_id': str, ...} 형식
+        웹툰 차트 데이터 리스트 (WebtoonCard)
     """
+    # BeautifulSoup/lxml은 HTML 파서 경로에서만 필요 (API 응답 경로에서는 import하지 않음)
+    from bs4 import BeautifulSoup
+    
     soup = BeautifulSoup(html, 'lxml')
     chart_data = []
     
@@ -91,7 +95,7 @@ def parse_webtoon_chart_html(html: str) -> List[Dict[str, any]]:
     return chart_data
 
 
-def extract_webtoon_data(item, rank: int) -> Optional[Dict[str, any]]:
+def extract_webtoon_data(item, rank: int) -> Optional[WebtoonCard]:
     """
     개별 웹툰 항목에서 데이터를 추출합니다.
     
@@ -102,7 +106,7 @@ def extract_webtoon_data(item, rank: int) -> Optional[Dict[str, any]]:
         rank: 순위
     
     Returns:
-        웹툰 데이터 딕셔너리 (실패 시 None)
+        WebtoonCard 객체 (실패 시 None)
     """
     try:
         # 카카오 웹툰 구조에 맞게 수정 필요
@@ -157,23 +161,39 @@ def extract_webtoon_data(item, rank: int) -> Optional[Dict[str, any]]:
         if author_elem:
             author = author_elem.get_text(strip=True)
         
-        data = {
-            'rank': rank,
-            'title': title,
-            'webtoon_id': webtoon_id,
-        }
-        
-        if author:
-            data['author'] = author
-        
-        return data
+        return WebtoonCard(
+            rank=rank,
+            title=title,
+            webtoon_id=webtoon_id,
+            author=author or None,
+        )
         
     except Exception as e:
         logger.error(f"데이터 추출 실패 (순위 {rank}): {e}")
         return None
 
 
-def parse_html_file(file_path: Path) -> List[Dict[str, any]]:
+def extract_api_data_from_html(html: str) -> Optional[dict]:
+    """
+    extract 단계에서 HTML에 포함시킨 API 응답 JSON을 꺼냅니다.
+    
+    Args:
+        html: <script id='webtoon-data'>가 포함된 HTML 문자열
+    
+    Returns:
+        API 응답 딕셔너리 (포함되어 있지 않으면 None)
+    """
+    if 'application/json' not in html or 'webtoon-data' not in html:
+        return None
+    
+    json_match = re.search(r'<script[^>]*id=[\'"]webtoon-data[\'"][^>]*>(.*?)</script>', html, re.DOTALL)
+    if not json_match:
+        return None
+    
+    return json.loads(json_match.group(1))
+
+
+def parse_html_file(file_path: Path) -> List[WebtoonCard]:
     """
     HTML 파일을 읽어서 파싱합니다.
     API 응답이 포함된 경우 API 파서를 사용합니다.
@@ -182,31 +202,26 @@ def parse_html_file(file_path: Path) -> List[Dict[str, any]]:
         file_path: HTML 파일 경로
     
     Returns:
-        웹툰 차트 데이터 리스트
+        웹툰 차트 데이터 리스트 (WebtoonCard)
     """
     html = load_html_from_file(file_path)
     if html is None:
         return []
     
     # API 응답이 포함된 경우
-    if 'application/json' in html and 'webtoon-data' in html:
-        try:
-            import json
-            import re
+    try:
+        api_data = extract_api_data_from_html(html)
+        if api_data is not None:
             from src.parse_api import parse_api_response
             
-            json_match = re.search(r'<script[^>]*id=[\'"]webtoon-data[\'"][^>]*>(.*?)</script>', html, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-                api_data = json.loads(json_str)
-                logger.info("API 응답 데이터 발견, API 파서 사용")
-                
-                # 정렬 키 추출 (메타데이터에서)
-                sort_key = api_data.get('_sort_key')
-                
-                return parse_api_response(api_data, sort_key=sort_key)
-        except Exception as e:
-            logger.warning(f"API 응답 파싱 실패, HTML 파서로 전환: {e}")
+            logger.info("API 응답 데이터 발견, API 파서 사용")
+            
+            # 정렬 키 추출 (메타데이터에서)
+            sort_key = api_data.get('_sort_key')
+            
+            return parse_api_response(api_data, sort_key=sort_key)
+    except Exception as e:
+        logger.warning(f"API 응답 파싱 실패, HTML 파서로 전환: {e}")
     
     return parse_webtoon_chart_html(html)
 
@@ -8,9 +8,103 @@ HTML 파싱과 별도로 관리합니다.
 import logging
 from typing import Dict, List, Optional
 
+from src.models import WebtoonCard
+
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# Projection 스펙 (수집 직후 필요한 필드만 남기기 위한 선언)
+# ============================================================================
+# - True: 값을 그대로 유지
+# - dict: 하위 객체에 스펙을 재귀 적용 (스펙에 없는 키는 제거)
+# - [spec]: 리스트의 각 원소에 spec 적용
+#
+# CARD_PROJECTION은 extract_webtoon_from_api_item과 sort_cards_by_sorting이
+# 실제로 읽는 필드에서 도출한 것입니다. 두 함수에서 새 필드를 읽게 되면
+# 여기에도 추가해야 합니다.
+
+CARD_PROJECTION = {
+    'id': True,
+    'genreFilters': True,
+    'viewCount': True,
+    'view_count': True,
+    'sorting': True,
+    'content': {
+        'id': True,
+        'title': True,
+        'authors': [{'name': True, 'type': True}],
+        'seoKeywords': True,
+        'seoId': True,
+        'adult': True,
+        'catchphraseTwoLines': True,
+        'badges': [{'title': True}],
+        'viewCount': True,
+        'view_count': True,
+    },
+}
+
+API_RESPONSE_PROJECTION = {
+    '_weekday': True,
+    '_placement': True,
+    '_filter_type': True,
+    '_sort_key': True,
+    '_sort_name': True,
+    '_collected_all_weekdays': True,
+    'data': [{
+        '_weekday': True,
+        'cardGroups': [{'cards': [CARD_PROJECTION]}],
+    }],
+}
+
+
+def project_fields(value, spec):
+    """
+    projection 스펙을 적용하여 필요한 필드만 남긴 새 객체를 만듭니다.
+    스펙과 타입이 맞지 않는 값은 그대로 둡니다 (검증은 파서에서 수행).
+    
+    Args:
+        value: 원본 값 (dict, list 또는 스칼라)
+        spec: projection 스펙 (True, dict, [spec])
+    
+    Returns:
+        projection된 값
+    """
+    if spec is True:
+        return value
+    if isinstance(spec, dict):
+        if not isinstance(value, dict):
+            return value
+        return {
+            key: project_fields(value[key], sub_spec)
+            for key, sub_spec in spec.items()
+            if key in value
+        }
+    if isinstance(spec, list):
+        if not isinstance(value, list):
+            return value
+        item_spec = spec[0]
+        return [project_fields(item, item_spec) for item in value]
+    return value
+
+
+def project_api_response(api_data: dict) -> dict:
+    """
+    API 응답에서 파이프라인이 사용하는 필드만 남긴 작은 작업용 payload를 만듭니다.
+    
+    backgroundColor, 이미지 URL, 레이아웃 정보처럼 어떤 단계에서도 읽지 않는 필드를
+    제거하여 정렬 키별 파싱 동안 메모리에 유지되는 데이터를 줄입니다.
+    원본은 수정하지 않으므로 원본 아카이브에는 그대로 사용할 수 있습니다.
+    
+    Args:
+        api_data: API에서 받은 JSON 데이터
+    
+    Returns:
+        projection된 API 응답 (parse_api_response에 그대로 전달 가능)
+    """
+    return project_fields(api_data, API_RESPONSE_PROJECTION)
+
+
 def sort_cards_by_sorting(cards: List[Dict[str, any]], sort_key: str) -> List[Dict[str, any]]:
     """
     카드 리스트를 sorting 정보를 사용하여 정렬합니다.
@@ -48,7 +142,7 @@ def sort_cards_by_sorting(cards: List[Dict[str, any]], sort_key: str) -> List[Di
     return sorted_cards
 
 
-def parse_api_response(api_data: dict, sort_key: Optional[str] = None) -> List[Dict[str, any]]:
+def parse_api_response(api_data: dict, sort_key: Optional[str] = None) -> List[WebtoonCard]:
     """
     카카오 웹툰 API JSON 응답을 파싱하여 웹툰 차트 데이터 리스트로 변환합니다.
     
@@ -87,8 +181,7 @@ def parse_api_response(api_data: dict, sort_key: Optional[str] = None) -> List[D
         sort_key: 정렬 키 (None이면 원본 순서 유지)
     
     Returns:
-        웹툰 차트 데이터 리스트
-        각 항목은 {'rank': int, 'title': str, 'webtoon_id': str, ...} 형식
+        웹툰 차트 데이터 리스트 (WebtoonCard)
     """
     chart_data = []
     
@@ -146,10 +239,9 @@ def parse_api_response(api_data: dict, sort_key: Optional[str] = None) -> List[D
                     cards = sort_cards_by_sorting(cards, sort_key)
                     logger.info(f"요일 {weekday}: 카드를 {sort_key} 기준으로 정렬: {len(cards)}개")
                 
-                # 각 카드에 요일 정보 추가
+                # 요일 그룹에 카드 추가 (요일 정보는 그룹 키로 전달, 입력 데이터는 수정하지 않음)
                 for card in cards:
                     if isinstance(card, dict):
-                        card['_weekday'] = weekday
                         weekday_groups[weekday].append(card)
         
         # 각 요일별로 순위를 매기고 데이터 추출
@@ -165,7 +257,8 @@ def parse_api_response(api_data: dict, sort_key: Optional[str] = None) -> List[D
                         card, 
                         rank=global_rank,  # 전체 순위 (통합 순위)
                         weekday=weekday,   # 요일 정보
-                        weekday_rank=idx   # 요일별 순위 (각 요일 내에서 1, 2, 3, ...)
+                        weekday_rank=idx,  # 요일별 순위 (각 요일 내에서 1, 2, 3, ...)
+                        sort_key=sort_key
                     )
                     if webtoon_data:
                         chart_data.append(webtoon_data)
@@ -184,7 +277,7 @@ def parse_api_response(api_data: dict, sort_key: Optional[str] = None) -> List[D
         return []
 
 
-def extract_webtoon_from_api_item(card: dict, rank: int, weekday: Optional[str] = None, weekday_rank: Optional[int] = None) -> Optional[Dict[str, any]]:
+def extract_webtoon_from_api_item(card: dict, rank: int, weekday: Optional[str] = None, weekday_rank: Optional[int] = None, sort_key: Optional[str] = None) -> Optional[WebtoonCard]:
     """
     API 응답의 개별 카드(card) 항목에서 웹툰 데이터를 추출합니다.
     
@@ -203,9 +296,10 @@ def extract_webtoon_from_api_item(card: dict, rank: int, weekday: Optional[str]
         rank: 전체 순위 (통합 순위)
         weekday: 요일 정보 ('mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun')
         weekday_rank: 요일별 순위 (각 요일 내에서 1, 2, 3, ...)
+        sort_key: 정렬 키 (선택)
     
     Returns:
-        웹툰 데이터 딕셔너리 (실패 시 None)
+        WebtoonCard 객체 (실패 시 None)
     """
     try:
         # 카드의 id가 웹툰 ID
@@ -293,49 +387,24 @@ def extract_webtoon_from_api_item(card: dict, rank: int, weekday: Optional[str]
                 except (ValueError, TypeError):
                     view_count = None
         
-        # 기본 데이터 구성
-        data = {
-            'rank': rank,
-            'title': title,
-            'webtoon_id': webtoon_id,
-        }
-        
-        # 선택적 필드 추가
-        if author:
-            data['author'] = author
-        
-        if genre:
-            data['genre'] = genre
-        
-        if tags:
-            data['tags'] = tags
-        
-        if seo_id:
-            data['seo_id'] = seo_id
-        
-        if adult is not None:
-            data['adult'] = adult
-        
-        if catchphrase:
-            data['catchphrase'] = catchphrase
-        
-        if badges:
-            data['badges'] = badges
-        
-        if content_id is not None:
-            data['content_id'] = content_id
-        
-        if view_count is not None:
-            data['view_count'] = view_count
-        
-        if weekday:
-            data['weekday'] = weekday
-        
-        # 요일별 순위 추가
-        if weekday_rank is not None:
-            data['weekday_rank'] = weekday_rank
-        
-        return data
+        # 카드 레코드 구성 (값이 없는 선택 필드는 None)
+        return WebtoonCard(
+            rank=rank,
+            title=title,
+            webtoon_id=webtoon_id,
+            author=author or None,
+            genre=genre or None,
+            tags=tags,
+            seo_id=seo_id or None,
+            adult=adult,
+            catchphrase=catchphrase or None,
+            badges=badges,
+            content_id=content_id,
+            view_count=view_count,
+            weekday=weekday or None,
+            weekday_rank=weekday_rank,
+            sort_key=sort_key,
+        )
         
     except Exception as e:
         logger.error(f"데이터 추출 실패 (순위 {rank}): {e}")
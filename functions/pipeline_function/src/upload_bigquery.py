@@ -2,67 +2,61 @@
 BigQuery 업로드 모듈
 
 JSONL 파일을 BigQuery에 적재하는 기능을 제공합니다.
-- dim_webtoon 업로드 (MERGE로 멱등성 보장)
-- fact_weekly_chart 업로드 (MERGE로 멱등성 보장)
+- dim_webtoon 업로드 (MERGE로 멱등성 보장, fingerprint manifest로 바뀐 레코드만)
+- fact_weekly_chart 업로드 (MERGE로 멱등성 보장, 여러 정렬 키는 upload_fact_weekly_charts로 한 번에,
+  BIGQUERY_FACT_INGESTION_MODE=committed/pending이면 Storage Write API: src/bigquery_write.py)
+- upload_to_bigquery: dim_webtoon/fact_weekly_chart 적재를 동시에 실행하고 MERGE는 적재가 끝난 테이블부터
+  (src/bigquery_jobs.py 작업 그래프, 작업별 소요 시간 기록)
+
+테이블마다 NDJSON 하나를 load job 한 번(load_table_from_file)으로 임시 테이블에 적재합니다.
+스키마에 이미 맞는 파일은 레코드 정규화 없이 그대로 업로드합니다.
+TransformRun(keep_batches=True)이 넘긴 fact_weekly_chart Arrow 배치는 파일을 다시 읽지 않고
+Parquet으로 직렬화해 적재합니다.
+임시 테이블은 업로드마다 고유한 이름으로 만들고 자동 만료 시간을 설정합니다.
 """
 
 import json
 import logging
 import os
-from datetime import date, datetime
+import shutil
+import time
+import uuid
+from contextlib import ExitStack
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
-
-from google.cloud import bigquery
-from google.cloud.exceptions import NotFound
-from google.auth import default as default_auth
-import subprocess
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from src.bigquery_jobs import BigQueryJobGraph
+from src.clients import get_bigquery_client, invalidate_bigquery_client
+from src.dim_store import DimWebtoonStore
+from src.models import DIM_WEBTOON_FINGERPRINT_FIELDS, compute_dim_webtoon_fingerprint
 from src.utils import (
-    get_dim_webtoon_jsonl_path,
+    LazyModule,
+    atomic_write,
+    file_lock,
+    get_data_format,
+    is_module_available,
+    get_dim_webtoon_bigquery_manifest_path,
     get_chart_jsonl_path,
+    serialize_datetime_for_json,
     setup_logging,
 )
 
 logger = logging.getLogger(__name__)
 
+# google-cloud-bigquery(및 함께 로드되는 pandas/pyarrow)는 실제 업로드 시점에 import
+# (Cloud Function 콜드 스타트 단축)
+bigquery = LazyModule('google.cloud.bigquery')
+pa = LazyModule('pyarrow')
+pq = LazyModule('pyarrow.parquet')
+
 
 # BigQuery 설정 (환경 변수 또는 기본값)
 BIGQUERY_PROJECT_ID = os.getenv('BIGQUERY_PROJECT_ID', 'kakao-webtoon-collector')
 BIGQUERY_DATASET_ID = os.getenv('BIGQUERY_DATASET_ID', 'kakao_webtoon')
 
 
-def get_bigquery_client() -> bigquery.Client:
-    """
-    BigQuery 클라이언트를 생성합니다.
-    ADC가 없으면 gcloud 인증을 사용합니다.
-    
-    Returns:
-        BigQuery 클라이언트 객체
-    """
-    try:
-        # 먼저 ADC 시도
-        credentials, project = default_auth()
-        return bigquery.Client(project=BIGQUERY_PROJECT_ID, credentials=credentials)
-    except Exception as e:
-        logger.warning(f"ADC 인증 실패, gcloud 인증 사용 시도: {e}")
-        # gcloud 인증 사용
-        try:
-            account_result = subprocess.run(
-                ['gcloud', 'config', 'get-value', 'account'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            account = account_result.stdout.strip()
-            logger.info(f"gcloud 계정 사용: {account}")
-            
-            return bigquery.Client(project=BIGQUERY_PROJECT_ID)
-        except Exception as e2:
-            logger.error(f"gcloud 인증도 실패: {e2}")
-            raise Exception("BigQuery 인증 실패. 'gcloud auth application-default login'을 실행하세요.")
-
-
 def load_jsonl_file(file_path: Path) -> List[Dict]:
     """
     JSONL 파일을 읽어서 레코드 리스트로 반환합니다.
@@ -96,121 +90,762 @@ def load_jsonl_file(file_path: Path) -> List[Dict]:
     return records
 
 
-def upload_dim_webtoon(jsonl_path: Optional[Path] = None, dry_run: bool = False) -> bool:
+# BigQuery 테이블 스키마 (컬럼명, 타입, 모드)
+DIM_WEBTOON_BQ_FIELDS = [
+    ('webtoon_id', 'STRING', 'REQUIRED'),
+    ('title', 'STRING', 'REQUIRED'),
+    ('author', 'STRING', 'NULLABLE'),
+    ('genre', 'STRING', 'NULLABLE'),
+    ('tags', 'STRING', 'REPEATED'),
+    ('seo_id', 'STRING', 'NULLABLE'),
+    ('adult', 'BOOLEAN', 'NULLABLE'),
+    ('catchphrase', 'STRING', 'NULLABLE'),
+    ('badges', 'STRING', 'REPEATED'),
+    ('content_id', 'INTEGER', 'NULLABLE'),
+    ('created_at', 'TIMESTAMP', 'REQUIRED'),
+    ('updated_at', 'TIMESTAMP', 'REQUIRED'),
+]
+
+FACT_WEEKLY_CHART_BQ_FIELDS = [
+    ('chart_date', 'DATE', 'REQUIRED'),
+    ('webtoon_id', 'STRING', 'REQUIRED'),
+    ('rank', 'INTEGER', 'REQUIRED'),
+    ('collected_at', 'TIMESTAMP', 'REQUIRED'),
+    ('weekday', 'STRING', 'NULLABLE'),
+    ('weekday_rank', 'INTEGER', 'NULLABLE'),  # 요일별 순위
+    ('year', 'INTEGER', 'REQUIRED'),
+    ('month', 'INTEGER', 'REQUIRED'),
+    ('week', 'INTEGER', 'REQUIRED'),
+    ('view_count', 'INTEGER', 'NULLABLE'),
+]
+
+# sort_key가 있는 fact_weekly_chart 파일에만 추가되는 컬럼
+FACT_SORT_KEY_BQ_FIELD = ('sort_key', 'STRING', 'NULLABLE')
+
+# BigQuery 테이블에는 없는 로컬 전용 컬럼 (load job에서 무시)
+LOCAL_ONLY_COLUMNS = {'fingerprint'}
+
+# 업로드할 NDJSON을 메모리에 두는 최대 크기 (넘으면 임시 파일로 옮겨짐)
+NDJSON_SPOOL_MAX_BYTES = 64 * 1024 * 1024
+
+# 임시 테이블 자동 만료 시간 (업로드 도중 중단되어 삭제하지 못해도 남지 않도록)
+STAGING_TABLE_EXPIRATION = timedelta(hours=1)
+
+# fact_weekly_chart MERGE가 chart_date 하나당 처리해도 되는 최대 바이트 수 (dry run으로 확인)
+# 환경 변수 BIGQUERY_MERGE_MAX_BYTES_PER_DAY로 변경 가능 (0이면 dry run 생략)
+DEFAULT_MERGE_MAX_BYTES_PER_DAY = 100 * 1024 * 1024
+
+
+def build_schema(fields: List[Tuple[str, str, str]]) -> List['bigquery.SchemaField']:
+    """(컬럼명, 타입, 모드) 목록으로 BigQuery 스키마를 만듭니다."""
+    return [bigquery.SchemaField(name, field_type, mode=mode) for name, field_type, mode in fields]
+
+
+def value_conforms(value, field_type: str, mode: str) -> bool:
     """
-    dim_webtoon JSONL 파일을 BigQuery에 업로드합니다.
+    값을 정규화 없이 BigQuery JSON load에 그대로 넣을 수 있는지 확인합니다.
     
     Args:
-        jsonl_path: JSONL 파일 경로 (None이면 기본 경로 사용)
-        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        value: JSON에서 읽은 값
+        field_type: BigQuery 타입 (STRING, INTEGER, BOOLEAN, DATE, TIMESTAMP)
+        mode: BigQuery 모드 (REQUIRED, NULLABLE, REPEATED)
     
     Returns:
-        성공 여부
+        그대로 사용할 수 있으면 True
     """
-    if jsonl_path is None:
-        jsonl_path = get_dim_webtoon_jsonl_path()
+    if mode == 'REPEATED':
+        return value is None or (isinstance(value, list) and all(isinstance(item, str) for item in value))
+    if value is None:
+        return mode != 'REQUIRED'
+    if field_type in ('STRING', 'DATE', 'TIMESTAMP'):
+        return isinstance(value, str)
+    if field_type == 'INTEGER':
+        return isinstance(value, int) and not isinstance(value, bool)
+    if field_type == 'BOOLEAN':
+        return isinstance(value, bool)
+    return False
+
+
+def record_conforms(record: Dict, fields: List[Tuple[str, str, str]]) -> bool:
+    """
+    레코드가 스키마에 이미 맞는지 확인합니다 (스키마 밖 컬럼은 로컬 전용 컬럼만 허용).
     
-    records = load_jsonl_file(jsonl_path)
-    if len(records) == 0:
-        logger.warning("업로드할 레코드가 없습니다.")
-        return True
+    Args:
+        record: 레코드
+        fields: (컬럼명, 타입, 모드) 목록
     
-    if dry_run:
-        logger.info(f"[DRY RUN] dim_webtoon 업로드 예정: {len(records)}개 레코드")
-        return True
+    Returns:
+        정규화가 필요 없으면 True
+    """
+    for name, field_type, mode in fields:
+        if not value_conforms(record.get(name), field_type, mode):
+            return False
+    return len(record) <= len(fields) or all(
+        key in LOCAL_ONLY_COLUMNS for key in record.keys() - {name for name, _, _ in fields}
+    )
+
+
+def normalize_dim_webtoon_record(record: Dict) -> Dict:
+    """
+    dim_webtoon 레코드를 BigQuery 스키마에 맞게 변환합니다 (스키마 컬럼만 남김).
+    
+    Args:
+        record: dim_webtoon 레코드
     
+    Returns:
+        정규화된 레코드
+    """
+    record = dict(record)
+    # webtoon_id를 문자열로 보장
+    if 'webtoon_id' in record:
+        record['webtoon_id'] = str(record['webtoon_id'])
+    
+    # tags를 ARRAY로 변환 (이미 리스트면 그대로 사용)
+    if 'tags' in record and record['tags']:
+        if isinstance(record['tags'], str):
+            # 파이프로 구분된 문자열을 리스트로 변환
+            record['tags'] = [t.strip() for t in record['tags'].split('|') if t.strip()]
+        elif not isinstance(record['tags'], list):
+            record['tags'] = []
+    else:
+        record['tags'] = None
+    
+    # badges를 ARRAY로 변환 (이미 리스트면 그대로 사용)
+    if 'badges' in record and record['badges']:
+        if isinstance(record['badges'], str):
+            # 파이프로 구분된 문자열을 리스트로 변환
+            record['badges'] = [b.strip() for b in record['badges'].split('|') if b.strip()]
+        elif not isinstance(record['badges'], list):
+            record['badges'] = []
+    else:
+        record['badges'] = None
+    
+    # content_id를 정수로 변환
+    if 'content_id' in record and record['content_id'] is not None:
+        try:
+            record['content_id'] = int(record['content_id'])
+        except (ValueError, TypeError):
+            record['content_id'] = None
+    
+    # adult를 boolean으로 변환
+    if 'adult' in record and record['adult'] is not None:
+        record['adult'] = bool(record['adult'])
+    
+    # datetime 객체를 ISO 형식 문자열로 변환
+    if 'created_at' in record and record['created_at']:
+        if isinstance(record['created_at'], datetime):
+            record['created_at'] = record['created_at'].isoformat()
+    if 'updated_at' in record and record['updated_at']:
+        if isinstance(record['updated_at'], datetime):
+            record['updated_at'] = record['updated_at'].isoformat()
+    
+    return {name: record.get(name) for name, _, _ in DIM_WEBTOON_BQ_FIELDS}
+
+
+def normalize_fact_weekly_chart_record(record: Dict) -> Dict:
+    """
+    fact_weekly_chart 레코드를 BigQuery 스키마에 맞게 변환합니다 (스키마 컬럼만 남김).
+    
+    Args:
+        record: fact_weekly_chart 레코드
+    
+    Returns:
+        정규화된 레코드
+    """
+    record = dict(record)
+    # webtoon_id를 문자열로 보장
+    if 'webtoon_id' in record:
+        record['webtoon_id'] = str(record['webtoon_id'])
+    
+    # datetime 객체를 문자열로 변환
+    if 'chart_date' in record and record['chart_date']:
+        if isinstance(record['chart_date'], datetime):
+            record['chart_date'] = record['chart_date'].date().isoformat()
+        elif isinstance(record['chart_date'], date):
+            record['chart_date'] = record['chart_date'].isoformat()
+    if 'collected_at' in record and record['collected_at']:
+        if isinstance(record['collected_at'], datetime):
+            record['collected_at'] = record['collected_at'].isoformat()
+    
+    # view_count를 정수로 변환
+    if 'view_count' in record and record['view_count'] is not None:
+        try:
+            if isinstance(record['view_count'], str):
+                record['view_count'] = int(record['view_count']) if record['view_count'].strip() else None
+            elif isinstance(record['view_count'], (int, float)):
+                record['view_count'] = int(record['view_count'])
+        except (ValueError, TypeError):
+            record['view_count'] = None
+    
+    # rank를 정수로 보장
+    if 'rank' in record and record['rank'] is not None:
+        try:
+            if isinstance(record['rank'], str):
+                record['rank'] = int(record['rank'])
+            elif isinstance(record['rank'], (int, float)):
+                record['rank'] = int(record['rank'])
+        except (ValueError, TypeError):
+            logger.warning(f"rank 변환 실패: {record.get('rank')}")
+    
+    # year, month, week를 정수로 보장
+    for field in ['year', 'month', 'week']:
+        if field in record and record[field] is not None:
+            try:
+                if isinstance(record[field], str):
+                    record[field] = int(record[field])
+                elif isinstance(record[field], (int, float)):
+                    record[field] = int(record[field])
+            except (ValueError, TypeError):
+                logger.warning(f"{field} 변환 실패: {record.get(field)}")
+    
+    fields = FACT_WEEKLY_CHART_BQ_FIELDS + ([FACT_SORT_KEY_BQ_FIELD] if 'sort_key' in record else [])
+    return {name: record.get(name) for name, _, _ in fields}
+
+
+def iter_jsonl_records(file_path: Path) -> Iterator[Dict]:
+    """
+    JSONL 파일의 레코드를 한 줄씩 읽어 반환합니다 (파싱할 수 없는 라인은 건너뜀).
+    
+    Args:
+        file_path: JSONL 파일 경로
+    
+    Yields:
+        레코드
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.error(f"JSON 파싱 오류 (라인 {line_num}): {e}")
+
+
+def read_first_jsonl_record(file_path: Path) -> Optional[Dict]:
+    """
+    JSONL 파일의 첫 번째 레코드를 반환합니다.
+    
+    Args:
+        file_path: JSONL 파일 경로
+    
+    Returns:
+        첫 번째 레코드 (파일이 없거나 비어 있으면 None)
+    """
+    if not file_path.exists():
+        return None
+    records = iter_jsonl_records(file_path)
     try:
-        client = get_bigquery_client()
-        table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.dim_webtoon"
-        
-        # 데이터 변환 및 정규화
-        for record in records:
-            # webtoon_id를 문자열로 보장
-            if 'webtoon_id' in record:
-                record['webtoon_id'] = str(record['webtoon_id'])
-            
-            # tags를 ARRAY로 변환 (이미 리스트면 그대로 사용)
-            if 'tags' in record and record['tags']:
-                if isinstance(record['tags'], str):
-                    # 파이프로 구분된 문자열을 리스트로 변환
-                    record['tags'] = [t.strip() for t in record['tags'].split('|') if t.strip()]
-                elif not isinstance(record['tags'], list):
-                    record['tags'] = []
-            else:
-                record['tags'] = None
-            
-            # badges를 ARRAY로 변환 (이미 리스트면 그대로 사용)
-            if 'badges' in record and record['badges']:
-                if isinstance(record['badges'], str):
-                    # 파이프로 구분된 문자열을 리스트로 변환
-                    record['badges'] = [b.strip() for b in record['badges'].split('|') if b.strip()]
-                elif not isinstance(record['badges'], list):
-                    record['badges'] = []
-            else:
-                record['badges'] = None
-            
-            # content_id를 정수로 변환
-            if 'content_id' in record and record['content_id'] is not None:
+        return next(records, None)
+    finally:
+        records.close()
+
+
+def inspect_jsonl_file(
+    file_path: Path,
+    fields: List[Tuple[str, str, str]],
+    values: Optional[Dict[str, Set]] = None
+) -> Tuple[int, bool]:
+    """
+    JSONL 파일을 그대로 load job에 넘길 수 있는지 확인합니다.
+    모든 라인이 파싱되고 스키마에 맞으면 정규화/재직렬화 없이 파일을 그대로 업로드할 수 있습니다.
+    
+    Args:
+        file_path: JSONL 파일 경로
+        fields: (컬럼명, 타입, 모드) 목록
+        values: 컬럼명 → 값 집합 (지정하면 해당 컬럼의 고유 값을 모음, 예: MERGE 파티션 필터용 chart_date)
+    
+    Returns:
+        (레코드 수, 스키마 일치 여부), 파일이 없으면 (0, True)
+    """
+    if not file_path.exists():
+        logger.warning(f"파일이 존재하지 않습니다: {file_path}")
+        return 0, True
+    
+    rows = 0
+    conforms = True
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if not line.strip():
+                # 빈 줄은 load job이 거부할 수 있으므로 다시 씀
+                conforms = False
+                continue
+            if conforms or values:
                 try:
-                    record['content_id'] = int(record['content_id'])
-                except (ValueError, TypeError):
-                    record['content_id'] = None
-            
-            # adult를 boolean으로 변환
-            if 'adult' in record and record['adult'] is not None:
-                record['adult'] = bool(record['adult'])
-            
-            # datetime 객체를 ISO 형식 문자열로 변환
-            if 'created_at' in record and record['created_at']:
-                if isinstance(record['created_at'], datetime):
-                    record['created_at'] = record['created_at'].isoformat()
-            if 'updated_at' in record and record['updated_at']:
-                if isinstance(record['updated_at'], datetime):
-                    record['updated_at'] = record['updated_at'].isoformat()
-        
-        # 임시 테이블에 먼저 업로드
-        temp_table_id = f"{table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        # 스키마 정의 (tags와 badges를 REPEATED STRING으로 명시)
-        schema = [
-            bigquery.SchemaField("webtoon_id", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("title", "STRING", mode="REQUIRED"),
-            bigquery.SchemaField("author", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("genre", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("tags", "STRING", mode="REPEATED"),
-            bigquery.SchemaField("seo_id", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("adult", "BOOLEAN", mode="NULLABLE"),
-            bigquery.SchemaField("catchphrase", "STRING", mode="NULLABLE"),
-            bigquery.SchemaField("badges", "STRING", mode="REPEATED"),
-            bigquery.SchemaField("content_id", "INTEGER", mode="NULLABLE"),
-            bigquery.SchemaField("created_at", "TIMESTAMP", mode="REQUIRED"),
-            bigquery.SchemaField("updated_at", "TIMESTAMP", mode="REQUIRED"),
-        ]
-        
-        # 배치로 업로드 (한 번에 최대 1000개씩)
-        batch_size = 1000
-        total_uploaded = 0
-        
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            
-            job = client.load_table_from_json(
-                batch,
-                temp_table_id,
-                job_config=bigquery.LoadJobConfig(
-                    schema=schema,
-                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND if i > 0 else bigquery.WriteDisposition.WRITE_TRUNCATE,
-                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-                    ignore_unknown_values=False,
-                )
-            )
-            
-            job.result()  # 작업 완료 대기
-            total_uploaded += len(batch)
-            logger.info(f"dim_webtoon 임시 테이블 업로드 진행: {total_uploaded}/{len(records)}")
-        
-        # MERGE 문으로 중복 제거 및 업데이트
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # 파싱할 수 없는 라인은 다시 쓸 때 건너뜀
+                    conforms = False
+                    continue
+                if conforms:
+                    conforms = record_conforms(record, fields)
+                if values:
+                    for name, seen in values.items():
+                        seen.add(record.get(name))
+            rows += 1
+    return rows, conforms
+
+
+def write_ndjson(
+    records: Iterable[Dict],
+    f: IO[bytes],
+    fields: List[Tuple[str, str, str]],
+    normalize: Callable[[Dict], Dict]
+) -> Tuple[int, int]:
+    """
+    레코드를 NDJSON으로 씁니다. 스키마에 맞지 않는 레코드만 정규화합니다.
+    
+    Args:
+        records: 레코드 iterable
+        f: 바이너리 파일 객체
+        fields: (컬럼명, 타입, 모드) 목록
+        normalize: 레코드 정규화 함수
+    
+    Returns:
+        (기록한 레코드 수, 정규화한 레코드 수)
+    """
+    rows = 0
+    normalized = 0
+    for record in records:
+        if not record_conforms(record, fields):
+            record = normalize(record)
+            normalized += 1
+        f.write((json.dumps(record, ensure_ascii=False, default=serialize_datetime_for_json) + '\n').encode('utf-8'))
+        rows += 1
+    return rows, normalized
+
+
+def create_staging_table(
+    client: 'bigquery.Client',
+    table_id: str,
+    fields: List[Tuple[str, str, str]]
+) -> str:
+    """
+    고유한 이름의 임시 테이블을 자동 만료 시간과 함께 생성합니다.
+    같은 초에 시작한 업로드끼리도 이름이 겹치지 않도록 임의 접미사를 붙입니다.
+    
+    Args:
+        client: BigQuery 클라이언트
+        table_id: 대상 테이블 ID (임시 테이블 이름의 접두사)
+        fields: (컬럼명, 타입, 모드) 목록
+    
+    Returns:
+        임시 테이블 ID (예: project.dataset.fact_weekly_chart_temp_20260101120000_1a2b3c4d)
+    """
+    staging_table_id = f"{table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:8]}"
+    table = bigquery.Table(staging_table_id, schema=build_schema(fields))
+    table.expires = datetime.now(timezone.utc) + STAGING_TABLE_EXPIRATION
+    client.create_table(table)
+    return staging_table_id
+
+
+def load_ndjson_to_table(
+    client: 'bigquery.Client',
+    source: IO[bytes],
+    table_id: str,
+    fields: List[Tuple[str, str, str]]
+) -> float:
+    """
+    NDJSON 파일 객체를 load job 하나로 테이블에 적재합니다 (create_staging_table로 만든 빈 테이블에 추가).
+    
+    Args:
+        client: BigQuery 클라이언트
+        source: NDJSON 바이너리 파일 객체 (처음부터 읽음)
+        table_id: 대상 테이블 ID
+        fields: (컬럼명, 타입, 모드) 목록
+    
+    Returns:
+        load job 소요 시간 (초)
+    """
+    start = time.perf_counter()
+    job = client.load_table_from_file(
+        source,
+        table_id,
+        rewind=True,
+        job_config=bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON,
+            schema=build_schema(fields),
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            create_disposition=bigquery.CreateDisposition.CREATE_NEVER,
+            # 스키마 밖 컬럼은 로컬 전용 컬럼(fingerprint)뿐 (그 밖의 컬럼은 정규화에서 제거됨)
+            ignore_unknown_values=True,
+        )
+    )
+    job.result()  # 작업 완료 대기
+    return time.perf_counter() - start
+
+
+class StagedMerge:
+    """임시 테이블 적재를 마치고 MERGE를 기다리는 업로드입니다 (stage_* 함수가 만들고 merge_staged가 반영)."""
+
+    __slots__ = ('table', 'staging_table_id', 'merge_query', 'rows', 'load_elapsed', 'days', 'on_merged', 'summary')
+
+    def __init__(
+        self,
+        table: str,
+        staging_table_id: str,
+        merge_query: str,
+        rows: int,
+        load_elapsed: float,
+        days: int = 0,
+        on_merged: Optional[Callable[[], None]] = None,
+        summary: str = ''
+    ) -> None:
+        self.table = table
+        self.staging_table_id = staging_table_id
+        self.merge_query = merge_query
+        self.rows = rows
+        self.load_elapsed = load_elapsed
+        # MERGE 대상 chart_date 수 (0보다 크면 dry run으로 처리 바이트 확인)
+        self.days = days
+        self.on_merged = on_merged
+        self.summary = summary
+
+
+def merge_staged(staged: Optional[StagedMerge]) -> float:
+    """
+    적재된 임시 테이블을 MERGE로 대상 테이블에 반영하고 임시 테이블을 삭제합니다.
+    
+    Args:
+        staged: stage_* 함수의 반환값 (None이면 아무것도 하지 않음)
+    
+    Returns:
+        MERGE 소요 시간 (초)
+    """
+    if staged is None:
+        return 0.0
+    client = get_bigquery_client()
+    if staged.days:
+        check_merge_bytes(client, staged.merge_query, staged.days)
+    
+    merge_start = time.perf_counter()
+    client.query(staged.merge_query).result()
+    merge_elapsed = time.perf_counter() - merge_start
+    client.delete_table(staged.staging_table_id, not_found_ok=True)
+    if staged.on_merged is not None:
+        staged.on_merged()
+    
+    logger.info(
+        f"✅ {staged.table} 업로드 완료: {staged.rows}개 레코드{staged.summary} "
+        f"(load {staged.load_elapsed:.2f}초, MERGE {merge_elapsed:.2f}초)"
+    )
+    return merge_elapsed
+
+
+def load_parquet_to_table(client: 'bigquery.Client', source: IO[bytes], table_id: str) -> float:
+    """
+    Parquet 파일 객체를 load job 하나로 테이블에 적재합니다 (컬럼은 이름으로 대응).
+    
+    Args:
+        client: BigQuery 클라이언트
+        source: Parquet 바이너리 파일 객체 (처음부터 읽음)
+        table_id: 대상 테이블 ID (create_staging_table로 만든 빈 테이블)
+    
+    Returns:
+        load job 소요 시간 (초)
+    """
+    start = time.perf_counter()
+    job = client.load_table_from_file(
+        source,
+        table_id,
+        rewind=True,
+        job_config=bigquery.LoadJobConfig(
+            source_format=bigquery.SourceFormat.PARQUET,
+            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+            create_disposition=bigquery.CreateDisposition.CREATE_NEVER,
+        )
+    )
+    job.result()  # 작업 완료 대기
+    return time.perf_counter() - start
+
+
+def sql_string_literal(value: str) -> str:
+    """문자열을 BigQuery 표준 SQL 문자열 리터럴로 변환합니다."""
+    return "'" + value.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def build_fact_weekly_chart_target_filter(
+    chart_dates: Optional[Iterable[str]] = None,
+    sort_keys: Optional[Iterable[Optional[str]]] = None
+) -> str:
+    """
+    MERGE 대상(target) 테이블을 임시 테이블에 있는 chart_date/sort_key로 제한하는 상수 조건을 만듭니다.
+    
+    fact_weekly_chart는 chart_date로 파티션, sort_key로 클러스터링되어 있으므로
+    ON 절의 상수 조건으로 읽을 파티션/블록을 줄입니다 (조인 조건만으로는 전체 테이블을 읽음).
+    임시 테이블의 모든 행이 이 조건을 만족하므로 MERGE 결과는 바뀌지 않습니다.
+    
+    Args:
+        chart_dates: 임시 테이블의 chart_date 값 (ISO 형식 문자열)
+        sort_keys: 임시 테이블의 sort_key 값 (None 포함 가능)
+    
+    Returns:
+        "AND ..." 형태의 조건 문자열 (값이 없으면 빈 문자열)
+    """
+    conditions = []
+    if chart_dates and any(chart_dates):
+        # 리터럴로 넣기 전에 날짜 형식 검증
+        dates = sorted({date.fromisoformat(str(value)[:10]).isoformat() for value in chart_dates if value})
+        conditions.append(f"AND target.chart_date IN ({', '.join(f'DATE {sql_string_literal(d)}' for d in dates)})")
+    if sort_keys:
+        # 조인 조건이 COALESCE(sort_key, '')이므로 NULL과 ''는 같은 값으로 취급
+        sort_keys = set(sort_keys)
+        nullable = None in sort_keys or '' in sort_keys
+        keys = sorted({key for key in sort_keys if key is not None} | ({''} if nullable else set()))
+        condition = f"target.sort_key IN ({', '.join(sql_string_literal(key) for key in keys)})"
+        if nullable:
+            condition = f"({condition} OR target.sort_key IS NULL)"
+        conditions.append(f"AND {condition}")
+    return '\n            '.join(conditions)
+
+
+def build_fact_weekly_chart_merge_query(
+    table_id: str,
+    staging_table_id: str,
+    has_sort_key: bool,
+    chart_dates: Optional[Iterable[str]] = None,
+    sort_keys: Optional[Iterable[Optional[str]]] = None
+) -> str:
+    """
+    임시 테이블의 fact_weekly_chart 레코드를 대상 테이블에 반영하는 MERGE 문을 만듭니다.
+    
+    MERGE 키는 chart_date와 webtoon_id 조합이며, sort_key 컬럼이 있으면 sort_key도 포함합니다
+    (같은 날짜, 같은 웹툰, 같은 정렬 키는 중복).
+    chart_dates/sort_keys를 지정하면 대상 테이블에 파티션/클러스터 필터를 추가합니다.
+    
+    Args:
+        table_id: 대상 테이블 ID
+        staging_table_id: 임시 테이블 ID
+        has_sort_key: 임시 테이블에 sort_key 컬럼이 있는지 여부
+        chart_dates: 임시 테이블의 chart_date 값 (파티션 필터)
+        sort_keys: 임시 테이블의 sort_key 값 (클러스터 필터, has_sort_key일 때만 사용)
+    
+    Returns:
+        MERGE 쿼리 문자열
+    """
+    target_filter = build_fact_weekly_chart_target_filter(chart_dates, sort_keys if has_sort_key else None)
+    if has_sort_key:
         merge_query = f"""
+        MERGE `{table_id}` AS target
+        USING (
+            SELECT 
+                CAST(chart_date AS DATE) AS chart_date,
+                CAST(webtoon_id AS STRING) AS webtoon_id,
+                rank,
+                CAST(collected_at AS TIMESTAMP) AS collected_at,
+                weekday,
+                weekday_rank,
+                CAST(year AS INT64) AS year,
+                CAST(month AS INT64) AS month,
+                CAST(week AS INT64) AS week,
+                CAST(view_count AS INT64) AS view_count,
+                sort_key
+            FROM `{staging_table_id}`
+        ) AS source
+        ON target.chart_date = source.chart_date 
+            AND target.webtoon_id = source.webtoon_id 
+            AND COALESCE(target.sort_key, '') = COALESCE(source.sort_key, '')
+            {target_filter}
+        WHEN MATCHED THEN
+            UPDATE SET
+                rank = source.rank,
+                collected_at = source.collected_at,
+                weekday = source.weekday,
+                weekday_rank = source.weekday_rank,
+                year = source.year,
+                month = source.month,
+                week = source.week,
+                view_count = source.view_count
+        WHEN NOT MATCHED THEN
+            INSERT (chart_date, webtoon_id, rank, collected_at, weekday, weekday_rank, year, month, week, view_count, sort_key)
+            VALUES (source.chart_date, source.webtoon_id, source.rank, source.collected_at, source.weekday, source.weekday_rank, source.year, source.month, source.week, source.view_count, source.sort_key)
+        """
+    else:
+        # sort_key 컬럼이 없으면 기존 방식 사용
+        merge_query = f"""
+        MERGE `{table_id}` AS target
+        USING (
+            SELECT 
+                CAST(chart_date AS DATE) AS chart_date,
+                CAST(webtoon_id AS STRING) AS webtoon_id,
+                rank,
+                CAST(collected_at AS TIMESTAMP) AS collected_at,
+                weekday,
+                weekday_rank,
+                CAST(year AS INT64) AS year,
+                CAST(month AS INT64) AS month,
+                CAST(week AS INT64) AS week,
+                CAST(view_count AS INT64) AS view_count
+            FROM `{staging_table_id}`
+        ) AS source
+        ON target.chart_date = source.chart_date 
+            AND target.webtoon_id = source.webtoon_id
+            {target_filter}
+        WHEN NOT MATCHED THEN
+            INSERT (chart_date, webtoon_id, rank, collected_at, weekday, weekday_rank, year, month, week, view_count)
+            VALUES (source.chart_date, source.webtoon_id, source.rank, source.collected_at, source.weekday, source.weekday_rank, source.year, source.month, source.week, source.view_count)
+        """
+    return merge_query
+
+
+def get_merge_max_bytes_per_day() -> int:
+    """
+    fact_weekly_chart MERGE가 chart_date 하나당 처리해도 되는 최대 바이트 수를 반환합니다.
+    환경 변수 BIGQUERY_MERGE_MAX_BYTES_PER_DAY가 설정되어 있으면 그 값을 사용합니다.
+    
+    Returns:
+        최대 바이트 수 (기본값: 100MB, 0 이하이면 dry run 확인 생략)
+    """
+    return int(os.getenv('BIGQUERY_MERGE_MAX_BYTES_PER_DAY', str(DEFAULT_MERGE_MAX_BYTES_PER_DAY)))
+
+
+def check_merge_bytes(client: 'bigquery.Client', merge_query: str, days: int) -> Optional[int]:
+    """
+    MERGE를 dry run으로 실행하여 처리 바이트 수가 날짜 수에 비례하는 한도 안에 있는지 확인합니다.
+    파티션 필터가 빠지거나 동작하지 않아 테이블 전체를 읽게 되면 경고를 남깁니다.
+    
+    Args:
+        client: BigQuery 클라이언트
+        merge_query: MERGE 쿼리
+        days: MERGE 대상 chart_date 수
+    
+    Returns:
+        처리 예상 바이트 수 (확인을 생략했거나 dry run이 실패하면 None)
+    """
+    max_bytes_per_day = get_merge_max_bytes_per_day()
+    if max_bytes_per_day <= 0:
+        return None
+    
+    try:
+        job = client.query(
+            merge_query,
+            job_config=bigquery.QueryJobConfig(dry_run=True, use_query_cache=False)
+        )
+    except Exception as e:
+        logger.warning(f"MERGE dry run 실패 (확인 생략): {e}")
+        return None
+    
+    bytes_processed = job.total_bytes_processed or 0
+    limit = max_bytes_per_day * max(1, days)
+    if bytes_processed > limit:
+        logger.warning(
+            f"⚠️ fact_weekly_chart MERGE 처리 예상 바이트가 한도를 넘습니다: "
+            f"{bytes_processed / 1024 / 1024:.1f}MB > {limit / 1024 / 1024:.1f}MB "
+            f"(chart_date {days}개, 파티션 필터 확인 필요)"
+        )
+    else:
+        logger.info(f"fact_weekly_chart MERGE 처리 예상 바이트: {bytes_processed / 1024 / 1024:.1f}MB (chart_date {days}개)")
+    return bytes_processed
+
+
+def load_dim_upload_manifest(table_id: str) -> Dict[str, str]:
+    """
+    BigQuery dim_webtoon에 이미 반영된 레코드의 fingerprint manifest를 읽습니다.
+    
+    Args:
+        table_id: BigQuery 테이블 ID (다른 테이블의 manifest는 무시)
+    
+    Returns:
+        webtoon_id → fingerprint (manifest가 없거나 읽을 수 없으면 빈 dict)
+    """
+    manifest_path = get_dim_webtoon_bigquery_manifest_path()
+    if not manifest_path.exists():
+        return {}
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"dim_webtoon 업로드 manifest를 읽을 수 없습니다 (전체 업로드): {e}")
+        return {}
+    if manifest.get('table_id') != table_id:
+        logger.info(f"dim_webtoon 업로드 manifest의 테이블이 다릅니다 ({manifest.get('table_id')}), 무시합니다.")
+        return {}
+    return manifest.get('fingerprints', {})
+
+
+def update_dim_upload_manifest(table_id: str, fingerprints: Dict[str, str], replace: bool = False) -> None:
+    """
+    BigQuery에 반영된 레코드의 fingerprint를 manifest에 기록합니다.
+    
+    Args:
+        table_id: BigQuery 테이블 ID
+        fingerprints: 이번에 반영된 webtoon_id → fingerprint
+        replace: True이면 기존 manifest를 버리고 fingerprints로 교체 (전체 업로드 후)
+    """
+    manifest_path = get_dim_webtoon_bigquery_manifest_path()
+    with file_lock(manifest_path):
+        manifest = {} if replace else load_dim_upload_manifest(table_id)
+        manifest.update(fingerprints)
+        with atomic_write(manifest_path) as f:
+            json.dump(
+                {'table_id': table_id, 'updated_at': datetime.now().isoformat(), 'fingerprints': manifest},
+                f, ensure_ascii=False, separators=(',', ':')
+            )
+    logger.info(f"dim_webtoon 업로드 manifest 갱신: {len(fingerprints)}개 반영 (전체 {len(manifest)}개)")
+
+
+def seed_dim_upload_manifest(table_id: str) -> Dict[str, str]:
+    """
+    로컬 manifest가 없을 때 BigQuery dim_webtoon의 비즈니스 필드로 manifest를 다시 만듭니다.
+    
+    Cloud Function은 DATA_DIR(/tmp)이 인스턴스마다 비어 있어 콜드 스타트마다 manifest가 없으므로,
+    전체 웹툰을 다시 적재/MERGE하는 대신 SELECT 한 번으로 이미 반영된 레코드의 fingerprint를 계산합니다.
+    ARRAY 컬럼은 TO_JSON_STRING으로 읽어 로컬 레코드와 같은 리스트로 되돌립니다.
+    
+    Args:
+        table_id: BigQuery 테이블 ID
+    
+    Returns:
+        webtoon_id → fingerprint (테이블을 읽을 수 없으면 빈 dict, 이 경우 전체 업로드)
+    """
+    repeated = {name for name, _, mode in DIM_WEBTOON_BQ_FIELDS if mode == 'REPEATED'}
+    columns = ', '.join(
+        f"TO_JSON_STRING({field}) AS {field}" if field in repeated else field
+        for field in DIM_WEBTOON_FINGERPRINT_FIELDS
+    )
+    start = time.perf_counter()
+    try:
+        rows = get_bigquery_client().query(f"SELECT webtoon_id, {columns} FROM `{table_id}`").result()
+        fingerprints = {}
+        for row in rows:
+            record = {field: row[field] for field in ['webtoon_id'] + DIM_WEBTOON_FINGERPRINT_FIELDS}
+            for field in repeated:
+                record[field] = json.loads(record[field]) if record[field] else None
+            record = normalize_dim_webtoon_record(record)
+            fingerprints[record['webtoon_id']] = compute_dim_webtoon_fingerprint(record)
+    except Exception as e:
+        logger.warning(f"BigQuery dim_webtoon으로 업로드 manifest를 만들 수 없습니다 (전체 업로드): {e}")
+        return {}
+    logger.info(
+        f"dim_webtoon 업로드 manifest가 없어 BigQuery에서 다시 만들었습니다: "
+        f"{len(fingerprints)}개 ({time.perf_counter() - start:.2f}초)"
+    )
+    update_dim_upload_manifest(table_id, fingerprints, replace=True)
+    return fingerprints
+
+
+def build_dim_webtoon_merge_query(table_id: str, staging_table_id: str) -> str:
+    """
+    임시 테이블의 dim_webtoon 레코드를 대상 테이블에 반영하는 MERGE 문을 만듭니다.
+    같은 webtoon_id가 여러 번 있으면 updated_at이 가장 최근인 레코드를 사용합니다.
+    
+    이미 있는 웹툰은 fingerprint 필드(DIM_WEBTOON_FINGERPRINT_FIELDS) 중 하나라도 다를 때만 갱신하므로,
+    manifest 없이 전체를 다시 올려도(콜드 스타트, full=True) 바뀌지 않은 행의 updated_at은 그대로입니다.
+    ARRAY 컬럼은 비교 연산을 지원하지 않아 TO_JSON_STRING으로 비교합니다.
+    
+    Args:
+        table_id: 대상 테이블 ID
+        staging_table_id: 임시 테이블 ID
+    
+    Returns:
+        MERGE 쿼리 문자열
+    """
+    repeated = {name for name, _, mode in DIM_WEBTOON_BQ_FIELDS if mode == 'REPEATED'}
+    changed = '\n                OR '.join(
+        f"TO_JSON_STRING(target.{field}) IS DISTINCT FROM TO_JSON_STRING(source.{field})"
+        if field in repeated else f"target.{field} IS DISTINCT FROM source.{field}"
+        for field in DIM_WEBTOON_FINGERPRINT_FIELDS
+    )
+    return f"""
         MERGE `{table_id}` AS target
         USING (
             SELECT 
@@ -230,12 +865,14 @@ def upload_dim_webtoon(jsonl_path: Optional[Path] = None, dry_run: bool = False)
                 SELECT 
                     *,
                     ROW_NUMBER() OVER (PARTITION BY CAST(webtoon_id AS STRING) ORDER BY CAST(updated_at AS TIMESTAMP) DESC) AS rn
-                FROM `{temp_table_id}`
+                FROM `{staging_table_id}`
             )
             WHERE rn = 1
         ) AS source
         ON target.webtoon_id = source.webtoon_id
-        WHEN MATCHED THEN
+        WHEN MATCHED AND (
+                {changed}
+            ) THEN
             UPDATE SET
                 title = source.title,
                 author = source.author,
@@ -251,23 +888,194 @@ def upload_dim_webtoon(jsonl_path: Optional[Path] = None, dry_run: bool = False)
             INSERT (webtoon_id, title, author, genre, tags, seo_id, adult, catchphrase, badges, content_id, created_at, updated_at)
             VALUES (source.webtoon_id, source.title, source.author, source.genre, source.tags, source.seo_id, source.adult, source.catchphrase, source.badges, source.content_id, source.created_at, source.updated_at)
         """
+
+
+def iter_local_dim_records() -> Iterator[Dict]:
+    """
+    로컬에 저장된 dim_webtoon 전체 최신 레코드를 저장 형식(DATA_FORMAT)에 맞게 읽습니다.
+    
+    Yields:
+        dim_webtoon 레코드 (jsonl: DimWebtoonStore, sqlite: LocalWarehouse, csv/parquet: load_dim_webtoon)
+    """
+    data_format = get_data_format()
+    if data_format == 'jsonl':
+        with DimWebtoonStore() as store:
+            yield from store.records()
+    elif data_format == 'sqlite':
+        from src.warehouse import LocalWarehouse
+        with LocalWarehouse() as warehouse:
+            yield from warehouse.load_dim_webtoon()
+    else:
+        from src.transform import dataframe_to_records, load_dim_webtoon
+        yield from dataframe_to_records(load_dim_webtoon())
+
+
+def stage_dim_webtoon(
+    jsonl_path: Optional[Path] = None,
+    dry_run: bool = False,
+    records: Optional[List[Dict]] = None,
+    full: bool = False
+) -> Optional[StagedMerge]:
+    """
+    BigQuery에 반영되지 않은 dim_webtoon 레코드를 임시 테이블에 적재합니다 (MERGE는 merge_staged).
+    
+    BigQuery에 반영된 레코드의 fingerprint를 로컬 manifest에 기록해 두고, 새 웹툰이거나
+    fingerprint가 바뀐 레코드만 NDJSON 하나로 모아 load job 한 번으로 임시 테이블에 적재합니다.
+    manifest는 MERGE가 끝난 뒤에 갱신합니다. 로컬 manifest가 없으면(Cloud Function 콜드 스타트 등)
+    BigQuery dim_webtoon에서 다시 만듭니다 (seed_dim_upload_manifest).
+    
+    Args:
+        jsonl_path: JSONL 파일 경로 (None이면 로컬 dim_webtoon 전체, iter_local_dim_records)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        records: 업로드할 레코드 리스트 (지정하면 파일 대신 사용)
+        full: True이면 manifest를 무시하고 모든 레코드를 업로드한 뒤 manifest를 새로 만듦
+            (BigQuery 테이블을 다시 만들었거나 manifest를 믿을 수 없을 때)
+    
+    Returns:
+        StagedMerge (변경된 레코드가 없거나 dry run이면 None,
+        원본 레코드가 하나도 없으면 ValueError, BigQuery 오류는 예외)
+    """
+    table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.dim_webtoon"
+    manifest = {} if full else load_dim_upload_manifest(table_id)
+    if not manifest and not full and not dry_run:
+        manifest = seed_dim_upload_manifest(table_id)
+    uploaded: Dict[str, str] = {}
+    scanned = [0]
+    
+    def pending(rows: Iterable[Dict]) -> Iterator[Dict]:
+        # BigQuery에 같은 fingerprint로 이미 반영된 레코드는 건너뜀
+        for record in rows:
+            scanned[0] += 1
+            webtoon_id = str(record.get('webtoon_id'))
+            fingerprint = record.get('fingerprint') or compute_dim_webtoon_fingerprint(record)
+            if manifest.get(webtoon_id) == fingerprint:
+                continue
+            uploaded[webtoon_id] = fingerprint
+            yield record
+    
+    with SpooledTemporaryFile(max_size=NDJSON_SPOOL_MAX_BYTES) as source:
+        if records is not None:
+            total, normalized = write_ndjson(
+                pending(records), source, DIM_WEBTOON_BQ_FIELDS, normalize_dim_webtoon_record
+            )
+        elif jsonl_path is None:
+            total, normalized = write_ndjson(
+                pending(iter_local_dim_records()), source, DIM_WEBTOON_BQ_FIELDS, normalize_dim_webtoon_record
+            )
+        else:
+            if not jsonl_path.exists():
+                logger.warning(f"파일이 존재하지 않습니다: {jsonl_path}")
+            total, normalized = write_ndjson(
+                pending(iter_jsonl_records(jsonl_path)) if jsonl_path.exists() else [],
+                source, DIM_WEBTOON_BQ_FIELDS, normalize_dim_webtoon_record
+            )
         
-        client.query(merge_query).result()
-        logger.info(f"✅ dim_webtoon MERGE 완료")
+        if scanned[0] == 0:
+            # 변경 없음(아래 total == 0)과 달리 원본이 비어 있음: 저장 단계가 실패한 것이므로 실패로 처리
+            raise ValueError(f"업로드할 dim_webtoon 레코드가 없습니다: {jsonl_path or get_data_format()}")
+        logger.info(
+            f"dim_webtoon 업로드 대상: {total}개 레코드 "
+            f"(확인 {scanned[0]}개 중 BigQuery 반영분과 다른 레코드{', 전체 업로드' if full else ''})"
+        )
+        if total == 0:
+            logger.info("✅ dim_webtoon 변경 사항 없음: 임시 테이블 적재와 MERGE를 생략합니다.")
+            return None
         
-        # 임시 테이블 삭제
-        client.delete_table(temp_table_id, not_found_ok=True)
+        if dry_run:
+            logger.info(f"[DRY RUN] dim_webtoon 업로드 예정: {total}개 레코드")
+            return None
         
-        logger.info(f"✅ dim_webtoon 업로드 완료: {total_uploaded}개 레코드")
-        return True
+        client = get_bigquery_client()
         
+        # 임시 테이블에 먼저 업로드
+        temp_table_id = create_staging_table(client, table_id, DIM_WEBTOON_BQ_FIELDS)
+        load_elapsed = load_ndjson_to_table(client, source, temp_table_id, DIM_WEBTOON_BQ_FIELDS)
+        logger.info(
+            f"dim_webtoon 임시 테이블 적재 완료: {total}개 레코드 "
+            f"(load job 1개, {load_elapsed:.2f}초, 정규화 {normalized}개)"
+        )
+    
+    return StagedMerge(
+        'dim_webtoon', temp_table_id, build_dim_webtoon_merge_query(table_id, temp_table_id), total, load_elapsed,
+        # BigQuery에 반영된 fingerprint 기록 (다음 업로드에서 제외)
+        on_merged=lambda: update_dim_upload_manifest(table_id, uploaded, replace=full),
+    )
+
+
+def upload_dim_webtoon(
+    jsonl_path: Optional[Path] = None,
+    dry_run: bool = False,
+    records: Optional[List[Dict]] = None,
+    full: bool = False
+) -> bool:
+    """
+    dim_webtoon 레코드를 BigQuery에 업로드합니다 (stage_dim_webtoon + merge_staged).
+    
+    새 웹툰이거나 fingerprint가 바뀐 레코드만 임시 테이블에 적재한 뒤 MERGE합니다.
+    올릴 레코드가 없으면 임시 테이블과 MERGE를 모두 생략하므로,
+    BigQuery 비용과 업로드 시간은 전체 웹툰 수가 아니라 변경된 웹툰 수에 비례합니다.
+    
+    Args:
+        jsonl_path: JSONL 파일 경로 (None이면 로컬 dim_webtoon 전체, iter_local_dim_records)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        records: 업로드할 레코드 리스트 (지정하면 파일 대신 사용)
+        full: True이면 manifest를 무시하고 모든 레코드를 업로드한 뒤 manifest를 새로 만듦
+            (BigQuery 테이블을 다시 만들었거나 manifest를 믿을 수 없을 때)
+    
+    Returns:
+        성공 여부
+    """
+    try:
+        merge_staged(stage_dim_webtoon(jsonl_path, dry_run=dry_run, records=records, full=full))
+        return True
     except Exception as e:
         logger.error(f"❌ dim_webtoon 업로드 실패: {e}")
+        invalidate_bigquery_client(f"dim_webtoon 업로드 실패: {e}")
         import traceback
         logger.error(traceback.format_exc())
         return False
 
 
+def upload_dim_webtoon_delta(delta: List[Dict], dry_run: bool = False) -> bool:
+    """
+    이번 실행의 dim_webtoon 변경분을 BigQuery에 반영합니다.
+    
+    변경분(delta)만이 아니라 로컬 dim_webtoon 전체(iter_local_dim_records)를 manifest와 비교하므로,
+    이전 실행에서 업로드에 실패한 레코드도 함께 다시 올라갑니다 (변경이 없으면 MERGE 생략).
+    
+    Args:
+        delta: TransformRun.dim_delta (이번 실행에서 변경된 레코드, 로그용)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        성공 여부
+    """
+    logger.info(f"dim_webtoon 이번 실행 변경 {len(delta)}개: 로컬 전체를 manifest와 비교해 업로드합니다.")
+    return upload_dim_webtoon(dry_run=dry_run)
+
+
+FACT_INGESTION_MODES = ('merge', 'committed', 'pending')
+
+
+def get_fact_ingestion_mode() -> str:
+    """
+    fact_weekly_chart 적재 방식을 반환합니다.
+    환경 변수 BIGQUERY_FACT_INGESTION_MODE가 설정되어 있으면 그 값을 사용합니다.
+    
+    Returns:
+        'merge' (임시 테이블 load job + MERGE, 기본값),
+        'committed' 또는 'pending' (Storage Write API, google-cloud-bigquery-storage가 없으면 'merge')
+    """
+    mode = os.getenv('BIGQUERY_FACT_INGESTION_MODE', 'merge').lower()
+    if mode not in FACT_INGESTION_MODES:
+        logger.warning(f"알 수 없는 BIGQUERY_FACT_INGESTION_MODE입니다 (merge 사용): {mode}")
+        return 'merge'
+    if mode != 'merge' and not is_module_available('google.cloud.bigquery_storage_v1'):
+        logger.warning("google-cloud-bigquery-storage가 설치되어 있지 않아 merge 방식으로 적재합니다.")
+        return 'merge'
+    return mode
+
+
 def upload_fact_weekly_chart(
     chart_date: date,
     sort_key: Optional[str] = None,
@@ -277,6 +1085,12 @@ def upload_fact_weekly_chart(
     """
     fact_weekly_chart JSONL 파일을 BigQuery에 업로드합니다.
     
+    파일을 load job 한 번으로 임시 테이블에 적재한 뒤 MERGE합니다
+    (BIGQUERY_FACT_INGESTION_MODE가 committed/pending이면 upload_fact_weekly_charts와 같이 Storage Write API 사용).
+    파이프라인이 저장한 파일처럼 스키마에 이미 맞으면 정규화/재직렬화 없이 그대로 업로드합니다.
+    JSONL이 아닌 저장 형식(parquet/csv/sqlite)은 로컬 저장소의 파티션을 merge_fact_weekly_charts로 업로드합니다.
+    올릴 레코드가 없으면 실패로 처리합니다 (저장을 마친 정렬 키만 호출).
+    
     Args:
         chart_date: 차트 날짜
         sort_key: 정렬 키 (None이면 기본값)
@@ -286,188 +1100,417 @@ def upload_fact_weekly_chart(
     Returns:
         성공 여부
     """
+    # Storage Write API 모드에서는 정렬 키 하나도 같은 경로로 적재
+    if jsonl_path is None and sort_key is not None and not dry_run and get_fact_ingestion_mode() != 'merge':
+        return upload_fact_weekly_charts(chart_date, [sort_key])
+    
+    if jsonl_path is None and get_data_format() != 'jsonl':
+        return merge_fact_weekly_charts(chart_date, [sort_key], dry_run=dry_run)
+    
     if jsonl_path is None:
         jsonl_path = get_chart_jsonl_path(chart_date, sort_key)
     
-    records = load_jsonl_file(jsonl_path)
-    if len(records) == 0:
-        logger.warning(f"업로드할 레코드가 없습니다: {jsonl_path}")
-        return True
+    # 스키마 명시적으로 지정 (weekday_rank 포함)
+    # 첫 번째 레코드에 sort_key가 있으면 스키마에 추가
+    first = read_first_jsonl_record(jsonl_path)
+    has_sort_key = first is not None and 'sort_key' in first
+    fields = FACT_WEEKLY_CHART_BQ_FIELDS + ([FACT_SORT_KEY_BQ_FIELD] if has_sort_key else [])
+    
+    # MERGE 대상 파티션/클러스터 필터용 값
+    values = {'chart_date': set(), 'sort_key': set()}
+    total, conforms = inspect_jsonl_file(jsonl_path, fields, values)
+    if total == 0:
+        logger.error(f"❌ 업로드할 fact_weekly_chart 레코드가 없습니다: {jsonl_path}")
+        return False
+    logger.info(f"JSONL 파일 확인 완료: {total}개 레코드 ({jsonl_path}, 스키마 일치: {conforms})")
     
     if dry_run:
-        logger.info(f"[DRY RUN] fact_weekly_chart 업로드 예정: {len(records)}개 레코드")
+        logger.info(f"[DRY RUN] fact_weekly_chart 업로드 예정: {total}개 레코드")
         return True
     
     try:
         client = get_bigquery_client()
         table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_weekly_chart"
         
-        # 데이터 변환 및 정규화
-        for record in records:
-            # webtoon_id를 문자열로 보장
-            if 'webtoon_id' in record:
-                record['webtoon_id'] = str(record['webtoon_id'])
-            
-            # datetime 객체를 문자열로 변환
-            if 'chart_date' in record and record['chart_date']:
-                if isinstance(record['chart_date'], date):
-                    record['chart_date'] = record['chart_date'].isoformat()
-                elif isinstance(record['chart_date'], datetime):
-                    record['chart_date'] = record['chart_date'].date().isoformat()
-            if 'collected_at' in record and record['collected_at']:
-                if isinstance(record['collected_at'], datetime):
-                    record['collected_at'] = record['collected_at'].isoformat()
-            
-            # view_count를 정수로 변환
-            if 'view_count' in record and record['view_count'] is not None:
-                try:
-                    if isinstance(record['view_count'], str):
-                        record['view_count'] = int(record['view_count']) if record['view_count'].strip() else None
-                    elif isinstance(record['view_count'], (int, float)):
-                        record['view_count'] = int(record['view_count'])
-                except (ValueError, TypeError):
-                    record['view_count'] = None
-            
-            # rank를 정수로 보장
-            if 'rank' in record and record['rank'] is not None:
-                try:
-                    if isinstance(record['rank'], str):
-                        record['rank'] = int(record['rank'])
-                    elif isinstance(record['rank'], (int, float)):
-                        record['rank'] = int(record['rank'])
-                except (ValueError, TypeError):
-                    logger.warning(f"rank 변환 실패: {record.get('rank')}")
-            
-            # year, month, week를 정수로 보장
-            for field in ['year', 'month', 'week']:
-                if field in record and record[field] is not None:
-                    try:
-                        if isinstance(record[field], str):
-                            record[field] = int(record[field])
-                        elif isinstance(record[field], (int, float)):
-                            record[field] = int(record[field])
-                    except (ValueError, TypeError):
-                        logger.warning(f"{field} 변환 실패: {record.get(field)}")
-        
         # 임시 테이블에 먼저 업로드
-        temp_table_id = f"{table_id}_temp_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        batch_size = 1000
-        total_uploaded = 0
-        
-        # 스키마 명시적으로 지정 (weekday_rank 포함)
-        # records의 첫 번째 항목에서 sort_key 존재 여부 확인
-        has_sort_key = len(records) > 0 and 'sort_key' in records[0]
+        temp_table_id = create_staging_table(client, table_id, fields)
         
-        schema_fields = [
-            bigquery.SchemaField('chart_date', 'DATE', mode='REQUIRED'),
-            bigquery.SchemaField('webtoon_id', 'STRING', mode='REQUIRED'),
-            bigquery.SchemaField('rank', 'INTEGER', mode='REQUIRED'),
-            bigquery.SchemaField('collected_at', 'TIMESTAMP', mode='REQUIRED'),
-            bigquery.SchemaField('weekday', 'STRING', mode='NULLABLE'),
-            bigquery.SchemaField('weekday_rank', 'INTEGER', mode='NULLABLE'),  # 요일별 순위
-            bigquery.SchemaField('year', 'INTEGER', mode='REQUIRED'),
-            bigquery.SchemaField('month', 'INTEGER', mode='REQUIRED'),
-            bigquery.SchemaField('week', 'INTEGER', mode='REQUIRED'),
-            bigquery.SchemaField('view_count', 'INTEGER', mode='NULLABLE'),
-        ]
-        
-        # sort_key가 있으면 스키마에 추가
-        if has_sort_key:
-            schema_fields.append(bigquery.SchemaField('sort_key', 'STRING', mode='NULLABLE'))
-        
-        for i in range(0, len(records), batch_size):
-            batch = records[i:i + batch_size]
-            
-            job = client.load_table_from_json(
-                batch,
-                temp_table_id,
-                job_config=bigquery.LoadJobConfig(
-                    write_disposition=bigquery.WriteDisposition.WRITE_APPEND if i > 0 else bigquery.WriteDisposition.WRITE_TRUNCATE,
-                    create_disposition=bigquery.CreateDisposition.CREATE_IF_NEEDED,
-                    ignore_unknown_values=False,
-                    schema=schema_fields,  # 스키마 명시적으로 지정
+        with ExitStack() as stack:
+            normalized = 0
+            if conforms:
+                # 이미 스키마에 맞는 파일은 그대로 업로드
+                source = stack.enter_context(open(jsonl_path, 'rb'))
+            else:
+                source = stack.enter_context(SpooledTemporaryFile(max_size=NDJSON_SPOOL_MAX_BYTES))
+                total, normalized = write_ndjson(
+                    iter_jsonl_records(jsonl_path), source, fields, normalize_fact_weekly_chart_record
                 )
-            )
             
-            job.result()
-            total_uploaded += len(batch)
-            logger.info(f"fact_weekly_chart 임시 테이블 업로드 진행: {total_uploaded}/{len(records)}")
+            load_elapsed = load_ndjson_to_table(client, source, temp_table_id, fields)
+        logger.info(
+            f"fact_weekly_chart 임시 테이블 적재 완료: {total}개 레코드 "
+            f"(load job 1개, {load_elapsed:.2f}초, 정규화 {normalized}개)"
+        )
         
         # MERGE 실행 (chart_date와 webtoon_id 조합이 고유해야 함)
-        # sort_key 정보도 고려 (같은 날짜, 같은 웹툰, 같은 정렬 키는 중복)
-        # sort_key 컬럼이 있는지 확인
-        temp_table = client.get_table(temp_table_id)
-        has_sort_key = any(field.name == 'sort_key' for field in temp_table.schema)
-        
-        if has_sort_key:
-            merge_query = f"""
-            MERGE `{table_id}` AS target
-            USING (
-                SELECT 
-                    CAST(chart_date AS DATE) AS chart_date,
-                    CAST(webtoon_id AS STRING) AS webtoon_id,
-                    rank,
-                    CAST(collected_at AS TIMESTAMP) AS collected_at,
-                    weekday,
-                    weekday_rank,
-                    CAST(year AS INT64) AS year,
-                    CAST(month AS INT64) AS month,
-                    CAST(week AS INT64) AS week,
-                    CAST(view_count AS INT64) AS view_count,
-                    sort_key
-                FROM `{temp_table_id}`
-            ) AS source
-            ON target.chart_date = source.chart_date 
-                AND target.webtoon_id = source.webtoon_id 
-                AND COALESCE(target.sort_key, '') = COALESCE(source.sort_key, '')
-            WHEN MATCHED THEN
-                UPDATE SET
-                    rank = source.rank,
-                    collected_at = source.collected_at,
-                    weekday = source.weekday,
-                    weekday_rank = source.weekday_rank,
-                    year = source.year,
-                    month = source.month,
-                    week = source.week,
-                    view_count = source.view_count
-            WHEN NOT MATCHED THEN
-                INSERT (chart_date, webtoon_id, rank, collected_at, weekday, weekday_rank, year, month, week, view_count, sort_key)
-                VALUES (source.chart_date, source.webtoon_id, source.rank, source.collected_at, source.weekday, source.weekday_rank, source.year, source.month, source.week, source.view_count, source.sort_key)
-            """
-        else:
-            # sort_key 컬럼이 없으면 기존 방식 사용
-            merge_query = f"""
-            MERGE `{table_id}` AS target
-            USING (
-                SELECT 
-                    CAST(chart_date AS DATE) AS chart_date,
-                    CAST(webtoon_id AS STRING) AS webtoon_id,
-                    rank,
-                    CAST(collected_at AS TIMESTAMP) AS collected_at,
-                    weekday,
-                    weekday_rank,
-                    CAST(year AS INT64) AS year,
-                    CAST(month AS INT64) AS month,
-                    CAST(week AS INT64) AS week,
-                    CAST(view_count AS INT64) AS view_count
-                FROM `{temp_table_id}`
-            ) AS source
-            ON target.chart_date = source.chart_date 
-                AND target.webtoon_id = source.webtoon_id
-            WHEN NOT MATCHED THEN
-                INSERT (chart_date, webtoon_id, rank, collected_at, weekday, weekday_rank, year, month, week, view_count)
-                VALUES (source.chart_date, source.webtoon_id, source.rank, source.collected_at, source.weekday, source.weekday_rank, source.year, source.month, source.week, source.view_count)
-            """
+        merge_query = build_fact_weekly_chart_merge_query(
+            table_id, temp_table_id, has_sort_key,
+            chart_dates=values['chart_date'], sort_keys=values['sort_key'],
+        )
+        check_merge_bytes(client, merge_query, len(values['chart_date']))
         
+        merge_start = time.perf_counter()
         client.query(merge_query).result()
+        merge_elapsed = time.perf_counter() - merge_start
         client.delete_table(temp_table_id, not_found_ok=True)
         
-        logger.info(f"✅ fact_weekly_chart 업로드 완료: {total_uploaded}개 레코드")
+        logger.info(
+            f"✅ fact_weekly_chart 업로드 완료: {total}개 레코드 "
+            f"(load {load_elapsed:.2f}초, MERGE {merge_elapsed:.2f}초)"
+        )
         return True
         
     except Exception as e:
         logger.error(f"❌ fact_weekly_chart 업로드 실패: {e}")
+        invalidate_bigquery_client(f"fact_weekly_chart 업로드 실패: {e}")
         import traceback
         logger.error(traceback.format_exc())
         return False
 
+
+def upload_fact_weekly_charts(
+    chart_date: date,
+    sort_keys: List[Optional[str]],
+    dry_run: bool = False,
+    batches: Optional[Dict[Optional[str], 'pa.Table']] = None
+) -> bool:
+    """
+    한 날짜의 여러 정렬 키 fact_weekly_chart를 한 번에 BigQuery에 업로드합니다.
+    
+    적재 방식은 환경 변수 BIGQUERY_FACT_INGESTION_MODE로 선택합니다.
+    - merge (기본값): merge_fact_weekly_charts (임시 테이블 load job 한 번 + MERGE 한 번)
+    - committed/pending: Storage Write API (src.bigquery_write.write_fact_weekly_charts)
+    
+    Args:
+        chart_date: 차트 날짜
+        sort_keys: 정렬 키 리스트
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        성공 여부
+    """
+    mode = get_fact_ingestion_mode()
+    if mode == 'merge' or dry_run:
+        return merge_fact_weekly_charts(chart_date, sort_keys, dry_run=dry_run, batches=batches)
+    
+    from src.bigquery_write import write_fact_weekly_charts
+    return write_fact_weekly_charts(chart_date, sort_keys, mode)
+
+
+def load_local_fact_records(chart_date: date, sort_key: Optional[str]) -> Optional[List[Dict]]:
+    """
+    JSONL 파일이 없는 저장 형식(DATA_FORMAT)에서 저장된 fact_weekly_chart 파티션 레코드를 읽습니다.
+    
+    Args:
+        chart_date: 차트 날짜
+        sort_key: 정렬 키
+    
+    Returns:
+        레코드 리스트 (jsonl 형식이면 None, get_chart_jsonl_path 파일을 그대로 업로드)
+    """
+    data_format = get_data_format()
+    if data_format == 'jsonl':
+        return None
+    if data_format == 'sqlite':
+        from src.warehouse import LocalWarehouse
+        with LocalWarehouse() as warehouse:
+            return warehouse.load_fact_weekly_chart(chart_date, chart_date, [sort_key])
+    
+    from src.transform import dataframe_to_records, load_fact_weekly_chart
+    # CSV는 날짜별 파일 하나에 모든 정렬 키가 있으므로 이 정렬 키의 레코드만 남김
+    return [
+        record for record in dataframe_to_records(load_fact_weekly_chart(chart_date, sort_key))
+        if record.get('sort_key') in (None, sort_key)
+    ]
+
+
+def stage_fact_weekly_chart_batches(
+    chart_date: date,
+    batches: Dict[Optional[str], 'pa.Table'],
+    dry_run: bool = False
+) -> Optional[StagedMerge]:
+    """
+    transform이 넘긴 정렬 키별 fact_weekly_chart Arrow 배치를 임시 테이블 하나에 적재합니다.
+    
+    배치는 BigQuery 스키마 타입으로 이미 변환되어 있으므로(models.fact_records_to_arrow_table)
+    JSONL 파일을 다시 읽거나 레코드를 정규화하지 않고 Parquet 하나로 직렬화해 load job 한 번으로 적재합니다.
+    
+    Args:
+        chart_date: 차트 날짜
+        batches: 정렬 키 → Arrow Table (TransformRun.fact_batches)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        StagedMerge (dry run이면 None, 레코드가 없는 정렬 키가 있으면 ValueError, BigQuery 오류는 예외)
+    """
+    empty = [sort_key for sort_key, table in batches.items() if table.num_rows == 0]
+    if empty:
+        raise ValueError(f"업로드할 fact_weekly_chart 레코드가 없는 정렬 키가 있습니다: {chart_date} {empty}")
+    counts = {sort_key: table.num_rows for sort_key, table in batches.items()}
+    total = sum(counts.values())
+    
+    summary = ', '.join(f"{sort_key}={rows}" for sort_key, rows in counts.items())
+    if dry_run:
+        logger.info(f"[DRY RUN] fact_weekly_chart 업로드 예정: {total}개 레코드 ({summary}, Arrow 배치)")
+        return None
+    
+    table = pa.concat_tables([batches[sort_key] for sort_key in counts])
+    # MERGE 대상 파티션/클러스터 필터용 값
+    chart_dates = {value for value in table.column('chart_date').unique().to_pylist() if value is not None}
+    batch_sort_keys = set(table.column('sort_key').unique().to_pylist())
+    
+    client = get_bigquery_client()
+    table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_weekly_chart"
+    temp_table_id = create_staging_table(client, table_id, FACT_WEEKLY_CHART_BQ_FIELDS + [FACT_SORT_KEY_BQ_FIELD])
+    
+    with SpooledTemporaryFile(max_size=NDJSON_SPOOL_MAX_BYTES) as source:
+        pq.write_table(table, source)
+        load_elapsed = load_parquet_to_table(client, source, temp_table_id)
+    logger.info(
+        f"fact_weekly_chart 임시 테이블 적재 완료: {total}개 레코드 ({summary}) "
+        f"(Arrow 배치 → Parquet load job 1개, {load_elapsed:.2f}초)"
+    )
+    
+    merge_query = build_fact_weekly_chart_merge_query(
+        table_id, temp_table_id, has_sort_key=True, chart_dates=chart_dates, sort_keys=batch_sort_keys,
+    )
+    return StagedMerge(
+        'fact_weekly_chart', temp_table_id, merge_query, total, load_elapsed,
+        days=len(chart_dates), summary=f", 정렬 키 {len(counts)}개",
+    )
+
+
+def stage_fact_weekly_charts(
+    chart_date: date,
+    sort_keys: List[Optional[str]],
+    dry_run: bool = False,
+    batches: Optional[Dict[Optional[str], 'pa.Table']] = None
+) -> Optional[StagedMerge]:
+    """
+    한 날짜의 여러 정렬 키 fact_weekly_chart를 임시 테이블 하나에 적재합니다 (MERGE는 merge_staged).
+    
+    정렬 키별 JSONL 파일을 NDJSON 하나로 이어 붙여 load job 한 번으로 적재합니다.
+    스키마에 이미 맞는 파일은 정규화/재직렬화 없이 그대로 이어 붙입니다.
+    JSONL 파일이 없는 저장 형식은 로컬 저장소의 파티션 레코드(load_local_fact_records)를 씁니다.
+    모든 정렬 키의 Arrow 배치가 있으면 파일 대신 stage_fact_weekly_chart_batches를 사용합니다.
+    
+    Args:
+        chart_date: 차트 날짜
+        sort_keys: 정렬 키 리스트 (저장을 마친 정렬 키, 레코드가 없으면 ValueError)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        batches: 정렬 키 → Arrow Table (TransformRun.fact_batches, 선택사항)
+    
+    Returns:
+        StagedMerge (정렬 키가 없거나 dry run이면 None, BigQuery 오류는 예외)
+    """
+    if batches and all(sort_key in batches for sort_key in sort_keys):
+        return stage_fact_weekly_chart_batches(
+            chart_date, {sort_key: batches[sort_key] for sort_key in dict.fromkeys(sort_keys)}, dry_run=dry_run
+        )
+    
+    # 여러 정렬 키를 모으므로 sort_key 컬럼은 항상 포함
+    fields = FACT_WEEKLY_CHART_BQ_FIELDS + [FACT_SORT_KEY_BQ_FIELD]
+    
+    # MERGE 대상 파티션/클러스터 필터용 값
+    values = {'chart_date': set(), 'sort_key': set()}
+    sources = []
+    for sort_key in dict.fromkeys(sort_keys):
+        records = load_local_fact_records(chart_date, sort_key)
+        if records is not None:
+            if not records:
+                raise ValueError(f"업로드할 fact_weekly_chart 레코드가 없습니다: {chart_date} {sort_key} ({get_data_format()})")
+            records = [record if record.get('sort_key') else dict(record, sort_key=sort_key) for record in records]
+            for record in records:
+                values['chart_date'].add(record.get('chart_date'))
+                values['sort_key'].add(record.get('sort_key'))
+            sources.append((sort_key, None, len(records), False, records))
+            continue
+        
+        jsonl_path = get_chart_jsonl_path(chart_date, sort_key)
+        first = read_first_jsonl_record(jsonl_path)
+        if first is None:
+            raise ValueError(f"업로드할 fact_weekly_chart 레코드가 없습니다: {jsonl_path}")
+        file_values = {'chart_date': values['chart_date'], 'sort_key': set()}
+        rows, conforms = inspect_jsonl_file(jsonl_path, fields, file_values)
+        # sort_key가 없는 예전 파일은 파일의 정렬 키를 채워서 다시 씀
+        conforms = conforms and 'sort_key' in first
+        values['sort_key'] |= file_values['sort_key']
+        if not conforms and None in file_values['sort_key']:
+            # 다시 쓸 때 sort_key가 채워지는 레코드 (필터는 넓게 잡아도 결과는 같음)
+            values['sort_key'].add(sort_key)
+        sources.append((sort_key, jsonl_path, rows, conforms, None))
+    
+    total = sum(rows for _, _, rows, _, _ in sources)
+    if total == 0:
+        logger.warning(f"업로드할 fact_weekly_chart 레코드가 없습니다: {chart_date}")
+        return None
+    
+    summary = ', '.join(f"{sort_key}={rows}" for sort_key, _, rows, _, _ in sources)
+    if dry_run:
+        logger.info(f"[DRY RUN] fact_weekly_chart 업로드 예정: {total}개 레코드 ({summary})")
+        return None
+    
+    client = get_bigquery_client()
+    table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_weekly_chart"
+    
+    # 모든 정렬 키를 임시 테이블 하나에 적재
+    temp_table_id = create_staging_table(client, table_id, fields)
+    
+    with SpooledTemporaryFile(max_size=NDJSON_SPOOL_MAX_BYTES) as source:
+        normalized = 0
+        for sort_key, jsonl_path, rows, conforms, records in sources:
+            if records is not None:
+                _, file_normalized = write_ndjson(records, source, fields, normalize_fact_weekly_chart_record)
+                normalized += file_normalized
+                continue
+            if conforms:
+                with open(jsonl_path, 'rb') as f:
+                    shutil.copyfileobj(f, source)
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b'\n':
+                        source.write(b'\n')
+                continue
+            records = (
+                record if 'sort_key' in record else dict(record, sort_key=sort_key)
+                for record in iter_jsonl_records(jsonl_path)
+            )
+            _, file_normalized = write_ndjson(records, source, fields, normalize_fact_weekly_chart_record)
+            normalized += file_normalized
+        
+        load_elapsed = load_ndjson_to_table(client, source, temp_table_id, fields)
+    logger.info(
+        f"fact_weekly_chart 임시 테이블 적재 완료: {total}개 레코드 ({summary}) "
+        f"(load job 1개, {load_elapsed:.2f}초, 정규화 {normalized}개)"
+    )
+    
+    merge_query = build_fact_weekly_chart_merge_query(
+        table_id, temp_table_id, has_sort_key=True,
+        chart_dates=values['chart_date'], sort_keys=values['sort_key'],
+    )
+    return StagedMerge(
+        'fact_weekly_chart', temp_table_id, merge_query, total, load_elapsed,
+        days=len(values['chart_date']), summary=f", 정렬 키 {len(sources)}개",
+    )
+
+
+def merge_fact_weekly_charts(
+    chart_date: date,
+    sort_keys: List[Optional[str]],
+    dry_run: bool = False,
+    batches: Optional[Dict[Optional[str], 'pa.Table']] = None
+) -> bool:
+    """
+    한 날짜의 여러 정렬 키 fact_weekly_chart를 임시 테이블과 MERGE로 BigQuery에 반영합니다
+    (stage_fact_weekly_charts + merge_staged).
+    
+    정렬 키별 JSONL 파일을 임시 테이블 하나에 load job 한 번으로 적재하고, MERGE 한 번으로
+    반영합니다 (정렬 키마다 upload_fact_weekly_chart를 호출하면 임시 테이블 생성/적재/MERGE/삭제가
+    정렬 키 수만큼 반복됨).
+    
+    Args:
+        chart_date: 차트 날짜
+        sort_keys: 정렬 키 리스트
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+    
+    Returns:
+        성공 여부 (하나의 MERGE로 반영되므로 정렬 키 전체가 함께 성공/실패)
+    """
+    try:
+        merge_staged(stage_fact_weekly_charts(chart_date, sort_keys, dry_run=dry_run, batches=batches))
+        return True
+    except Exception as e:
+        logger.error(f"❌ fact_weekly_chart 업로드 실패: {e}")
+        invalidate_bigquery_client(f"fact_weekly_chart 업로드 실패: {e}")
+        import traceback
+        logger.error(traceback.format_exc())
+        return False
+
+
+def _bigquery_job(description: str, func: Callable, *args, **kwargs) -> Callable[[], Any]:
+    """작업 그래프용 함수: 실패하면 traceback을 남기고 BigQuery 클라이언트를 버린 뒤 예외를 다시 던집니다."""
+    def run() -> Any:
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            invalidate_bigquery_client(f"{description} 실패: {e}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise
+    return run
+
+
+def upload_to_bigquery(
+    chart_dates: Iterable[date],
+    sort_keys: List[Optional[str]],
+    dim_delta: Optional[List[Dict]] = None,
+    dry_run: bool = False,
+    fact_batches: Optional[Dict[date, Dict[Optional[str], 'pa.Table']]] = None
+) -> BigQueryJobGraph:
+    """
+    dim_webtoon 변경분과 날짜별 fact_weekly_chart를 BigQuery 작업 그래프(src.bigquery_jobs)로 업로드합니다.
+    
+    - 임시 테이블 적재(dim_webtoon, 날짜별 fact_weekly_chart)는 서로 독립이므로 모두 동시에 실행
+    - MERGE는 자기 적재가 성공한 뒤에 실행 (dim_webtoon MERGE와 fact_weekly_chart MERGE는 서로 기다리지 않음)
+    - 같은 테이블에 대한 fact_weekly_chart MERGE끼리는 DML 충돌을 피하도록 날짜 순서로 직렬화
+    - Storage Write API 모드(BIGQUERY_FACT_INGESTION_MODE)에서는 날짜별 upload_fact_weekly_charts가 작업 하나
+    - fact_batches에 날짜별 Arrow 배치가 있으면 JSONL 파일 대신 배치를 적재 (stage_fact_weekly_chart_batches)
+    
+    업로드 단계 소요 시간은 테이블별 (적재 + MERGE) 중 가장 긴 경로(critical path)에 가까워집니다.
+    
+    Args:
+        chart_dates: 차트 날짜 목록
+        sort_keys: 정렬 키 리스트
+        dim_delta: TransformRun.dim_delta (None이면 dim_webtoon은 업로드하지 않음,
+            업로드 대상은 로컬 dim_webtoon 전체를 manifest와 비교해 정함)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        fact_batches: 날짜 → TransformRun.fact_batches (선택사항, merge 모드에서만 사용)
+    
+    Returns:
+        실행이 끝난 BigQueryJobGraph (success, to_dict(), log_summary()로 작업별 소요 시간 확인)
+    """
+    graph = BigQueryJobGraph()
+    
+    if dim_delta is not None:
+        graph.add('dim_webtoon:stage', _bigquery_job(
+            'dim_webtoon 적재', stage_dim_webtoon, dry_run=dry_run
+        ))
+        graph.add(
+            'dim_webtoon:merge',
+            _bigquery_job('dim_webtoon MERGE', lambda: merge_staged(graph.result('dim_webtoon:stage'))),
+            depends_on=['dim_webtoon:stage'],
+        )
+    
+    mode = 'merge' if dry_run else get_fact_ingestion_mode()
+    previous: List[str] = []
+    for chart_date in dict.fromkeys(chart_dates):
+        name = f"fact_weekly_chart:{chart_date}"
+        if mode != 'merge':
+            graph.add(f"{name}:write", _bigquery_job(
+                f"{name} 적재", upload_fact_weekly_charts, chart_date, sort_keys
+            ), after=previous)
+            previous = [f"{name}:write"]
+            continue
+        graph.add(f"{name}:stage", _bigquery_job(
+            f"{name} 적재", stage_fact_weekly_charts, chart_date, sort_keys,
+            dry_run=dry_run, batches=(fact_batches or {}).get(chart_date),
+        ))
+        graph.add(
+            f"{name}:merge",
+            _bigquery_job(f"{name} MERGE", lambda stage=f"{name}:stage": merge_staged(graph.result(stage))),
+            depends_on=[f"{name}:stage"],
+            after=previous,
+        )
+        previous = [f"{name}:merge"]
+    
+    graph.run()
+    return graph
@@ -3,36 +3,160 @@ GCS 업로드 모듈
 
 로컬에 저장된 HTML/JSON 원본 파일을 GCS에 업로드하는 기능을 제공합니다.
 - 차트 데이터 업로드 (API 응답 JSON)
+- 여러 파일 일괄 업로드 (upload_files_to_gcs): 워커 풀에서 동시에 업로드하고 파일별 결과를 GcsUploadReport로 반환
+  (백필처럼 파일이 많을 때 요청별 왕복 지연이 아니라 네트워크 대역폭이 전체 시간을 좌우하도록)
+- 큰 파일(GCS_CHUNKED_UPLOAD_THRESHOLD_BYTES 이상)은 transfer_manager.upload_chunks_concurrently로
+  청크를 나누어 동시에 업로드 (XML 멀티파트 업로드, 업로드가 끝나면 객체 하나로 합쳐짐)
+
+사용 예 (여러 날짜 원본 백필):
+    python -m src.upload_gcs --start 2026-01-01 --end 2026-01-31 --report upload_report.json
 """
 
+import argparse
 import json
 import logging
 import os
-from datetime import date
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional
-
-from google.cloud import storage
-from google.cloud.exceptions import NotFound
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from src.utils import get_raw_html_dir, setup_logging
+from src.clients import get_gcs_bucket, invalidate_gcs_client
+from src.utils import LazyModule, get_raw_html_dir, setup_logging
 
 logger = logging.getLogger(__name__)
 
+# google-cloud-storage transfer_manager는 큰 파일을 업로드할 때만 import
+transfer_manager = LazyModule('google.cloud.storage.transfer_manager')
 
 # GCS 설정 (환경 변수 또는 기본값)
 GCS_BUCKET_NAME = os.getenv('GCS_BUCKET_NAME', 'kakao-webtoon-raw')
-GCS_PROJECT_ID = os.getenv('GCS_PROJECT_ID', 'kakao-webtoon-collector')
+
+# 이 크기 이상인 파일은 청크로 나누어 동시에 업로드 (transfer_manager.upload_chunks_concurrently)
+GCS_CHUNKED_UPLOAD_THRESHOLD_BYTES = int(os.getenv('GCS_CHUNKED_UPLOAD_THRESHOLD_BYTES', str(64 * 1024 * 1024)))
+# 청크 크기 (GCS 멀티파트 업로드 최소 단위 5MB 이상)
+GCS_UPLOAD_CHUNK_BYTES = max(5 * 1024 * 1024, int(os.getenv('GCS_UPLOAD_CHUNK_BYTES', str(32 * 1024 * 1024))))
+
+
+def get_gcs_upload_workers(default: int = 8) -> int:
+    """
+    GCS 일괄 업로드의 동시 업로드 파일 수(큰 파일은 파일당 청크 동시 업로드 수)를 반환합니다.
+    환경 변수 GCS_UPLOAD_WORKERS가 설정되어 있으면 그 값을 사용합니다.
+    
+    Args:
+        default: 환경 변수가 없을 때 사용할 값
+    
+    Returns:
+        워커 수 (1 이상)
+    """
+    return max(1, int(os.getenv('GCS_UPLOAD_WORKERS', str(default))))
 
 
-def get_gcs_client() -> storage.Client:
+def guess_content_type(local_file_path: Path) -> str:
     """
-    GCS 클라이언트를 생성합니다.
+    파일 확장자로 Content-Type을 판단합니다.
+    
+    Args:
+        local_file_path: 로컬 파일 경로
     
     Returns:
-        GCS 클라이언트 객체
+        Content-Type 문자열
+    """
+    if local_file_path.suffix == '.json':
+        return 'application/json'
+    if local_file_path.suffix == '.html':
+        return 'text/html'
+    return 'application/octet-stream'
+
+
+class GcsUploadResult:
+    """파일 하나의 GCS 업로드 결과입니다."""
+    
+    __slots__ = ('local_path', 'gcs_path', 'size', 'method', 'success', 'elapsed', 'error')
+    
+    def __init__(self, local_path: Path, gcs_path: str) -> None:
+        self.local_path = local_path
+        self.gcs_path = gcs_path
+        self.size = 0
+        self.method: Optional[str] = None  # 'single' | 'chunked' | 'dry_run'
+        self.success = False
+        self.elapsed = 0.0
+        self.error: Optional[str] = None
+    
+    def to_dict(self) -> Dict:
+        return {
+            'local_path': str(self.local_path),
+            'gcs_uri': f"gs://{GCS_BUCKET_NAME}/{self.gcs_path}",
+            'size': self.size,
+            'method': self.method,
+            'success': self.success,
+            'elapsed': round(self.elapsed, 3),
+            'error': self.error,
+        }
+
+
+class GcsUploadReport:
+    """일괄 업로드 전체 결과입니다 (파일별 결과는 요청 순서 유지)."""
+    
+    def __init__(self) -> None:
+        self.results: List[GcsUploadResult] = []
+        self.workers = 0
+        self.elapsed = 0.0
+    
+    @property
+    def success(self) -> bool:
+        return all(result.success for result in self.results)
+    
+    @property
+    def failed(self) -> List[GcsUploadResult]:
+        return [result for result in self.results if not result.success]
+    
+    @property
+    def bytes_uploaded(self) -> int:
+        return sum(result.size for result in self.results if result.success and result.method != 'dry_run')
+    
+    def to_dict(self) -> Dict:
+        return {
+            'elapsed': round(self.elapsed, 3),
+            'workers': self.workers,
+            'files': len(self.results),
+            'failed': len(self.failed),
+            'bytes_uploaded': self.bytes_uploaded,
+            'results': [result.to_dict() for result in self.results],
+        }
+    
+    def log_summary(self) -> None:
+        """전체 처리량과 실패한 파일을 로그로 남깁니다."""
+        megabytes = self.bytes_uploaded / (1024 * 1024)
+        throughput = megabytes / self.elapsed if self.elapsed > 0 else 0.0
+        logger.info(
+            f"GCS 일괄 업로드: {len(self.results) - len(self.failed)}/{len(self.results)}개 성공, "
+            f"{megabytes:.1f}MB, {self.elapsed:.2f}초 ({throughput:.1f}MB/s, 워커 {self.workers}개)"
+        )
+        for result in self.failed:
+            logger.warning(f"  ❌ {result.local_path} -> gs://{GCS_BUCKET_NAME}/{result.gcs_path}: {result.error}")
+
+
+def _upload_blob(local_file_path: Path, gcs_path: str, content_type: str, size: int, chunk_workers: int) -> str:
+    """
+    파일 하나를 업로드하고 사용한 방식('single' 또는 'chunked')을 반환합니다 (오류는 예외).
     """
-    return storage.Client(project=GCS_PROJECT_ID)
+    blob = get_gcs_bucket(GCS_BUCKET_NAME).blob(gcs_path)
+    if size >= GCS_CHUNKED_UPLOAD_THRESHOLD_BYTES:
+        # Cloud Function에서도 동작하도록 프로세스 대신 스레드로 청크를 업로드
+        transfer_manager.upload_chunks_concurrently(
+            str(local_file_path),
+            blob,
+            content_type=content_type,
+            chunk_size=GCS_UPLOAD_CHUNK_BYTES,
+            worker_type=transfer_manager.THREAD,
+            max_workers=chunk_workers,
+        )
+        return 'chunked'
+    blob.upload_from_filename(str(local_file_path), content_type=content_type)
+    return 'single'
 
 
 def upload_file_to_gcs(
@@ -62,30 +186,98 @@ def upload_file_to_gcs(
         return True
     
     try:
-        client = get_gcs_client()
-        bucket = client.bucket(GCS_BUCKET_NAME)
-        blob = bucket.blob(gcs_path)
-        
-        # Content-Type 자동 판단
-        if content_type is None:
-            if local_file_path.suffix == '.json':
-                content_type = 'application/json'
-            elif local_file_path.suffix == '.html':
-                content_type = 'text/html'
-            else:
-                content_type = 'application/octet-stream'
-        
-        # 파일 업로드
-        blob.upload_from_filename(str(local_file_path), content_type=content_type)
+        # 파일 업로드 (큰 파일은 청크 동시 업로드)
+        _upload_blob(
+            local_file_path, gcs_path, content_type or guess_content_type(local_file_path),
+            local_file_path.stat().st_size, get_gcs_upload_workers(),
+        )
         
         logger.info(f"✅ GCS 업로드 완료: gs://{GCS_BUCKET_NAME}/{gcs_path}")
         return True
         
     except Exception as e:
         logger.error(f"❌ GCS 업로드 실패: {local_file_path} -> gs://{GCS_BUCKET_NAME}/{gcs_path}, 오류: {e}")
+        invalidate_gcs_client(f"GCS 업로드 실패: {e}")
         return False
 
 
+def upload_files_to_gcs(
+    files: Iterable[Tuple[Path, str]],
+    content_type: Optional[str] = None,
+    dry_run: bool = False,
+    max_workers: Optional[int] = None
+) -> GcsUploadReport:
+    """
+    여러 로컬 파일을 워커 풀에서 동시에 GCS에 업로드합니다.
+    
+    모든 워커가 캐시된 GCS 클라이언트/버킷 핸들(src.clients)을 공유하고,
+    큰 파일은 청크 동시 업로드를 사용합니다 (upload_file_to_gcs와 같은 기준).
+    한 파일이 실패해도 나머지 파일은 계속 업로드하며, 결과는 파일별로 GcsUploadReport에 남습니다.
+    
+    Args:
+        files: (로컬 파일 경로, GCS 경로) 목록
+        content_type: Content-Type (None이면 파일 확장자로 자동 판단)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        max_workers: 동시 업로드 파일 수 (None이면 get_gcs_upload_workers())
+    
+    Returns:
+        GcsUploadReport (success, to_dict(), log_summary()로 파일별 결과 확인)
+    """
+    report = GcsUploadReport()
+    report.results = [GcsUploadResult(Path(local_path), gcs_path) for local_path, gcs_path in files]
+    report.workers = max(1, min(max_workers or get_gcs_upload_workers(), len(report.results) or 1))
+    # 청크 업로드 스레드까지 합쳐 워커 수를 크게 넘지 않도록 파일당 청크 동시 업로드 수를 나눔
+    chunk_workers = max(2, (max_workers or get_gcs_upload_workers()) // report.workers)
+    
+    def upload(result: GcsUploadResult) -> None:
+        start = time.perf_counter()
+        try:
+            if not result.local_path.exists():
+                result.error = '파일이 존재하지 않습니다.'
+                return
+            result.size = result.local_path.stat().st_size
+            if dry_run:
+                result.method, result.success = 'dry_run', True
+                return
+            result.method = _upload_blob(
+                result.local_path, result.gcs_path, content_type or guess_content_type(result.local_path),
+                result.size, chunk_workers,
+            )
+            result.success = True
+        except Exception as e:
+            result.error = str(e)
+        finally:
+            result.elapsed = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=report.workers, thread_name_prefix='gcs-upload') as pool:
+        list(pool.map(upload, report.results))
+    report.elapsed = time.perf_counter() - start
+    
+    if any(result.method is not None and not result.success for result in report.results):
+        # 업로드 중 오류가 난 경우에만 클라이언트를 버림 (없는 파일은 클라이언트와 무관)
+        invalidate_gcs_client(f"GCS 일괄 업로드 실패: {len(report.failed)}개")
+    return report
+
+
+def get_chart_data_paths(chart_date: date, sort_key: Optional[str] = None) -> Tuple[Path, str]:
+    """
+    차트 데이터(API 응답 JSON)의 로컬 경로와 GCS 경로를 반환합니다.
+    
+    Args:
+        chart_date: 차트 날짜
+        sort_key: 정렬 키 (None이면 기본 파일)
+    
+    Returns:
+        (로컬 파일 경로, GCS 경로) 튜플
+    """
+    raw_dir = get_raw_html_dir(chart_date)
+    date_str = chart_date.strftime('%Y-%m-%d')
+    if sort_key:
+        return raw_dir / f"webtoon_chart_{sort_key}.json", f"raw_html/{date_str}/sort_{sort_key}/webtoon_chart.json"
+    return raw_dir / "webtoon_chart.json", f"raw_html/{date_str}/webtoon_chart.json"
+
+
 def upload_chart_data_to_gcs(
     chart_date: date,
     sort_key: Optional[str] = None,
@@ -105,34 +297,55 @@ def upload_chart_data_to_gcs(
         성공 여부
     """
     # 파일 경로 찾기
+    default_path, gcs_path = get_chart_data_paths(chart_date, sort_key)
     if json_file_path is None:
-        raw_dir = get_raw_html_dir(chart_date)
-        if sort_key:
-            json_file_path = raw_dir / f"webtoon_chart_{sort_key}.json"
-        else:
-            json_file_path = raw_dir / "webtoon_chart.json"
+        json_file_path = default_path
     
     if not json_file_path.exists():
         logger.warning(f"차트 데이터 파일이 없습니다: {json_file_path}")
         return False
     
-    # GCS 경로 생성
-    date_str = chart_date.strftime('%Y-%m-%d')
-    if sort_key:
-        gcs_path = f"raw_html/{date_str}/sort_{sort_key}/webtoon_chart.json"
-    else:
-        gcs_path = f"raw_html/{date_str}/webtoon_chart.json"
-    
     return upload_file_to_gcs(json_file_path, gcs_path, content_type='application/json', dry_run=dry_run)
 
 
+def upload_chart_data_for_dates(
+    chart_dates: Iterable[date],
+    sort_keys: Optional[list] = None,
+    dry_run: bool = False,
+    max_workers: Optional[int] = None
+) -> GcsUploadReport:
+    """
+    여러 날짜의 정렬 키별 차트 데이터를 한 번의 일괄 업로드(upload_files_to_gcs)로 GCS에 올립니다.
+    
+    Args:
+        chart_dates: 차트 날짜 목록
+        sort_keys: 정렬 키 리스트 (None이면 모든 정렬 옵션 시도)
+        dry_run: True이면 실제 업로드하지 않고 검증만 수행
+        max_workers: 동시 업로드 파일 수 (None이면 get_gcs_upload_workers())
+    
+    Returns:
+        GcsUploadReport (로컬 파일이 없는 정렬 키도 실패로 포함)
+    """
+    from src.extract import SORT_OPTIONS
+    
+    if sort_keys is None:
+        sort_keys = list(SORT_OPTIONS.keys())
+    
+    files = [
+        get_chart_data_paths(chart_date, sort_key)
+        for chart_date in dict.fromkeys(chart_dates)
+        for sort_key in sort_keys
+    ]
+    return upload_files_to_gcs(files, content_type='application/json', dry_run=dry_run, max_workers=max_workers)
+
+
 def upload_all_chart_data_for_date(
     chart_date: date,
     sort_keys: Optional[list] = None,
     dry_run: bool = False
 ) -> bool:
     """
-    특정 날짜의 모든 차트 데이터를 GCS에 업로드합니다.
+    특정 날짜의 모든 차트 데이터를 GCS에 업로드합니다 (정렬 키별 파일을 동시에 업로드).
     
     Args:
         chart_date: 차트 날짜
@@ -142,16 +355,41 @@ def upload_all_chart_data_for_date(
     Returns:
         성공 여부 (모든 파일 업로드 성공 시 True)
     """
-    from src.extract import SORT_OPTIONS
-    
-    if sort_keys is None:
-        sort_keys = list(SORT_OPTIONS.keys())
+    report = upload_chart_data_for_dates([chart_date], sort_keys, dry_run=dry_run)
+    report.log_summary()
+    return report.success
+
+
+def _date_range(start: date, end: date) -> List[date]:
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='차트 데이터 원본 GCS 일괄 업로드 (백필)')
+    parser.add_argument('--start', type=str, required=True, help='시작 날짜 (YYYY-MM-DD)')
+    parser.add_argument('--end', type=str, help='종료 날짜 (YYYY-MM-DD, 기본값: 시작 날짜)')
+    parser.add_argument('--sort-keys', type=str, nargs='+', help='정렬 키 리스트 (기본값: 모든 정렬 옵션)')
+    parser.add_argument('--workers', type=int, help='동시 업로드 파일 수 (기본값: 환경 변수 GCS_UPLOAD_WORKERS 또는 8)')
+    parser.add_argument('--report', type=str, help='파일별 결과를 저장할 JSON 경로')
+    parser.add_argument('--dry-run', action='store_true', help='업로드하지 않고 대상 파일만 확인')
+    args = parser.parse_args()
     
-    all_success = True
-    for sort_key in sort_keys:
-        success = upload_chart_data_to_gcs(chart_date, sort_key=sort_key, dry_run=dry_run)
-        if not success:
-            all_success = False
+    setup_logging()
+    try:
+        start_date = date.fromisoformat(args.start)
+        end_date = date.fromisoformat(args.end) if args.end else start_date
+    except ValueError as e:
+        print(f"잘못된 날짜 형식: {e} (YYYY-MM-DD 형식 사용)")
+        sys.exit(1)
     
-    return all_success
+    upload_report = upload_chart_data_for_dates(
+        _date_range(start_date, end_date), args.sort_keys, dry_run=args.dry_run, max_workers=args.workers
+    )
+    upload_report.log_summary()
+    if args.report:
+        Path(args.report).write_text(
+            json.dumps(upload_report.to_dict(), ensure_ascii=False, indent=2), encoding='utf-8'
+        )
+        logger.info(f"파일별 결과 저장: {args.report}")
+    sys.exit(0 if upload_report.success else 1)
 
@@ -0,0 +1,197 @@
+"""
+warm 인스턴스 캐시 모듈
+
+Cloud Function 인스턴스는 여러 요청을 연속으로 처리하므로(warm 인스턴스),
+모듈 전역에 둔 객체는 다음 호출에서도 그대로 남아 있습니다.
+HTTP 세션, GCS/BigQuery 클라이언트처럼 만들 때 비용이 드는 객체를 TTL과
+헬스 체크를 붙여 전역에 캐시하고, 오류가 나면 버려서 다음 호출에서 새로 만듭니다.
+
+- TTL: 환경 변수 WARM_CACHE_TTL_<NAME>_SECONDS / WARM_CACHE_TTL_SECONDS (0 이하이면 캐시하지 않음)
+- 헬스 체크: 캐시된 값을 돌려주기 전에 확인하고, 실패하면 새로 만듦
+- invalidate(): 값을 사용하다 오류가 나면 호출하여 다음 get()에서 새로 만들도록 함
+
+사용 예:
+    _SESSION_CACHE = WarmCache('http_session', create_session, ttl=1800, close=lambda s: s.close())
+
+    session = _SESSION_CACHE.get()
+    try:
+        ...
+    except Exception:
+        _SESSION_CACHE.invalidate('요청 실패')
+        raise
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils import get_warm_cache_ttl
+
+logger = logging.getLogger(__name__)
+
+
+# 생성된 모든 캐시 (stats/invalidate_all용)
+_REGISTRY: List['WarmCache'] = []
+_REGISTRY_LOCK = threading.Lock()
+
+
+class WarmCache:
+    """TTL과 헬스 체크가 있는 스레드 안전한 단일 값 캐시입니다."""
+
+    def __init__(
+        self,
+        name: str,
+        factory: Optional[Callable[[], Any]] = None,
+        ttl: float = 1800,
+        health_check: Optional[Callable[[Any], bool]] = None,
+        close: Optional[Callable[[Any], None]] = None
+    ) -> None:
+        """
+        Args:
+            name: 캐시 이름 (로그와 TTL 환경 변수 이름에 사용)
+            factory: 값을 만드는 함수 (None이면 put()으로만 채움)
+            ttl: 기본 TTL (초, 환경 변수가 있으면 환경 변수 우선)
+            health_check: 캐시된 값을 받아 계속 써도 되는지 반환하는 함수
+            close: 캐시에서 버려지는 값을 정리하는 함수
+        """
+        self.name = name
+        self.factory = factory
+        self.default_ttl = ttl
+        self.health_check = health_check
+        self.close = close
+
+        self._lock = threading.RLock()
+        self._value: Any = None
+        self._created_at: Optional[float] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+        with _REGISTRY_LOCK:
+            _REGISTRY.append(self)
+
+    @property
+    def ttl(self) -> float:
+        return get_warm_cache_ttl(self.name, self.default_ttl)
+
+    @property
+    def age(self) -> Optional[float]:
+        """캐시된 값이 만들어진 뒤 지난 시간(초, 값이 없으면 None)"""
+        if self._created_at is None:
+            return None
+        return time.monotonic() - self._created_at
+
+    def _is_fresh(self, check: Optional[Callable[[Any], bool]]) -> bool:
+        if self._created_at is None:
+            return False
+        ttl = self.ttl
+        if ttl <= 0 or self.age > ttl:
+            self._discard(f'TTL {ttl:.0f}초 만료')
+            return False
+        for health_check in (self.health_check, check):
+            if health_check is None:
+                continue
+            try:
+                healthy = health_check(self._value)
+            except Exception as e:
+                logger.warning(f"warm 캐시 헬스 체크 오류 ({self.name}): {e}")
+                healthy = False
+            if not healthy:
+                self._discard('헬스 체크 실패')
+                return False
+        return True
+
+    def _discard(self, reason: str) -> None:
+        value, self._value, self._created_at = self._value, None, None
+        self.invalidations += 1
+        logger.info(f"warm 캐시 폐기 ({self.name}): {reason}")
+        if self.close is not None and value is not None:
+            try:
+                self.close(value)
+            except Exception as e:
+                logger.debug(f"warm 캐시 값 정리 실패 ({self.name}): {e}")
+
+    def get(self) -> Any:
+        """
+        캐시된 값을 반환합니다. 없거나 만료/비정상이면 factory로 새로 만듭니다.
+
+        Returns:
+            캐시된 값
+        """
+        with self._lock:
+            if self._is_fresh(None):
+                self.hits += 1
+                return self._value
+            if self.factory is None:
+                raise ValueError(f"warm 캐시 '{self.name}'에 factory가 없습니다.")
+            self.misses += 1
+            value = self.factory()
+            if self.ttl > 0:
+                self._value, self._created_at = value, time.monotonic()
+            return value
+
+    def peek(self, check: Optional[Callable[[Any], bool]] = None) -> Any:
+        """
+        캐시된 값이 유효하면 반환하고, 없거나 만료/비정상이면 None을 반환합니다 (새로 만들지 않음).
+
+        Args:
+            check: 이번 조회에만 추가로 적용할 헬스 체크
+
+        Returns:
+            캐시된 값 또는 None
+        """
+        with self._lock:
+            if self._is_fresh(check):
+                self.hits += 1
+                return self._value
+            self.misses += 1
+            return None
+
+    def put(self, value: Any) -> None:
+        """값을 캐시에 저장합니다 (TTL이 0 이하이면 저장하지 않음)."""
+        with self._lock:
+            previous = self._value
+            if self.ttl > 0:
+                self._value, self._created_at = value, time.monotonic()
+            else:
+                self._value, self._created_at = None, None
+            if self.close is not None and previous is not None and previous is not value:
+                self.close(previous)
+
+    def invalidate(self, reason: str = '오류') -> None:
+        """캐시된 값을 버립니다. 다음 get()에서 새로 만듭니다."""
+        with self._lock:
+            if self._created_at is not None:
+                self._discard(reason)
+
+    def stats(self) -> Dict:
+        age = self.age
+        return {
+            'cached': self._created_at is not None,
+            'age': round(age, 1) if age is not None else None,
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+        }
+
+
+def get_warm_cache_stats() -> Dict[str, Dict]:
+    """
+    모든 warm 캐시의 상태를 반환합니다 (응답/로그용).
+
+    Returns:
+        캐시 이름 → {cached, age, hits, misses, invalidations}
+    """
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY)
+    return {cache.name: cache.stats() for cache in caches}
+
+
+def invalidate_all_warm_caches(reason: str = '오류') -> None:
+    """모든 warm 캐시를 비웁니다 (예상하지 못한 오류 후 다음 호출을 깨끗한 상태로 시작)."""
+    with _REGISTRY_LOCK:
+        caches = list(_REGISTRY)
+    for cache in caches:
+        cache.invalidate(reason)
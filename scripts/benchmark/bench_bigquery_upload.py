@@ -0,0 +1,168 @@
+"""
+BigQuery 업로드 방식 오프라인 벤치마크
+
+local_bigquery.LocalBigQueryClient(DuckDB 또는 SQLite, 이 디렉터리)를 BigQuery 클라이언트 대신 주입하여
+네트워크 없이 fact_weekly_chart 업로드 방식을 비교합니다.
+- per_key: 정렬 키마다 upload_fact_weekly_chart (임시 테이블/load/MERGE가 정렬 키 수만큼)
+- batched: 날짜마다 upload_fact_weekly_charts (정렬 키 전체를 load job 한 번 + MERGE 한 번)
+- graph: upload_to_bigquery (날짜별 적재를 동시에, MERGE는 날짜 순서로 직렬화)
+- arrow: graph와 같되 JSONL 파일 대신 transform이 넘기는 Arrow 배치(TransformRun.fact_batches)를 Parquet으로 적재
+
+방식별로 소요 시간, load/query 작업 수, 처리 바이트 근사치를 출력하고,
+같은 업로드를 한 번 더 실행해 MERGE가 멱등인지(행 수와 내용이 그대로인지)와
+모든 방식의 최종 테이블이 같은지 확인합니다 (다르면 종료 코드 1).
+--validate를 주면 dim_webtoon도 업로드한 뒤 데이터 검증 함수(check_data_collection)의 SQL이
+로컬 대역에서 실행되는지 확인하고 결과를 출력합니다 (합성 데이터에는 weekday가 None인 행이 있어
+검증 실패가 정상이며, 종료 코드에는 반영하지 않음).
+
+사용법:
+    python scripts/benchmark/bench_bigquery_upload.py --days 3 --cards 700 --engine sqlite --validate
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.clients import set_bigquery_client
+from src.models import fact_records_to_arrow_table
+from src.transform import dataframe_to_records, write_jsonl_dataframe
+from src.upload_bigquery import (
+    upload_dim_webtoon,
+    upload_fact_weekly_chart,
+    upload_fact_weekly_charts,
+    upload_to_bigquery,
+)
+from src.utils import get_chart_jsonl_path
+from local_bigquery import LocalBigQueryClient, create_pipeline_tables
+from synthetic import SORT_KEYS, make_dim_webtoon_frame, make_fact_weekly_chart_frame
+
+SYNTHETIC_BASE_DATE = date(2024, 1, 1)
+STRATEGIES = ('per_key', 'batched', 'graph', 'arrow')
+
+
+def write_fact_files(days: int, cards: int) -> tuple:
+    """
+    오늘까지 days일치 정렬 키별 JSONL 파일을 DATA_DIR에 쓰고
+    (날짜 목록, 날짜 → 정렬 키 → Arrow 배치)를 반환합니다 (배치는 TransformRun.fact_batches와 같은 형태).
+    """
+    start_day = (date.today() - SYNTHETIC_BASE_DATE).days - days + 1
+    df = make_fact_weekly_chart_frame(days * len(SORT_KEYS) * cards, start_day=start_day, cards_per_chart=cards)
+    batches = {}
+    for (chart_date, sort_key), group in df.groupby(['chart_date', 'sort_key']):
+        group = group.reset_index(drop=True)
+        write_jsonl_dataframe(group, get_chart_jsonl_path(chart_date, sort_key))
+        batches.setdefault(chart_date, {})[sort_key] = fact_records_to_arrow_table(dataframe_to_records(group), sort_key)
+    return sorted(df['chart_date'].unique()), batches
+
+
+def upload_all(strategy: str, chart_dates: list, fact_batches: dict) -> bool:
+    if strategy == 'per_key':
+        return all(upload_fact_weekly_chart(chart_date, sort_key) for chart_date in chart_dates for sort_key in SORT_KEYS)
+    if strategy == 'graph':
+        return upload_to_bigquery(chart_dates, SORT_KEYS).success
+    if strategy == 'arrow':
+        return upload_to_bigquery(chart_dates, SORT_KEYS, fact_batches=fact_batches).success
+    return all(upload_fact_weekly_charts(chart_date, SORT_KEYS) for chart_date in chart_dates)
+
+
+def snapshot(client: LocalBigQueryClient) -> list:
+    """fact_weekly_chart 전체 행 (비교용, 키 순서로 정렬)"""
+    rows = client.query(
+        "SELECT * FROM `fact_weekly_chart` ORDER BY chart_date, sort_key, webtoon_id"
+    ).result()
+    return [tuple(row) for row in rows]
+
+
+def run_strategy(strategy: str, chart_dates: list, fact_batches: dict, engine: str) -> tuple:
+    client = LocalBigQueryClient(engine=engine)
+    create_pipeline_tables(client)
+    set_bigquery_client(client)
+
+    started = time.perf_counter()
+    ok = upload_all(strategy, chart_dates, fact_batches)
+    elapsed = time.perf_counter() - started
+    first_stats = client.get_stats()
+    first = snapshot(client)
+
+    client.reset_stats()
+    started = time.perf_counter()
+    ok = upload_all(strategy, chart_dates, fact_batches) and ok
+    rerun_elapsed = time.perf_counter() - started
+    rerun_stats = client.get_stats()
+    idempotent = snapshot(client) == first
+
+    print(
+        f"{strategy:>8}  rows={len(first):,}  elapsed={elapsed:7.3f}s  rerun={rerun_elapsed:7.3f}s  "
+        f"load_jobs={first_stats['load_jobs']}  query_jobs={first_stats['query_jobs']}  "
+        f"dry_runs={first_stats['dry_run_queries']}  bytes={first_stats['bytes_processed']:,}  "
+        f"rerun_bytes={rerun_stats['bytes_processed']:,}  idempotent={idempotent}  ok={ok}"
+    )
+    return client, first, ok and idempotent
+
+
+def run_validation(client: LocalBigQueryClient, latest: date, n_webtoons: int) -> bool:
+    """dim_webtoon을 업로드하고 데이터 검증 함수를 로컬 클라이언트로 실행합니다."""
+    dim_df = make_dim_webtoon_frame(n_webtoons)
+    if not upload_dim_webtoon(records=dim_df.to_dict('records'), full=True):
+        return False
+
+    main_path = project_root / 'functions' / 'data_validation_function' / 'main.py'
+    spec = importlib.util.spec_from_file_location('data_validation_main', main_path)
+    validation = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(validation)
+    validation.get_bigquery_client = lambda: client
+
+    results = validation.check_data_collection(latest.isoformat())
+    for name, check in results['checks'].items():
+        print(f"validate  {name}: {check}")
+    for error in results['errors']:
+        print(f"validate  error: {error}")
+    return results['all_passed']
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='BigQuery 업로드 방식 오프라인 벤치마크')
+    parser.add_argument('--days', type=int, default=3, help='날짜 수')
+    parser.add_argument('--cards', type=int, default=700, help='날짜/정렬 키별 행 수')
+    parser.add_argument('--engine', choices=['duckdb', 'sqlite'], default=None, help='SQL 엔진 (기본값: DuckDB가 있으면 DuckDB)')
+    parser.add_argument('--validate', action='store_true', help='데이터 검증 함수도 실행')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    os.environ['BIGQUERY_FACT_INGESTION_MODE'] = 'merge'
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        os.environ['DATA_DIR'] = data_dir
+        chart_dates, fact_batches = write_fact_files(args.days, args.cards)
+
+        passed = True
+        results = {}
+        for strategy in STRATEGIES:
+            client, rows, ok = run_strategy(strategy, chart_dates, fact_batches, args.engine)
+            results[strategy] = rows
+            passed = passed and ok
+
+        same = all(rows == results['per_key'] for rows in results.values())
+        print(f"engine={client.engine}  {' == '.join(STRATEGIES)}: {same}")
+        passed = passed and same
+
+        if args.validate:
+            validated = run_validation(client, chart_dates[-1], args.cards)
+            print(f"validate  all_passed={validated}")
+
+    if not passed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
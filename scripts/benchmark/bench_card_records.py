@@ -0,0 +1,124 @@
+"""
+카드 레코드 메모리/할당 벤치마크
+
+합성 API 응답(기본 100k 카드)을 파싱하여 다음 두 방식의 카드당 메모리와 소요 시간을 비교합니다.
+- 기존 방식: 카드마다 선택 필드를 담은 dict 생성 (비교용으로 재현)
+- 현재 방식: __slots__ 기반 WebtoonCard + 반복 문자열 intern
+
+사용법:
+    python scripts/benchmark/bench_card_records.py --cards 100000
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.parse_api import extract_webtoon_from_api_item
+from synthetic import make_api_payload
+
+
+def legacy_extract(card: dict, rank: int, weekday: str, weekday_rank: int) -> dict:
+    """기존 extract_webtoon_from_api_item의 dict 생성 방식을 재현합니다."""
+    content = card.get('content', {})
+    data = {'rank': rank, 'title': str(content.get('title')), 'webtoon_id': str(card.get('id'))}
+    author_names = [a.get('name') for a in content.get('authors', []) if a.get('type') == 'AUTHOR']
+    if author_names:
+        data['author'] = ', '.join(str(name) for name in author_names if name)
+    genre_list = [g for g in card.get('genreFilters', []) if g != 'all']
+    if genre_list:
+        data['genre'] = genre_list[0]
+    tags = [str(kw).lstrip('#') for kw in content.get('seoKeywords', []) if kw]
+    if tags:
+        data['tags'] = tags
+    if content.get('seoId'):
+        data['seo_id'] = content.get('seoId')
+    if content.get('adult') is not None:
+        data['adult'] = content.get('adult')
+    if content.get('catchphraseTwoLines'):
+        data['catchphrase'] = content.get('catchphraseTwoLines')
+    badges = [b.get('title') for b in content.get('badges', []) if b.get('title')]
+    if badges:
+        data['badges'] = badges
+    if content.get('id') is not None:
+        data['content_id'] = content.get('id')
+    data['view_count'] = int(card['sorting']['views'])
+    data['weekday'] = weekday
+    data['weekday_rank'] = weekday_rank
+    data['_sort_key'] = 'popularity'
+    data['_sort_name'] = '전체 인기순'
+    return data
+
+
+def iter_cards(payload: dict):
+    """(card, weekday, weekday_rank) 튜플을 순서대로 반환합니다."""
+    for data_item in payload['data']:
+        weekday = data_item['_weekday']
+        for card_group in data_item['cardGroups']:
+            for idx, card in enumerate(card_group['cards'], start=1):
+                yield card, weekday, idx
+
+
+def measure(label: str, build, payload: dict, n_cards: int) -> None:
+    """build(payload)가 만든 레코드 리스트의 유지 메모리, 할당 블록 수, 소요 시간을 출력합니다."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    started = time.perf_counter()
+    records = build(payload)
+    elapsed = time.perf_counter() - started
+    after, peak = tracemalloc.get_traced_memory()
+    after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    tracemalloc.stop()
+    retained = after - before
+    print(
+        f"{label:<10} cards={len(records):>8,}  "
+        f"retained={retained / 1024 / 1024:8.1f} MiB  "
+        f"per_card={retained / max(n_cards, 1):7.1f} B  "
+        f"blocks={after_blocks - before_blocks:>10,}  "
+        f"peak={(peak - before) / 1024 / 1024:8.1f} MiB  "
+        f"time={elapsed:6.2f}s"
+    )
+    del records
+
+
+def build_legacy(payload: dict) -> list:
+    return [
+        legacy_extract(card, rank, weekday, weekday_rank)
+        for rank, (card, weekday, weekday_rank) in enumerate(iter_cards(payload), start=1)
+    ]
+
+
+def build_slotted(payload: dict) -> list:
+    records = []
+    for rank, (card, weekday, weekday_rank) in enumerate(iter_cards(payload), start=1):
+        record = extract_webtoon_from_api_item(card, rank=rank, weekday=weekday, weekday_rank=weekday_rank, sort_key='popularity')
+        record.set_sort('popularity', '전체 인기순')
+        records.append(record)
+    return records
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='카드 레코드 메모리 벤치마크')
+    parser.add_argument('--cards', type=int, default=100_000, help='합성 카드 수 (기본값: 100000)')
+    args = parser.parse_args()
+    
+    logging.disable(logging.WARNING)
+    payload = make_api_payload(args.cards)
+    n_cards = sum(1 for _ in iter_cards(payload))
+    print(f"합성 카드 수: {n_cards:,}")
+    
+    measure('dict', build_legacy, payload, n_cards)
+    measure('slotted', build_slotted, payload, n_cards)
+
+
+if __name__ == "__main__":
+    main()
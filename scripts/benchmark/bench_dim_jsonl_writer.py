@@ -0,0 +1,88 @@
+"""
+dim_webtoon JSONL 저장 벤치마크
+
+기존 iterrows 기반 저장 방식(비교용으로 재현)과 현재 컬럼 단위 저장 방식
+(src.transform.write_jsonl_dataframe)의 소요 시간을 비교하고,
+두 방식의 출력이 바이트 단위로 동일한지 확인합니다.
+
+사용법:
+    python scripts/benchmark/bench_dim_jsonl_writer.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.models import DIM_WEBTOON_COLUMNS
+from src.transform import serialize_for_json, write_jsonl_dataframe
+from synthetic import make_dim_webtoon_frame
+
+
+def legacy_write(df: pd.DataFrame, file_path: Path) -> None:
+    """기존 save_dim_webtoon_jsonl의 행 단위 저장 방식을 재현합니다."""
+    df = df[DIM_WEBTOON_COLUMNS].copy()
+    with open(file_path, 'w', encoding='utf-8') as f:
+        for _, row in df.iterrows():
+            record = row.to_dict()
+            if 'created_at' in record and pd.notna(record['created_at']):
+                if isinstance(record['created_at'], pd.Timestamp):
+                    record['created_at'] = record['created_at'].isoformat()
+            if 'updated_at' in record and pd.notna(record['updated_at']):
+                if isinstance(record['updated_at'], pd.Timestamp):
+                    record['updated_at'] = record['updated_at'].isoformat()
+            def convert_value(val):
+                if isinstance(val, list):
+                    return val
+                if pd.isna(val):
+                    return None
+                return val
+            record = {k: convert_value(v) for k, v in record.items()}
+            f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
+
+
+def digest(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='dim_webtoon JSONL 저장 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help='행 수 목록')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in args.sizes:
+            df = make_dim_webtoon_frame(n_rows)
+            legacy_path = Path(tmp_dir) / f'legacy_{n_rows}.jsonl'
+            current_path = Path(tmp_dir) / f'current_{n_rows}.jsonl'
+            
+            started = time.perf_counter()
+            legacy_write(df, legacy_path)
+            legacy_elapsed = time.perf_counter() - started
+            
+            started = time.perf_counter()
+            write_jsonl_dataframe(df[DIM_WEBTOON_COLUMNS], current_path)
+            current_elapsed = time.perf_counter() - started
+            
+            identical = digest(legacy_path) == digest(current_path)
+            print(
+                f"rows={n_rows:>9,}  iterrows={legacy_elapsed:7.2f}s  "
+                f"columnar={current_elapsed:7.2f}s  "
+                f"speedup={legacy_elapsed / max(current_elapsed, 1e-9):5.1f}x  "
+                f"byte_identical={identical}"
+            )
+            if not identical:
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+fact_weekly_chart 병합(중복 제거) 벤치마크
+
+기존 방식(비교용으로 재현: fillna + 문자열 튜플 set + 행 단위 list comprehension)과
+현재 방식(src.transform.merge_fact_weekly_chart: 복합 키 해시 anti-join)의 소요 시간을
+기존 행 수별로 비교합니다.
+
+새 배치는 마지막 날짜의 정렬 옵션 전체(기존과 겹침)와 다음 날짜의 정렬 옵션 전체로 구성합니다.
+현재 방식의 결과는 (chart_date, webtoon_id, weekday, sort_key) 기준 참조 결과와 비교합니다.
+기존 방식은 sort_key를 키에 포함하지 않으므로 정렬 옵션 간 충돌로 행이 누락됩니다.
+
+사용법:
+    python scripts/benchmark/bench_fact_merge.py --sizes 10000 100000 1000000
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.transform import merge_fact_weekly_chart
+from synthetic import SORT_KEYS, make_fact_weekly_chart_frame
+
+CARDS_PER_CHART = 700
+
+
+def legacy_merge(existing_df: pd.DataFrame, new_records: list) -> pd.DataFrame:
+    """기존 merge_fact_weekly_chart의 중복 제거 방식을 재현합니다."""
+    new_df = pd.DataFrame(new_records)
+    existing_df = existing_df.copy()
+    existing_df['weekday'] = existing_df['weekday'].fillna('')
+    new_df['weekday'] = new_df['weekday'].fillna('')
+    
+    existing_combos = set(
+        zip(
+            existing_df['chart_date'].astype(str),
+            existing_df['webtoon_id'].astype(str),
+            existing_df['weekday'].astype(str)
+        )
+    )
+    new_combos = list(
+        zip(
+            new_df['chart_date'].astype(str),
+            new_df['webtoon_id'].astype(str),
+            new_df['weekday'].astype(str)
+        )
+    )
+    new_df_filtered = new_df[[combo not in existing_combos for combo in new_combos]]
+    return pd.concat([existing_df, new_df_filtered], ignore_index=True)
+
+
+def reference_added(existing_df: pd.DataFrame, new_records: list) -> int:
+    """(chart_date, webtoon_id, weekday, sort_key) 기준으로 추가되어야 할 행 수"""
+    def key(r):
+        return (str(r['chart_date']), r['webtoon_id'], r['weekday'] or '', r['sort_key'] or '')
+    
+    existing_keys = {key(r) for r in existing_df[['chart_date', 'webtoon_id', 'weekday', 'sort_key']].to_dict('records')}
+    return sum(1 for r in new_records if key(r) not in existing_keys)
+
+
+def make_new_batch(n_existing: int) -> list:
+    """마지막 날짜(기존과 겹침)와 다음 날짜의 모든 정렬 옵션 레코드"""
+    charts_per_day = len(SORT_KEYS)
+    last_day = (n_existing - 1) // CARDS_PER_CHART // charts_per_day
+    batch = make_fact_weekly_chart_frame(
+        2 * charts_per_day * CARDS_PER_CHART, seed=7, start_day=last_day, cards_per_chart=CARDS_PER_CHART
+    )
+    return batch.to_dict('records')
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='fact_weekly_chart 병합 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000], help='기존 행 수 목록')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    
+    for n_rows in args.sizes:
+        existing_df = make_fact_weekly_chart_frame(n_rows, cards_per_chart=CARDS_PER_CHART)
+        new_records = make_new_batch(n_rows)
+        expected_added = reference_added(existing_df, new_records)
+        
+        started = time.perf_counter()
+        legacy_df = legacy_merge(existing_df, new_records)
+        legacy_elapsed = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        current_df = merge_fact_weekly_chart(existing_df, new_records, new_records[0]['chart_date'])
+        current_elapsed = time.perf_counter() - started
+        
+        current_added = len(current_df) - n_rows
+        print(
+            f"existing={n_rows:>9,}  new={len(new_records):,}  "
+            f"legacy={legacy_elapsed:7.3f}s  hashed={current_elapsed:7.3f}s  "
+            f"speedup={legacy_elapsed / max(current_elapsed, 1e-9):5.1f}x  "
+            f"added: expected={expected_added:,} hashed={current_added:,} legacy={len(legacy_df) - n_rows:,}"
+        )
+        if current_added != expected_added:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
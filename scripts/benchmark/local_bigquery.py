@@ -0,0 +1,737 @@
+"""
+로컬 BigQuery 대역 모듈
+
+네트워크 없이 BigQuery 업로드(src/upload_bigquery.py)와 데이터 검증 SQL
+(functions/data_validation_function/main.py)을 실행할 수 있도록, 내장 SQL 엔진 위에서
+파이프라인이 사용하는 BigQuery 클라이언트 API 일부를 흉내 냅니다.
+- 엔진: DuckDB (설치되어 있으면) 또는 SQLite (표준 라이브러리)
+- 지원 API: create_table, get_table, delete_table, load_table_from_file(NDJSON, Parquet),
+  load_table_from_json, query (SELECT, 파이프라인의 MERGE, dry run)
+- 작업 수(load/query/dry run)와 처리 바이트 수(근사치)를 기록 (get_stats)
+
+BigQuery SQL은 파이프라인이 실제로 쓰는 문법만 변환합니다
+(백틱 테이블 ID, CAST 타입, DATE 리터럴, COUNTIF, CURRENT_DATE/DATE_SUB, TO_JSON_STRING,
+MERGE와 WHEN MATCHED AND 조건).
+DATE/TIMESTAMP는 ISO 문자열(TIMESTAMP는 UTC, '+00:00' 포함)로, REPEATED 컬럼은 JSON 문자열로 저장합니다
+(그래서 REPEATED 컬럼의 TO_JSON_STRING은 컬럼 값 그대로).
+
+처리 바이트 수는 BigQuery 과금 규칙을 단순화한 근사치입니다.
+쿼리가 참조하는 테이블의 모든 컬럼 크기(STRING은 길이 + 2, 숫자/날짜는 8, BOOLEAN은 1)를 더하고,
+파티션 컬럼에 상수 조건(= 또는 IN)이 있으면 해당 파티션 행만 셉니다.
+
+사용 예:
+    client = LocalBigQueryClient()
+    create_pipeline_tables(client)
+    set_bigquery_client(client)  # src.clients
+    upload_fact_weekly_charts(chart_date, sort_keys)
+    print(client.get_stats())
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from src.utils import LazyModule, is_module_available
+
+logger = logging.getLogger(__name__)
+
+duckdb = LazyModule('duckdb')
+pq = LazyModule('pyarrow.parquet')
+
+
+# BigQuery 타입 → 로컬 컬럼 타입 (SQLite와 DuckDB 모두에서 같은 의미가 되도록 선택)
+LOCAL_COLUMN_TYPES = {
+    'STRING': 'VARCHAR',
+    'DATE': 'VARCHAR',
+    'TIMESTAMP': 'VARCHAR',
+    'INTEGER': 'BIGINT',
+    'INT64': 'BIGINT',
+    'FLOAT': 'DOUBLE',
+    'FLOAT64': 'DOUBLE',
+    'BOOLEAN': 'BOOLEAN',
+    'BOOL': 'BOOLEAN',
+}
+
+# CAST(x AS <BigQuery 타입>) → 로컬 타입
+CAST_TYPES = {
+    'STRING': 'VARCHAR',
+    'DATE': 'VARCHAR',
+    'TIMESTAMP': 'VARCHAR',
+    'INT64': 'BIGINT',
+    'INTEGER': 'BIGINT',
+    'FLOAT64': 'DOUBLE',
+    'BOOLEAN': 'BOOLEAN',
+    'BOOL': 'BOOLEAN',
+}
+
+# 처리 바이트 근사치 계산용 고정 크기 타입 (STRING/REPEATED는 길이 기반)
+FIXED_TYPE_BYTES = {'INTEGER': 8, 'INT64': 8, 'FLOAT': 8, 'FLOAT64': 8, 'DATE': 8, 'TIMESTAMP': 8, 'BOOLEAN': 1, 'BOOL': 1}
+
+# MERGE USING 절을 담아 둘 임시 테이블 이름
+_MERGE_SOURCE_TABLE = '__merge_source'
+
+
+class LocalSchemaField:
+    """bigquery.SchemaField의 name/field_type/mode만 가진 대역입니다."""
+
+    __slots__ = ('name', 'field_type', 'mode')
+
+    def __init__(self, name: str, field_type: str, mode: str = 'NULLABLE') -> None:
+        self.name = name
+        self.field_type = field_type.upper()
+        self.mode = (mode or 'NULLABLE').upper()
+
+    def __repr__(self) -> str:
+        return f"LocalSchemaField({self.name!r}, {self.field_type!r}, {self.mode!r})"
+
+
+class LocalTable:
+    """get_table이 반환하는 테이블 정보입니다."""
+
+    def __init__(self, table_id: str, schema: List[LocalSchemaField], partition_field: Optional[str] = None) -> None:
+        self.table_id = table_id
+        self.schema = schema
+        self.partition_field = partition_field
+        self.num_rows = 0
+
+
+class LocalRow:
+    """bigquery.Row처럼 속성, 이름, 위치로 값을 꺼낼 수 있는 결과 행입니다."""
+
+    __slots__ = ('_values', '_index')
+
+    def __init__(self, values: Sequence[Any], index: Dict[str, int]) -> None:
+        self._values = tuple(values)
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._values[self._index[name]]
+        except KeyError:
+            raise AttributeError(name)
+
+    def __getitem__(self, key: Union[int, str]) -> Any:
+        if isinstance(key, str):
+            return self._values[self._index[key]]
+        return self._values[key]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def keys(self) -> List[str]:
+        return list(self._index)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(name, self._values[i]) for name, i in self._index.items()]
+
+    def __repr__(self) -> str:
+        return f"LocalRow({dict(self.items())})"
+
+
+class LocalJob:
+    """load/query 작업 결과입니다 (result()는 즉시 반환)."""
+
+    def __init__(
+        self,
+        job_type: str,
+        rows: Optional[List[LocalRow]] = None,
+        total_bytes_processed: int = 0,
+        output_rows: int = 0,
+        num_dml_affected_rows: Optional[int] = None
+    ) -> None:
+        self.job_type = job_type
+        self.rows = rows or []
+        self.total_bytes_processed = total_bytes_processed
+        self.output_rows = output_rows
+        self.num_dml_affected_rows = num_dml_affected_rows
+        self.state = 'DONE'
+
+    def result(self) -> Any:
+        return self.rows if self.job_type == 'query' else self
+
+
+class LocalBigQueryClient:
+    """
+    내장 SQL 엔진 위의 BigQuery 클라이언트 대역입니다.
+    테이블 이름은 ID의 마지막 부분(project.dataset.<table>)만 사용합니다.
+    """
+
+    def __init__(
+        self,
+        database: Union[str, Path] = ':memory:',
+        project: Optional[str] = None,
+        engine: Optional[str] = None
+    ) -> None:
+        """
+        Args:
+            database: 데이터베이스 파일 경로 (기본값: 메모리)
+            project: project 속성 값 (None이면 src.clients.BIGQUERY_PROJECT_ID)
+            engine: 'duckdb' 또는 'sqlite' (None이면 DuckDB가 설치되어 있으면 DuckDB)
+        """
+        if project is None:
+            from src.clients import BIGQUERY_PROJECT_ID
+            project = BIGQUERY_PROJECT_ID
+        if engine is None:
+            engine = 'duckdb' if is_module_available('duckdb') else 'sqlite'
+        self.project = project
+        self.engine = engine
+        if engine == 'duckdb':
+            self._conn = duckdb.connect(str(database))
+        else:
+            self._conn = sqlite3.connect(str(database), check_same_thread=False, isolation_level=None)
+        self._lock = threading.RLock()
+        self._tables: Dict[str, LocalTable] = {}
+        self.stats = {
+            'load_jobs': 0,
+            'query_jobs': 0,
+            'dry_run_queries': 0,
+            'rows_loaded': 0,
+            'bytes_processed': 0,
+            'tables_created': 0,
+            'tables_deleted': 0,
+        }
+
+    # ------------------------------------------------------------------ 테이블
+
+    @staticmethod
+    def _table_name(table: Any) -> str:
+        table_id = table if isinstance(table, str) else getattr(table, 'table_id', str(table))
+        return str(table_id).split('.')[-1]
+
+    def create_table(self, table: Any, exists_ok: bool = False) -> LocalTable:
+        """
+        테이블을 만듭니다.
+
+        Args:
+            table: bigquery.Table (schema, time_partitioning 사용) 또는 LocalTable
+            exists_ok: 이미 있으면 무시
+
+        Returns:
+            LocalTable
+        """
+        name = self._table_name(table)
+        schema = [
+            LocalSchemaField(field.name, field.field_type, field.mode) for field in getattr(table, 'schema', [])
+        ]
+        partitioning = getattr(table, 'time_partitioning', None)
+        partition_field = getattr(table, 'partition_field', None) or getattr(partitioning, 'field', None)
+        with self._lock:
+            if name in self._tables:
+                if exists_ok:
+                    return self._tables[name]
+                from google.api_core.exceptions import Conflict
+                raise Conflict(f"Already Exists: Table {name}")
+            columns = ', '.join(f'"{field.name}" {self._column_type(field)}' for field in schema)
+            self._conn.execute(f'CREATE TABLE "{name}" ({columns})')
+            self._tables[name] = LocalTable(name, schema, partition_field)
+            self.stats['tables_created'] += 1
+            return self._tables[name]
+
+    def create_local_table(
+        self,
+        table_id: str,
+        fields: List[Tuple[str, str, str]],
+        partition_field: Optional[str] = None
+    ) -> LocalTable:
+        """
+        (컬럼명, 타입, 모드) 목록으로 테이블을 만듭니다 (이미 있으면 그대로 사용).
+
+        Args:
+            table_id: 테이블 ID
+            fields: (컬럼명, 타입, 모드) 목록
+            partition_field: 파티션 컬럼 (처리 바이트 근사치 계산용)
+
+        Returns:
+            LocalTable
+        """
+        table = LocalTable(table_id, [LocalSchemaField(*field) for field in fields], partition_field)
+        return self.create_table(table, exists_ok=True)
+
+    def get_table(self, table: Any) -> LocalTable:
+        """테이블 정보를 반환합니다 (없으면 NotFound)."""
+        name = self._table_name(table)
+        with self._lock:
+            if name not in self._tables:
+                from google.api_core.exceptions import NotFound
+                raise NotFound(f"Not found: Table {name}")
+            local_table = self._tables[name]
+            local_table.num_rows = self._conn.execute(f'SELECT COUNT(*) FROM "{name}"').fetchone()[0]
+            return local_table
+
+    def delete_table(self, table: Any, not_found_ok: bool = False) -> None:
+        """테이블을 삭제합니다."""
+        name = self._table_name(table)
+        with self._lock:
+            if name not in self._tables:
+                if not_found_ok:
+                    return
+                from google.api_core.exceptions import NotFound
+                raise NotFound(f"Not found: Table {name}")
+            self._conn.execute(f'DROP TABLE "{name}"')
+            del self._tables[name]
+            self.stats['tables_deleted'] += 1
+
+    def _column_type(self, field: LocalSchemaField) -> str:
+        if field.mode == 'REPEATED':
+            return 'VARCHAR'
+        return LOCAL_COLUMN_TYPES.get(field.field_type, 'VARCHAR')
+
+    # ------------------------------------------------------------------ 적재
+
+    def load_table_from_file(
+        self,
+        file_obj: IO[bytes],
+        destination: Any,
+        rewind: bool = False,
+        job_config: Any = None,
+        **kwargs: Any
+    ) -> LocalJob:
+        """
+        NDJSON 또는 Parquet 파일 객체를 테이블에 적재합니다
+        (source_format은 NEWLINE_DELIMITED_JSON, PARQUET만 지원, Parquet 컬럼은 이름으로 대응).
+
+        Args:
+            file_obj: NDJSON/Parquet 바이너리 파일 객체
+            destination: 대상 테이블 ID
+            rewind: True이면 처음부터 읽음
+            job_config: bigquery.LoadJobConfig (write_disposition, ignore_unknown_values 사용)
+
+        Returns:
+            LocalJob
+        """
+        source_format = getattr(job_config, 'source_format', None)
+        if source_format not in (None, 'NEWLINE_DELIMITED_JSON', 'PARQUET'):
+            raise NotImplementedError(f"로컬 BigQuery 대역은 {source_format} 적재를 지원하지 않습니다.")
+        if rewind:
+            file_obj.seek(0)
+        if source_format == 'PARQUET':
+            rows = pq.read_table(file_obj).to_pylist()
+        else:
+            rows = (json.loads(line) for line in file_obj if line.strip())
+        return self._load_rows(rows, destination, job_config)
+
+    def load_table_from_json(self, json_rows: Iterable[Dict], destination: Any, job_config: Any = None, **kwargs: Any) -> LocalJob:
+        """
+        dict 리스트를 테이블에 적재합니다.
+
+        Args:
+            json_rows: 레코드 리스트
+            destination: 대상 테이블 ID
+            job_config: bigquery.LoadJobConfig
+
+        Returns:
+            LocalJob
+        """
+        return self._load_rows(json_rows, destination, job_config)
+
+    def _load_rows(self, rows: Iterable[Dict], destination: Any, job_config: Any) -> LocalJob:
+        name = self._table_name(destination)
+        with self._lock:
+            if name not in self._tables:
+                create_disposition = getattr(job_config, 'create_disposition', None)
+                schema = getattr(job_config, 'schema', None)
+                if create_disposition == 'CREATE_NEVER' or not schema:
+                    from google.api_core.exceptions import NotFound
+                    raise NotFound(f"Not found: Table {name}")
+                self.create_table(LocalTable(name, [LocalSchemaField(f.name, f.field_type, f.mode) for f in schema]))
+            table = self._tables[name]
+            ignore_unknown = bool(getattr(job_config, 'ignore_unknown_values', False))
+            columns = [field.name for field in table.schema]
+            values = []
+            for line_number, row in enumerate(rows, 1):
+                unknown = set(row) - set(columns)
+                if unknown and not ignore_unknown:
+                    raise ValueError(f"라인 {line_number}: 스키마에 없는 컬럼 {sorted(unknown)}")
+                values.append(tuple(
+                    self._to_local_value(row.get(field.name), field, line_number) for field in table.schema
+                ))
+
+            self._conn.execute('BEGIN')
+            try:
+                if getattr(job_config, 'write_disposition', None) == 'WRITE_TRUNCATE':
+                    self._conn.execute(f'DELETE FROM "{name}"')
+                if values:
+                    placeholders = ', '.join('?' for _ in columns)
+                    column_list = ', '.join(f'"{column}"' for column in columns)
+                    self._conn.executemany(f'INSERT INTO "{name}" ({column_list}) VALUES ({placeholders})', values)
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self.stats['load_jobs'] += 1
+            self.stats['rows_loaded'] += len(values)
+            return LocalJob('load', output_rows=len(values))
+
+    @staticmethod
+    def _to_local_value(value: Any, field: LocalSchemaField, line_number: int) -> Any:
+        """BigQuery 적재 규칙에 맞춰 값을 검증/변환합니다 (변환할 수 없으면 ValueError)."""
+        if field.mode == 'REPEATED':
+            if value is None:
+                return json.dumps([])
+            if not isinstance(value, list):
+                raise ValueError(f"라인 {line_number}: {field.name}은 배열이어야 합니다: {value!r}")
+            return json.dumps(value, ensure_ascii=False)
+        if value is None:
+            if field.mode == 'REQUIRED':
+                raise ValueError(f"라인 {line_number}: 필수 컬럼 {field.name}이 없습니다.")
+            return None
+        try:
+            field_type = field.field_type
+            if field_type in ('INTEGER', 'INT64'):
+                if isinstance(value, float) and not value.is_integer():
+                    raise ValueError(value)
+                return int(value)
+            if field_type in ('FLOAT', 'FLOAT64'):
+                return float(value)
+            if field_type in ('BOOLEAN', 'BOOL'):
+                if isinstance(value, str):
+                    if value.lower() not in ('true', 'false'):
+                        raise ValueError(value)
+                    return value.lower() == 'true'
+                return bool(value)
+            if field_type == 'DATE':
+                return date.fromisoformat(str(value)[:10]).isoformat()
+            if field_type == 'TIMESTAMP':
+                return normalize_timestamp(value)
+            return value if isinstance(value, str) else str(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"라인 {line_number}: {field.name}({field.field_type}) 값을 변환할 수 없습니다: {value!r}")
+
+    # ------------------------------------------------------------------ 쿼리
+
+    def query(self, query: str, job_config: Any = None, **kwargs: Any) -> LocalJob:
+        """
+        BigQuery 표준 SQL을 로컬 엔진용으로 변환해 실행합니다.
+        job_config.dry_run이면 실행하지 않고 처리 바이트 근사치만 계산합니다.
+
+        Args:
+            query: SQL (SELECT 또는 파이프라인의 MERGE)
+            job_config: bigquery.QueryJobConfig (dry_run만 사용)
+
+        Returns:
+            LocalJob (result()는 LocalRow 리스트)
+        """
+        with self._lock:
+            bytes_processed = self.estimate_bytes_processed(query)
+            if getattr(job_config, 'dry_run', False):
+                self.stats['dry_run_queries'] += 1
+                return LocalJob('query', total_bytes_processed=bytes_processed)
+
+            statement = translate_sql(query)
+            if re.match(r'\s*MERGE\b', statement, re.IGNORECASE):
+                rows, affected = [], self._execute_merge(statement)
+            else:
+                cursor = self._conn.execute(statement)
+                names = [column[0] for column in cursor.description or []]
+                index = {name: i for i, name in enumerate(names)}
+                rows, affected = [LocalRow(values, index) for values in cursor.fetchall()], None
+            self.stats['query_jobs'] += 1
+            self.stats['bytes_processed'] += bytes_processed
+            return LocalJob('query', rows, total_bytes_processed=bytes_processed, num_dml_affected_rows=affected)
+
+    def _execute_merge(self, statement: str) -> int:
+        """MERGE를 임시 테이블 + UPDATE ... FROM + INSERT ... WHERE NOT EXISTS로 실행합니다."""
+        merge = parse_merge(statement)
+        target = f"{merge['target']} AS {merge['target_alias']}"
+        source = f"{_MERGE_SOURCE_TABLE} AS {merge['source_alias']}"
+        affected = 0
+        self._conn.execute('BEGIN')
+        try:
+            self._conn.execute(f"CREATE TEMP TABLE {_MERGE_SOURCE_TABLE} AS {merge['source']}")
+            if merge['update']:
+                # 대상 테이블의 MERGE 전 상태로 일치 여부를 판단 (UPDATE는 조인 키를 바꾸지 않음)
+                condition = f" AND ({merge['update_condition']})" if merge['update_condition'] else ''
+                cursor = self._conn.execute(
+                    f"UPDATE {target} SET {merge['update']} FROM {source} WHERE {merge['on']}{condition}"
+                )
+                affected += self._affected_rows(cursor)
+            if merge['insert_columns']:
+                cursor = self._conn.execute(
+                    f"INSERT INTO {merge['target']} ({merge['insert_columns']}) "
+                    f"SELECT {merge['insert_values']} FROM {source} "
+                    f"WHERE NOT EXISTS (SELECT 1 FROM {target} WHERE {merge['on']})"
+                )
+                affected += self._affected_rows(cursor)
+            self._conn.execute(f"DROP TABLE {_MERGE_SOURCE_TABLE}")
+            self._conn.execute('COMMIT')
+        except Exception:
+            self._conn.execute('ROLLBACK')
+            raise
+        return affected
+
+    def _affected_rows(self, cursor: Any) -> int:
+        # DuckDB는 DML 결과로 변경 행 수 한 행을 반환하고, SQLite는 rowcount에 기록
+        if self.engine == 'duckdb':
+            row = cursor.fetchone()
+            return int(row[0]) if row else 0
+        return max(cursor.rowcount or 0, 0)
+
+    def estimate_bytes_processed(self, query: str) -> int:
+        """
+        쿼리가 참조하는 테이블의 처리 바이트 근사치를 계산합니다.
+
+        Args:
+            query: BigQuery SQL
+
+        Returns:
+            바이트 수
+        """
+        total = 0
+        for name in dict.fromkeys(self._table_name(table_id) for table_id in re.findall(r'`([^`]+)`', query)):
+            table = self._tables.get(name)
+            if table is None or not table.schema:
+                continue
+            sizes = []
+            for field in table.schema:
+                if field.mode == 'REPEATED' or field.field_type == 'STRING':
+                    sizes.append(f'COALESCE(LENGTH("{field.name}") + 2, 0)')
+                else:
+                    size = FIXED_TYPE_BYTES.get(field.field_type, 8)
+                    sizes.append(f'(CASE WHEN "{field.name}" IS NULL THEN 0 ELSE {size} END)')
+            where = ''
+            partitions = find_partition_values(query, table.partition_field) if table.partition_field else None
+            if partitions:
+                where = f""" WHERE "{table.partition_field}" IN ({', '.join(f"'{value}'" for value in partitions)})"""
+            size = self._conn.execute(f'SELECT SUM({" + ".join(sizes)}) FROM "{name}"{where}').fetchone()[0]
+            total += int(size or 0)
+        return total
+
+    def get_stats(self) -> Dict[str, int]:
+        """작업 수, 적재 행 수, 처리 바이트 근사치를 반환합니다."""
+        with self._lock:
+            return dict(self.stats)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for key in self.stats:
+                self.stats[key] = 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def normalize_timestamp(value: Any) -> str:
+    """
+    TIMESTAMP 값을 UTC ISO 문자열로 변환합니다 (시간대가 없으면 BigQuery와 같이 UTC로 해석).
+
+    Args:
+        value: datetime, ISO 문자열 또는 epoch 초
+
+    Returns:
+        'YYYY-MM-DD HH:MM:SS.ffffff+00:00' 형식 문자열
+    """
+    if isinstance(value, (int, float)):
+        value = datetime.fromtimestamp(value, tz=timezone.utc)
+    elif isinstance(value, str):
+        value = datetime.fromisoformat(value.strip().replace('Z', '+00:00').replace('T', ' '))
+    elif isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f+00:00')
+
+
+def find_partition_values(query: str, partition_field: str) -> Optional[List[str]]:
+    """
+    쿼리에서 파티션 컬럼의 상수 조건(= 또는 IN) 값을 찾습니다.
+
+    Args:
+        query: BigQuery SQL
+        partition_field: 파티션 컬럼 이름
+
+    Returns:
+        날짜 문자열 리스트 (상수 조건이 없으면 None → 전체 파티션)
+    """
+    pattern = re.compile(
+        rf"\b{re.escape(partition_field)}\s*(?:=\s*((?:DATE\s*)?'[^']*')|IN\s*\(([^)]*)\))",
+        re.IGNORECASE,
+    )
+    values = []
+    for match in pattern.finditer(query):
+        values.extend(re.findall(r"'(\d{4}-\d{2}-\d{2})'", match.group(1) or match.group(2)))
+    return sorted(set(values)) or None
+
+
+# ---------------------------------------------------------------------- SQL 변환
+
+def _split_string_literals(query: str) -> List[Tuple[bool, str]]:
+    """SQL을 (문자열 리터럴 여부, 조각) 리스트로 나눕니다 (BigQuery의 \\' 이스케이프 처리)."""
+    parts, i, start = [], 0, 0
+    while i < len(query):
+        if query[i] == "'":
+            if start < i:
+                parts.append((False, query[start:i]))
+            j, chars = i + 1, []
+            while j < len(query):
+                if query[j] == '\\' and j + 1 < len(query):
+                    chars.append(query[j + 1])
+                    j += 2
+                    continue
+                if query[j] == "'":
+                    if j + 1 < len(query) and query[j + 1] == "'":
+                        chars.append("'")
+                        j += 2
+                        continue
+                    break
+                chars.append(query[j])
+                j += 1
+            parts.append((True, ''.join(chars)))
+            i = start = j + 1
+            continue
+        i += 1
+    if start < len(query):
+        parts.append((False, query[start:]))
+    return parts
+
+
+def _find_closing_paren(text: str, open_index: int) -> int:
+    depth = 0
+    for i in range(open_index, len(text)):
+        if text[i] == '(':
+            depth += 1
+        elif text[i] == ')':
+            depth -= 1
+            if depth == 0:
+                return i
+    raise ValueError(f"괄호가 닫히지 않았습니다: {text[open_index:open_index + 80]}")
+
+
+def _replace_countif(code: str) -> str:
+    while True:
+        match = re.search(r'\bCOUNTIF\s*\(', code, re.IGNORECASE)
+        if match is None:
+            return code
+        open_index = match.end() - 1
+        close_index = _find_closing_paren(code, open_index)
+        condition = code[open_index + 1:close_index]
+        code = f"{code[:match.start()]}SUM(CASE WHEN {condition} THEN 1 ELSE 0 END){code[close_index + 1:]}"
+
+
+def _replace_date_functions(query: str) -> str:
+    """CURRENT_DATE()와 상수 날짜에 대한 DATE_SUB/DATE_ADD를 DATE 리터럴로 계산합니다."""
+    today = date.today()
+    query = re.sub(r'\bCURRENT_DATE\s*\(\s*\)', f"DATE '{today.isoformat()}'", query, flags=re.IGNORECASE)
+    query = re.sub(
+        r'\bCURRENT_TIMESTAMP\s*\(\s*\)',
+        f"'{normalize_timestamp(datetime.now(timezone.utc))}'", query, flags=re.IGNORECASE,
+    )
+
+    def shift(match: 're.Match') -> str:
+        base = date.fromisoformat(match.group(2))
+        days = int(match.group(3)) * (-1 if match.group(1).upper() == 'DATE_SUB' else 1)
+        return f"DATE '{(base + timedelta(days=days)).isoformat()}'"
+
+    return re.sub(
+        r"\b(DATE_SUB|DATE_ADD)\s*\(\s*DATE\s*'(\d{4}-\d{2}-\d{2})'\s*,\s*INTERVAL\s+(\d+)\s+DAY\s*\)",
+        shift, query, flags=re.IGNORECASE,
+    )
+
+
+def translate_sql(query: str) -> str:
+    """
+    파이프라인이 쓰는 BigQuery 표준 SQL을 SQLite/DuckDB 공통 SQL로 변환합니다.
+
+    Args:
+        query: BigQuery SQL
+
+    Returns:
+        로컬 엔진용 SQL
+    """
+    query = _replace_date_functions(query)
+    translated = []
+    for is_literal, part in _split_string_literals(query):
+        if is_literal:
+            # DATE '...' 리터럴 → 문자열 (DATE는 ISO 문자열로 저장)
+            if translated:
+                translated[-1] = re.sub(r'\bDATE\s*$', '', translated[-1], flags=re.IGNORECASE)
+            translated.append("'" + part.replace("'", "''") + "'")
+            continue
+        # `project.dataset.table` → "table"
+        part = re.sub(r'`([^`]+)`', lambda m: '"' + m.group(1).split('.')[-1] + '"', part)
+        part = re.sub(
+            r'\bAS\s+(' + '|'.join(CAST_TYPES) + r')\s*\)',
+            lambda m: f"AS {CAST_TYPES[m.group(1).upper()]})", part, flags=re.IGNORECASE,
+        )
+        part = _replace_countif(part)
+        # REPEATED 컬럼은 이미 JSON 문자열로 저장되어 있음
+        part = re.sub(r'\bTO_JSON_STRING\s*\(', '(', part, flags=re.IGNORECASE)
+        translated.append(part)
+    return ''.join(translated)
+
+
+def parse_merge(statement: str) -> Dict[str, str]:
+    """
+    변환된 MERGE 문을 대상/USING/ON/UPDATE/INSERT 부분으로 나눕니다.
+
+    Args:
+        statement: translate_sql을 거친 MERGE 문
+
+    Returns:
+        target, target_alias, source, source_alias, on, update_condition, update, insert_columns, insert_values
+    """
+    match = re.match(r'\s*MERGE\s+(?:INTO\s+)?("[^"]+"|\w+)\s+(?:AS\s+)?(\w+)\s+USING\s+', statement, re.IGNORECASE)
+    if match is None:
+        raise ValueError(f"지원하지 않는 MERGE 문입니다: {statement[:200]}")
+    target, target_alias = match.group(1), match.group(2)
+    rest = statement[match.end():]
+    if rest.startswith('('):
+        close_index = _find_closing_paren(rest, 0)
+        source, rest = rest[1:close_index], rest[close_index + 1:]
+    else:
+        table_match = re.match(r'("[^"]+"|\w+)', rest)
+        source, rest = f"SELECT * FROM {table_match.group(1)}", rest[table_match.end():]
+    match = re.match(r'\s*(?:AS\s+)?(\w+)\s+ON\s+(.*?)\s+(WHEN\s+.*)$', rest, re.IGNORECASE | re.DOTALL)
+    if match is None:
+        raise ValueError(f"MERGE 문의 ON/WHEN 절을 찾을 수 없습니다: {rest[:200]}")
+    source_alias, on, clauses = match.groups()
+
+    update = re.search(
+        r'WHEN\s+MATCHED\s+(?:AND\s+(.*?)\s+)?THEN\s+UPDATE\s+SET\s+(.*?)(?=\s+WHEN\s+|\s*$)',
+        clauses, re.IGNORECASE | re.DOTALL,
+    )
+    insert = re.search(r'WHEN\s+NOT\s+MATCHED\s+THEN\s+INSERT\s*\(', clauses, re.IGNORECASE)
+    insert_columns = insert_values = ''
+    if insert is not None:
+        columns_close = _find_closing_paren(clauses, insert.end() - 1)
+        insert_columns = clauses[insert.end():columns_close]
+        values_match = re.match(r'\s*VALUES\s*\(', clauses[columns_close + 1:], re.IGNORECASE)
+        values_open = columns_close + 1 + values_match.end() - 1
+        insert_values = clauses[values_open + 1:_find_closing_paren(clauses, values_open)]
+    return {
+        'target': target,
+        'target_alias': target_alias,
+        'source': source,
+        'source_alias': source_alias,
+        'on': on,
+        'update_condition': (update.group(1) or '').strip() if update else '',
+        'update': update.group(2).strip() if update else '',
+        'insert_columns': insert_columns.strip(),
+        'insert_values': insert_values.strip(),
+    }
+
+
+def create_pipeline_tables(client: LocalBigQueryClient) -> None:
+    """
+    파이프라인 테이블(dim_webtoon, fact_weekly_chart)을 scripts/setup/setup_bigquery.sql과 같은 스키마로 만듭니다.
+
+    Args:
+        client: LocalBigQueryClient
+    """
+    from src.upload_bigquery import (
+        BIGQUERY_DATASET_ID,
+        DIM_WEBTOON_BQ_FIELDS,
+        FACT_SORT_KEY_BQ_FIELD,
+        FACT_WEEKLY_CHART_BQ_FIELDS,
+    )
+
+    dataset = f"{client.project}.{BIGQUERY_DATASET_ID}"
+    client.create_local_table(f"{dataset}.dim_webtoon", DIM_WEBTOON_BQ_FIELDS)
+    client.create_local_table(
+        f"{dataset}.fact_weekly_chart", FACT_WEEKLY_CHART_BQ_FIELDS + [FACT_SORT_KEY_BQ_FIELD],
+        partition_field='chart_date',
+    )
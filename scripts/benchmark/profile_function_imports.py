@@ -0,0 +1,142 @@
+"""
+Cloud Function 콜드 스타트 import 시간 측정 및 예산 검사
+
+새 Python 프로세스에서 Cloud Function 진입점(functions/pipeline_function/main.py)이
+모듈 로드 시점에 import하는 모듈을 import하고,
+- import 소요 시간 (여러 번 측정한 중앙값)
+- 콜드 스타트에 로드되면 안 되는 무거운 모듈(pandas, bs4, GCP 클라이언트 등) 로드 여부
+- -X importtime 기준 누적 시간이 큰 모듈 상위 목록
+을 출력합니다.
+
+예산을 넘거나 무거운 모듈이 로드되면 종료 코드 1로 끝나므로, 배포 전 검사에 사용할 수 있습니다.
+functions_framework가 설치되어 있으면 main.py 자체를, 없으면 main.py가 로드 시점에
+import하는 src 모듈 목록(COLD_START_MODULES)을 측정합니다.
+
+사용법:
+    python scripts/benchmark/profile_function_imports.py --budget-ms 300 --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).parent.parent.parent
+function_dir = project_root / 'functions' / 'pipeline_function'
+
+# main.py가 모듈 로드 시점에 import하는 src 모듈
+COLD_START_MODULES = [
+    'src.extract',
+    'src.parse_api',
+    'src.transform',
+    'src.utils',
+    'src.warm_cache',
+    'src.clients',
+    'src.upload_gcs',
+    'src.upload_bigquery',
+]
+
+# 일반적인 JSON API 실행의 콜드 스타트에서 로드되면 안 되는 모듈
+HEAVY_MODULES = [
+    'pandas',
+    'numpy',
+    'pyarrow',
+    'bs4',
+    'lxml',
+    'selenium',
+    'google.cloud.bigquery',
+    'google.cloud.storage',
+]
+
+# 환경 변수 COLD_START_IMPORT_BUDGET_MS로 변경 가능
+DEFAULT_BUDGET_MS = 300
+
+MEASURE_SCRIPT = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+started = time.perf_counter()
+for name in {modules!r}:
+    importlib.import_module(name)
+elapsed = time.perf_counter() - started
+print(json.dumps({{'elapsed_ms': elapsed * 1000, 'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def get_targets() -> tuple:
+    """측정할 모듈 목록과 작업 디렉토리를 반환합니다."""
+    try:
+        import functions_framework  # noqa: F401
+        return ['main'], function_dir
+    except ImportError:
+        return COLD_START_MODULES, project_root
+
+
+def measure_once(modules: list, cwd: Path) -> dict:
+    script = MEASURE_SCRIPT.format(root=str(cwd), modules=modules, heavy=HEAVY_MODULES)
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=cwd, capture_output=True, text=True, check=True,
+        env=dict(os.environ, PYTHONDONTWRITEBYTECODE='1'),
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def top_imports(modules: list, cwd: Path, limit: int) -> list:
+    """-X importtime 출력에서 누적 시간이 큰 최상위 import를 반환합니다."""
+    script = f"import sys; sys.path.insert(0, {str(cwd)!r})\n" + ''.join(f"import {m}\n" for m in modules)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', script],
+        cwd=cwd, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace('import time:', '|').split('|')]
+        rows.append((int(cumulative_us), int(self_us), name))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Cloud Function 콜드 스타트 import 시간 측정')
+    parser.add_argument(
+        '--budget-ms', type=float,
+        default=float(os.getenv('COLD_START_IMPORT_BUDGET_MS', DEFAULT_BUDGET_MS)),
+        help=f'import 시간 예산 (ms, 기본값: {DEFAULT_BUDGET_MS})'
+    )
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 import 수')
+    args = parser.parse_args()
+
+    modules, cwd = get_targets()
+    print(f"측정 대상: {', '.join(modules)}")
+
+    measurements = [measure_once(modules, cwd) for _ in range(args.runs)]
+    median_ms = statistics.median(m['elapsed_ms'] for m in measurements)
+    heavy = sorted({name for m in measurements for name in m['heavy']})
+
+    print(f"\n상위 import (누적 시간, -X importtime):")
+    for cumulative_us, self_us, name in top_imports(modules, cwd, args.top):
+        print(f"  {cumulative_us / 1000:8.1f}ms  (self {self_us / 1000:6.1f}ms)  {name}")
+
+    print(f"\nimport 시간: 중앙값 {median_ms:.1f}ms "
+          f"(최소 {min(m['elapsed_ms'] for m in measurements):.1f}ms, {args.runs}회), 예산 {args.budget_ms:.0f}ms")
+    print(f"로드된 무거운 모듈: {', '.join(heavy) if heavy else '없음'}")
+
+    failed = False
+    if median_ms > args.budget_ms:
+        print(f"❌ import 시간이 예산을 초과했습니다: {median_ms:.1f}ms > {args.budget_ms:.0f}ms")
+        failed = True
+    if heavy:
+        print(f"❌ 콜드 스타트에 무거운 모듈이 로드됩니다: {', '.join(heavy)}")
+        failed = True
+    if not failed:
+        print("✅ 콜드 스타트 import 예산 통과")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+카카오 웹툰 timetable API 응답과 같은 구조의 합성 데이터를 만듭니다.
+실제 응답처럼 파이프라인이 사용하지 않는 필드(backgroundColor, 이미지 URL 등)도 포함합니다.
+"""
+
+import json
+import random
+from typing import Dict, List
+
+WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+GENRES = ['romance', 'fantasy', 'action', 'drama', 'thriller', 'comedy', 'daily', 'martial']
+BADGES = ['신작', '기다무', '완결', '독점', '3다무', 'UP']
+KEYWORDS = ['#로맨스', '#판타지', '#액션/무협', '#회귀', '#복수', '#성장', '#먼치킨', '#학원', '#일상', '#힐링']
+AUTHORS = [f'작가{i}' for i in range(400)]
+
+
+def make_card(index: int, rng: random.Random) -> Dict:
+    """
+    API 응답의 카드 1건을 생성합니다.
+    
+    Args:
+        index: 카드 번호 (웹툰 ID 생성용)
+        rng: 난수 생성기
+    
+    Returns:
+        카드 딕셔너리
+    """
+    authors = [
+        {'id': rng.randint(1, 10_000), 'name': rng.choice(AUTHORS), 'type': 'AUTHOR'},
+        {'id': rng.randint(1, 10_000), 'name': rng.choice(AUTHORS), 'type': 'ILLUSTRATOR'},
+    ]
+    return {
+        'id': f'{index:024x}',
+        'key': f'{index:024x}-{index:024x}',
+        'operationId': str(index),
+        'genreFilters': ['all', rng.choice(GENRES)],
+        'content': {
+            'id': index,
+            'title': f'웹툰 {index}',
+            'seoId': f'webtoon-{index}',
+            'adult': rng.random() < 0.1,
+            'catchphraseTwoLines': f'캐치프레이즈 {index}\n두 번째 줄',
+            'catchphraseThreeLines': None,
+            'backgroundColor': '#%06X' % rng.randint(0, 0xFFFFFF),
+            'backgroundImage': f'https://kr-a.kakaopagecdn.com/P/C/{index}/bg/2x/{index:032x}',
+            'titleImageA': f'https://kr-a.kakaopagecdn.com/P/C/{index}/t1/2x/{index:032x}',
+            'titleImageB': f'https://kr-a.kakaopagecdn.com/P/C/{index}/t2/2x/{index:032x}',
+            'titleImageAHeight': rng.randint(40, 200),
+            'titleImageBHeight': rng.randint(40, 200),
+            'featuredCharacterImageA': f'https://kr-a.kakaopagecdn.com/P/C/{index}/c1/2x/{index:032x}',
+            'featuredCharacterAnimation': None,
+            'seoKeywords': rng.sample(KEYWORDS, 4),
+            'authors': authors,
+            'badges': [{'title': badge, 'type': 'INFO'} for badge in rng.sample(BADGES, 2)],
+        },
+        'sorting': {
+            'popularity': rng.randint(1, 1000),
+            'views': rng.randint(1, 1000),
+            'createdAt': rng.randint(1, 1000),
+            'popularityMale': rng.randint(1, 1000),
+            'popularityFemale': rng.randint(1, 1000),
+        },
+    }
+
+
+def make_api_payload(n_cards: int, seed: int = 42) -> Dict:
+    """
+    전체 요일 수집 모드와 같은 구조의 API 응답을 생성합니다.
+    
+    JSON 문자열로 직렬화 후 다시 디코딩하여 실제 응답처럼
+    모든 문자열이 별도 객체로 존재하도록 합니다.
+    
+    Args:
+        n_cards: 전체 카드 수 (요일별로 균등 분배)
+        seed: 난수 시드
+    
+    Returns:
+        API 응답 딕셔너리
+    """
+    return json.loads(make_api_payload_bytes(n_cards, seed))
+
+
+def make_api_payload_bytes(n_cards: int, seed: int = 42) -> bytes:
+    """
+    make_api_payload와 같은 응답을 JSON 바이트로 반환합니다.
+    
+    Args:
+        n_cards: 전체 카드 수
+        seed: 난수 시드
+    
+    Returns:
+        UTF-8 JSON 바이트
+    """
+    rng = random.Random(seed)
+    per_day = max(1, n_cards // len(WEEKDAYS))
+    data: List[Dict] = []
+    index = 0
+    for weekday in WEEKDAYS:
+        cards = []
+        for _ in range(per_day):
+            cards.append(make_card(index, rng))
+            index += 1
+        data.append({
+            'id': f'timetable_{weekday}',
+            'title': weekday,
+            'cardGroups': [{'title': '', 'type': 'GRID', 'cards': cards}],
+            '_weekday': weekday,
+            '_placement': f'timetable_{weekday}',
+            '_filter_type': '전체',
+        })
+    payload = {'data': data, '_collected_all_weekdays': True, '_filter_type': '전체'}
+    return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+
+def make_dim_webtoon_frame(n_rows: int, seed: int = 42):
+    """
+    dim_webtoon DataFrame을 생성합니다.
+    
+    병합 전(created_at이 datetime)과 병합 후(updated_at이 문자열) 형태가 섞이도록 하고,
+    content_id/adult에는 결측값을 포함시킵니다.
+    
+    Args:
+        n_rows: 행 수
+        seed: 난수 시드
+    
+    Returns:
+        dim_webtoon DataFrame
+    """
+    import pandas as pd
+    
+    rng = random.Random(seed)
+    base = pd.Timestamp('2026-01-01 09:00:00')
+    created_at = [base + pd.Timedelta(microseconds=rng.randint(0, 10**12)) for _ in range(n_rows)]
+    # 일부 행은 마이크로초가 0인 시각 (isoformat에서 소수부 생략)
+    for i in range(0, n_rows, 10):
+        created_at[i] = created_at[i].floor('s')
+    
+    return pd.DataFrame({
+        'webtoon_id': [f'{i:024x}' for i in range(n_rows)],
+        'title': [f'웹툰 {i}' for i in range(n_rows)],
+        'author': [rng.choice(AUTHORS) if rng.random() > 0.05 else None for _ in range(n_rows)],
+        'genre': [rng.choice(GENRES) for _ in range(n_rows)],
+        'tags': [[kw.lstrip('#') for kw in rng.sample(KEYWORDS, 3)] if rng.random() > 0.1 else None for _ in range(n_rows)],
+        'seo_id': [f'webtoon-{i}' for i in range(n_rows)],
+        'adult': [rng.random() < 0.1 if rng.random() > 0.05 else None for _ in range(n_rows)],
+        'catchphrase': [f'캐치프레이즈 {i}\n"두 번째" 줄' for i in range(n_rows)],
+        'badges': [rng.sample(BADGES, 2) if rng.random() > 0.2 else None for _ in range(n_rows)],
+        'content_id': [i if rng.random() > 0.05 else None for i in range(n_rows)],
+        'created_at': created_at,
+        'updated_at': [ts.strftime('%Y-%m-%d %H:%M:%S.%f') for ts in created_at],
+        'fingerprint': [f'{rng.getrandbits(160):040x}' for _ in range(n_rows)],
+    })
+
+
+SORT_KEYS = ['popularity', 'views', 'createdAt', 'popularityMale', 'popularityFemale']
+
+
+def make_fact_weekly_chart_frame(n_rows: int, seed: int = 42, start_day: int = 0, cards_per_chart: int = 700):
+    """
+    fact_weekly_chart DataFrame을 생성합니다.
+    
+    날짜 × 정렬 키 조합마다 cards_per_chart개 행을 만들고, chart_date는 로더와 같이
+    date 객체로 둡니다. 일부 행은 weekday가 None입니다.
+    
+    Args:
+        n_rows: 행 수
+        seed: 난수 시드
+        start_day: 시작 날짜 오프셋 (2024-01-01 기준 일 수)
+        cards_per_chart: 날짜/정렬 키별 행 수
+    
+    Returns:
+        fact_weekly_chart DataFrame
+    """
+    import pandas as pd
+    
+    rng = random.Random(seed)
+    base = pd.Timestamp('2024-01-01')
+    rows = []
+    for i in range(n_rows):
+        chart = i // cards_per_chart
+        position = i % cards_per_chart
+        day = base + pd.Timedelta(days=start_day + chart // len(SORT_KEYS))
+        collected_at = day + pd.Timedelta(hours=9, microseconds=rng.randint(0, 10**6))
+        rows.append({
+            'chart_date': day.date(),
+            'webtoon_id': f'{position:024x}',
+            'rank': position + 1,
+            'collected_at': collected_at.to_pydatetime(),
+            'weekday': WEEKDAYS[position % 7] if position % 50 else None,
+            'weekday_rank': position // 7 + 1,
+            'year': day.year,
+            'month': day.month,
+            'week': (day.day - 1) // 7 + 1,
+            'view_count': rng.randint(0, 10**6),
+            'sort_key': SORT_KEYS[chart % len(SORT_KEYS)],
+        })
+    return pd.DataFrame(rows)
@@ -0,0 +1,232 @@
+"""
+BigQuery 작업 그래프 모듈
+
+BigQuery 업로드 작업(임시 테이블 적재, MERGE 등)을 의존 관계에 따라 워커 풀에서 동시에 실행합니다.
+- 서로 독립인 작업(예: dim_webtoon 적재와 fact_weekly_chart 적재)은 동시에 제출하고 함께 기다림
+- depends_on: 앞 작업이 성공해야 실행 (실패/생략되면 이 작업도 생략, 예: 적재 → MERGE)
+- after: 앞 작업이 끝난 뒤에 실행 (결과와 무관, 예: 같은 테이블에 대한 MERGE를 직렬화)
+- 작업별 시작/종료 시각과 소요 시간을 기록하고, 가장 오래 걸린 의존 경로(critical path)를 계산
+
+업로드 단계 전체 소요 시간은 작업 소요 시간의 합이 아니라 critical path에 가까워집니다.
+
+사용 예:
+    graph = BigQueryJobGraph()
+    graph.add('dim_webtoon:stage', stage_dim)
+    graph.add('dim_webtoon:merge', lambda: merge(graph.result('dim_webtoon:stage')), depends_on=['dim_webtoon:stage'])
+    graph.run()
+    graph.log_summary()
+"""
+
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# 작업 상태
+PENDING = 'pending'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+
+def get_bigquery_job_workers(default: int = 4) -> int:
+    """
+    BigQuery 작업 그래프의 동시 실행 작업 수를 반환합니다.
+    환경 변수 BIGQUERY_JOB_WORKERS가 설정되어 있으면 그 값을 사용합니다.
+
+    Args:
+        default: 환경 변수가 없을 때 사용할 값
+
+    Returns:
+        워커 수 (1 이상)
+    """
+    return max(1, int(os.getenv('BIGQUERY_JOB_WORKERS', str(default))))
+
+
+class BigQueryJob:
+    """작업 그래프의 작업 하나와 실행 결과/소요 시간입니다."""
+
+    __slots__ = ('name', 'func', 'depends_on', 'after', 'status', 'result', 'error', 'started_at', 'finished_at')
+
+    def __init__(self, name: str, func: Callable[[], Any], depends_on: List[str], after: List[str]) -> None:
+        self.name = name
+        self.func = func
+        self.depends_on = depends_on
+        self.after = after
+        self.status = PENDING
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    @property
+    def elapsed(self) -> float:
+        if self.started_at is None or self.finished_at is None:
+            return 0.0
+        return self.finished_at - self.started_at
+
+    def to_dict(self, origin: float = 0.0) -> Dict:
+        return {
+            'name': self.name,
+            'status': self.status,
+            'depends_on': self.depends_on,
+            'after': self.after,
+            'start': round(self.started_at - origin, 3) if self.started_at is not None else None,
+            'elapsed': round(self.elapsed, 3),
+            'error': self.error,
+        }
+
+
+class BigQueryJobGraph:
+    """
+    의존 관계가 있는 BigQuery 작업들을 동시에 실행합니다.
+    작업 함수가 False를 반환하거나 예외를 던지면 실패로 처리합니다 (그 밖의 반환값은 result로 보관).
+    None 반환은 반영할 변경이 없다는 뜻의 성공입니다. 원본 레코드가 없는 경우처럼 실패해야 하는 경우는
+    작업 함수가 예외를 던지거나 False를 반환해야 합니다.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Args:
+            max_workers: 동시 실행 작업 수 (None이면 get_bigquery_job_workers())
+        """
+        self.max_workers = max_workers or get_bigquery_job_workers()
+        self.jobs: Dict[str, BigQueryJob] = {}
+        self.started_at: Optional[float] = None
+        self.elapsed = 0.0
+
+    def add(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        depends_on: Iterable[str] = (),
+        after: Iterable[str] = ()
+    ) -> None:
+        """
+        작업을 추가합니다. 앞 작업은 먼저 추가되어 있어야 합니다 (순환 방지).
+
+        Args:
+            name: 작업 이름 (고유)
+            func: 인자 없는 작업 함수
+            depends_on: 성공해야 하는 앞 작업 이름
+            after: 끝나기만 하면 되는 앞 작업 이름 (같은 테이블 DML 직렬화 등)
+        """
+        if name in self.jobs:
+            raise ValueError(f"이미 추가된 작업입니다: {name}")
+        depends_on, after = list(depends_on), list(after)
+        for previous in depends_on + after:
+            if previous not in self.jobs:
+                raise ValueError(f"{name}: 앞 작업 {previous}이 먼저 추가되어야 합니다.")
+        self.jobs[name] = BigQueryJob(name, func, depends_on, after)
+
+    def result(self, name: str) -> Any:
+        """성공한 작업의 반환값을 반환합니다."""
+        return self.jobs[name].result
+
+    @property
+    def success(self) -> bool:
+        return all(job.status == SUCCEEDED for job in self.jobs.values())
+
+    def _ready(self, job: BigQueryJob) -> Optional[bool]:
+        """실행 가능하면 True, 생략해야 하면 False, 아직 기다려야 하면 None"""
+        if any(self.jobs[name].status in (FAILED, SKIPPED) for name in job.depends_on):
+            return False
+        if any(self.jobs[name].status == PENDING for name in job.depends_on + job.after):
+            return None
+        return True
+
+    def _execute(self, job: BigQueryJob) -> None:
+        job.started_at = time.perf_counter()
+        try:
+            job.result = job.func()
+            job.status = FAILED if job.result is False else SUCCEEDED
+            if job.status == FAILED:
+                job.error = '작업 함수가 실패를 반환했습니다.'
+        except Exception as e:
+            logger.error(f"❌ BigQuery 작업 실패 ({job.name}): {e}")
+            job.status, job.error = FAILED, str(e)
+        finally:
+            job.finished_at = time.perf_counter()
+
+    def run(self) -> bool:
+        """
+        모든 작업을 의존 관계에 따라 실행하고 끝날 때까지 기다립니다.
+
+        Returns:
+            모든 작업이 성공했는지 여부
+        """
+        self.started_at = time.perf_counter()
+        waiting = list(self.jobs.values())
+        running: Dict[Future, BigQueryJob] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='bigquery-job') as pool:
+            while waiting or running:
+                # 앞 작업이 끝난 작업을 모두 제출 (생략 처리는 뒤 작업에 전파되도록 반복)
+                progressed = True
+                while progressed:
+                    progressed = False
+                    for job in list(waiting):
+                        ready = self._ready(job)
+                        if ready is None:
+                            continue
+                        waiting.remove(job)
+                        progressed = True
+                        if ready:
+                            running[pool.submit(self._execute, job)] = job
+                        else:
+                            job.status = SKIPPED
+                            job.error = '앞 작업 실패로 생략'
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+        self.elapsed = time.perf_counter() - self.started_at
+        return self.success
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """
+        소요 시간 기준으로 가장 긴 의존 경로(depends_on + after)를 계산합니다.
+
+        Returns:
+            (작업 이름 리스트, 경로 소요 시간 합계)
+        """
+        longest: Dict[str, Tuple[float, List[str]]] = {}
+        for name, job in self.jobs.items():  # 앞 작업이 항상 먼저 추가되어 있음
+            previous = [longest[p] for p in job.depends_on + job.after]
+            seconds, path = max(previous, key=lambda item: item[0], default=(0.0, []))
+            longest[name] = (seconds + job.elapsed, path + [name])
+        if not longest:
+            return [], 0.0
+        seconds, path = max(longest.values(), key=lambda item: item[0])
+        return path, seconds
+
+    def to_dict(self) -> Dict:
+        path, seconds = self.critical_path()
+        origin = self.started_at or 0.0
+        return {
+            'elapsed': round(self.elapsed, 3),
+            'sequential': round(sum(job.elapsed for job in self.jobs.values()), 3),
+            'critical_path': path,
+            'critical_path_elapsed': round(seconds, 3),
+            'jobs': [job.to_dict(origin) for job in self.jobs.values()],
+        }
+
+    def log_summary(self) -> None:
+        """작업별 시작 시점/소요 시간과 critical path를 로그로 남깁니다."""
+        path, seconds = self.critical_path()
+        sequential = sum(job.elapsed for job in self.jobs.values())
+        logger.info(
+            f"BigQuery 작업 {len(self.jobs)}개: 전체 {self.elapsed:.2f}초 "
+            f"(순차 실행 시 {sequential:.2f}초, critical path {seconds:.2f}초: {' → '.join(path)})"
+        )
+        origin = self.started_at or 0.0
+        for job in self.jobs.values():
+            status = {SUCCEEDED: '✅', FAILED: f"❌ {job.error}", SKIPPED: f"⏭️ {job.error}"}.get(job.status, job.status)
+            if job.status == SUCCEEDED and job.result is None:
+                status = '✅ (반영할 변경 없음)'
+            start = f"+{job.started_at - origin:.2f}s" if job.started_at is not None else '-'
+            logger.info(f"  {job.name}: 시작 {start}, {job.elapsed:.2f}s {status}")
@@ -0,0 +1,443 @@
+"""
+BigQuery Storage Write API 적재 모듈
+
+fact_weekly_chart 행을 임시 테이블 load job + MERGE 대신 Storage Write API로 테이블에 바로 씁니다.
+환경 변수 BIGQUERY_FACT_INGESTION_MODE로 선택합니다 (google-cloud-bigquery-storage 필요).
+- committed: 정렬 키마다 COMMITTED 스트림에 append (쓰는 즉시 조회 가능)
+- pending: 정렬 키마다 PENDING 스트림에 append한 뒤 BatchCommitWriteStreams 한 번으로
+  모든 정렬 키를 원자적으로 커밋 (커밋 전에 실패하면 아무 행도 보이지 않음)
+
+정확히 한 번 적재:
+- append마다 스트림 안의 offset을 지정하므로, 같은 요청을 다시 보내도 ALREADY_EXISTS로 거절되어
+  행이 중복되지 않습니다.
+- (chart_date, sort_key)별 적재 기록(ledger)에 스트림 이름, 행 수, 파일 digest, 상태를 남깁니다.
+  같은 내용이 이미 커밋되었으면 건너뛰고, 내용이 바뀌었거나 이전 적재가 끝났는지 알 수 없으면(open)
+  MERGE로 반영합니다 (MERGE는 이미 있는 행을 갱신하므로 중복이 생기지 않음).
+- ledger에 없는 (chart_date, sort_key)는 쿼리 한 번으로 테이블에 행이 있는지 확인하고, 있으면 MERGE로
+  반영합니다 (merge 방식으로 올렸거나 Cloud Function 콜드 스타트로 ledger가 없어진 경우).
+
+사용 예:
+    write_fact_weekly_charts(chart_date, sort_keys, mode='pending')
+"""
+
+import hashlib
+import json
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+from src.clients import (
+    get_bigquery_client,
+    get_bigquery_write_client,
+    invalidate_bigquery_client,
+    invalidate_bigquery_write_client,
+)
+from src.upload_bigquery import (
+    BIGQUERY_DATASET_ID,
+    BIGQUERY_PROJECT_ID,
+    FACT_SORT_KEY_BQ_FIELD,
+    FACT_WEEKLY_CHART_BQ_FIELDS,
+    iter_jsonl_records,
+    merge_fact_weekly_charts,
+    normalize_fact_weekly_chart_record,
+    sql_string_literal,
+)
+from src.utils import atomic_write, file_lock, get_chart_jsonl_path, get_fact_weekly_chart_write_ledger_path
+
+logger = logging.getLogger(__name__)
+
+
+# Storage Write API로 쓰는 컬럼 (정렬 키별로 쓰므로 sort_key는 항상 포함)
+FACT_WRITE_FIELDS = FACT_WEEKLY_CHART_BQ_FIELDS + [FACT_SORT_KEY_BQ_FIELD]
+
+# BigQuery 타입 → proto2 필드 타입 (DATE는 epoch 이후 일 수, TIMESTAMP는 epoch 이후 마이크로초)
+PROTO_TYPES = {
+    'STRING': descriptor_pb2.FieldDescriptorProto.TYPE_STRING,
+    'INTEGER': descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+    'DATE': descriptor_pb2.FieldDescriptorProto.TYPE_INT32,
+    'TIMESTAMP': descriptor_pb2.FieldDescriptorProto.TYPE_INT64,
+}
+
+# append 요청 하나에 담을 행 수 (요청 크기 한도 10MB보다 충분히 작게)
+ROWS_PER_APPEND = 500
+
+# append 실패 시 같은 offset으로 다시 보내는 횟수
+APPEND_RETRIES = 2
+
+_EPOCH_DATE = date(1970, 1, 1)
+_EPOCH_DATETIME = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+# 한 번 만든 행 메시지 클래스 (descriptor pool 등록은 프로세스당 한 번)
+_ROW_MESSAGE_CLASS: List[Any] = []
+
+
+def get_row_message_class() -> Any:
+    """
+    fact_weekly_chart 행을 담는 proto2 메시지 클래스를 반환합니다 (FACT_WRITE_FIELDS 순서).
+
+    Returns:
+        protobuf 메시지 클래스
+    """
+    if not _ROW_MESSAGE_CLASS:
+        file_proto = descriptor_pb2.FileDescriptorProto(
+            name='fact_weekly_chart_row.proto', package='kakao_webtoon', syntax='proto2'
+        )
+        message_proto = file_proto.message_type.add(name='FactWeeklyChartRow')
+        for number, (name, field_type, _) in enumerate(FACT_WRITE_FIELDS, 1):
+            message_proto.field.add(
+                name=name, number=number, type=PROTO_TYPES[field_type],
+                label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+            )
+        pool = descriptor_pool.DescriptorPool()
+        pool.Add(file_proto)
+        _ROW_MESSAGE_CLASS.append(
+            message_factory.GetMessageClass(pool.FindMessageTypeByName('kakao_webtoon.FactWeeklyChartRow'))
+        )
+    return _ROW_MESSAGE_CLASS[0]
+
+
+def to_proto_value(value: Any, field_type: str) -> Any:
+    """
+    정규화된 레코드 값을 Storage Write API proto 값으로 변환합니다.
+
+    Args:
+        value: 값 (None이 아님)
+        field_type: BigQuery 타입
+
+    Returns:
+        proto 필드에 넣을 값
+    """
+    if field_type == 'DATE':
+        if isinstance(value, str):
+            value = date.fromisoformat(value[:10])
+        return (value - _EPOCH_DATE).days
+    if field_type == 'TIMESTAMP':
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        if value.tzinfo is None:
+            # load job과 같이 시간대가 없는 값은 UTC로 해석
+            value = value.replace(tzinfo=timezone.utc)
+        return (value - _EPOCH_DATETIME) // timedelta(microseconds=1)
+    if field_type == 'INTEGER':
+        return int(value)
+    return str(value)
+
+
+def serialize_fact_rows(jsonl_path: Path, sort_key: str) -> List[bytes]:
+    """
+    정렬 키 하나의 fact_weekly_chart JSONL 파일을 직렬화된 proto 행 리스트로 변환합니다.
+
+    Args:
+        jsonl_path: JSONL 파일 경로
+        sort_key: 정렬 키 (sort_key가 없는 예전 레코드에 채움)
+
+    Returns:
+        직렬화된 행 리스트 (파일 순서, offset 기준)
+    """
+    row_class = get_row_message_class()
+    rows = []
+    for record in iter_jsonl_records(jsonl_path):
+        if 'sort_key' not in record:
+            record = dict(record, sort_key=sort_key)
+        normalized = normalize_fact_weekly_chart_record(record)
+        row = row_class()
+        for name, field_type, _ in FACT_WRITE_FIELDS:
+            value = normalized.get(name)
+            if value is not None:
+                setattr(row, name, to_proto_value(value, field_type))
+        rows.append(row.SerializeToString())
+    return rows
+
+
+def compute_file_digest(file_path: Path) -> str:
+    """파일 내용의 sha1 digest를 반환합니다 (같은 내용이 이미 적재되었는지 판단)."""
+    digest = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_ledger_key(chart_date: date, sort_key: str) -> str:
+    return f"{chart_date.isoformat()}|{sort_key}"
+
+
+def load_write_ledger(table_id: str) -> Dict[str, Dict]:
+    """
+    Storage Write API 적재 기록을 읽습니다.
+
+    Args:
+        table_id: BigQuery 테이블 ID (다른 테이블의 기록은 무시)
+
+    Returns:
+        'chart_date|sort_key' → {stream, rows, digest, state, mode, updated_at}
+    """
+    ledger_path = get_fact_weekly_chart_write_ledger_path()
+    if not ledger_path.exists():
+        return {}
+    try:
+        ledger = json.loads(ledger_path.read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"fact_weekly_chart 적재 기록을 읽을 수 없습니다 (무시): {e}")
+        return {}
+    if ledger.get('table_id') != table_id:
+        return {}
+    return ledger.get('entries', {})
+
+
+def update_write_ledger(table_id: str, entries: Dict[str, Dict]) -> None:
+    """
+    Storage Write API 적재 기록을 갱신합니다 (다른 실행이 쓴 기록과 합쳐서 원자적으로 교체).
+
+    Args:
+        table_id: BigQuery 테이블 ID
+        entries: 'chart_date|sort_key' → 기록
+    """
+    ledger_path = get_fact_weekly_chart_write_ledger_path()
+    updated_at = datetime.now().isoformat()
+    with file_lock(ledger_path):
+        ledger = load_write_ledger(table_id)
+        for key, entry in entries.items():
+            ledger[key] = dict(entry, updated_at=updated_at)
+        with atomic_write(ledger_path) as f:
+            json.dump({'table_id': table_id, 'entries': ledger}, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def find_loaded_sort_keys(client: Any, table_id: str, chart_date: date, sort_keys: List[str]) -> Set[str]:
+    """
+    테이블에 이미 행이 있는 정렬 키를 조회합니다 (chart_date 파티션 하나만 읽음).
+
+    Args:
+        client: BigQuery 클라이언트
+        table_id: BigQuery 테이블 ID
+        chart_date: 차트 날짜
+        sort_keys: 확인할 정렬 키 리스트
+
+    Returns:
+        행이 있는 정렬 키 집합
+    """
+    query = f"""
+    SELECT DISTINCT sort_key
+    FROM `{table_id}`
+    WHERE chart_date = DATE '{chart_date.isoformat()}'
+      AND sort_key IN ({', '.join(sql_string_literal(sort_key) for sort_key in sort_keys)})
+    """
+    return {row['sort_key'] for row in client.query(query).result()}
+
+
+def plan_fact_writes(
+    table_id: str,
+    chart_date: date,
+    sort_keys: List[Optional[str]],
+    ledger: Dict[str, Dict]
+) -> Tuple[List[Tuple[str, Path, str]], List[Optional[str]], List[str]]:
+    """
+    정렬 키마다 Storage Write API로 쓸지, MERGE로 반영할지, 건너뛸지 정합니다.
+
+    Args:
+        table_id: BigQuery 테이블 ID
+        chart_date: 차트 날짜
+        sort_keys: 정렬 키 리스트
+        ledger: load_write_ledger 결과
+
+    Returns:
+        (쓸 정렬 키의 (sort_key, 파일 경로, digest) 리스트, MERGE할 정렬 키 리스트, 건너뛸 정렬 키 리스트)
+    """
+    writes, merges, skipped, unknown = [], [], [], []
+    for sort_key in dict.fromkeys(sort_keys):
+        jsonl_path = get_chart_jsonl_path(chart_date, sort_key)
+        if not sort_key or not jsonl_path.exists():
+            # 정렬 키가 없는 파일은 기존 방식으로 (없는 파일은 MERGE 경로에서 경고)
+            merges.append(sort_key)
+            continue
+        digest = compute_file_digest(jsonl_path)
+        entry = ledger.get(get_ledger_key(chart_date, sort_key))
+        if entry is None:
+            unknown.append((sort_key, jsonl_path, digest))
+        elif entry.get('digest') == digest and entry.get('state') in ('committed', 'merged'):
+            skipped.append(sort_key)
+        else:
+            # 내용이 바뀌었거나 이전 적재가 끝났는지 알 수 없음 (open)
+            merges.append(sort_key)
+
+    if unknown:
+        loaded = find_loaded_sort_keys(
+            get_bigquery_client(), table_id, chart_date, [sort_key for sort_key, _, _ in unknown]
+        )
+        for sort_key, jsonl_path, digest in unknown:
+            if sort_key in loaded:
+                merges.append(sort_key)
+            else:
+                writes.append((sort_key, jsonl_path, digest))
+    return writes, merges, skipped
+
+
+def append_rows(write_client: Any, stream_name: str, rows: List[bytes]) -> None:
+    """
+    스트림에 행을 offset을 지정해 append합니다.
+    실패한 요청은 같은 offset으로 다시 보내고, 이미 쓰인 offset(ALREADY_EXISTS)은 성공으로 봅니다.
+
+    Args:
+        write_client: BigQueryWriteClient
+        stream_name: 쓰기 스트림 이름
+        rows: 직렬화된 행 리스트
+    """
+    from google.api_core import exceptions as api_exceptions
+    from google.cloud.bigquery_storage_v1 import types, writer
+
+    proto_descriptor = descriptor_pb2.DescriptorProto()
+    get_row_message_class().DESCRIPTOR.CopyToProto(proto_descriptor)
+    request_template = types.AppendRowsRequest(
+        write_stream=stream_name,
+        proto_rows=types.AppendRowsRequest.ProtoData(
+            writer_schema=types.ProtoSchema(proto_descriptor=proto_descriptor)
+        ),
+    )
+
+    append_stream = writer.AppendRowsStream(write_client, request_template)
+    try:
+        for offset in range(0, len(rows), ROWS_PER_APPEND):
+            request = types.AppendRowsRequest(
+                offset=offset,
+                proto_rows=types.AppendRowsRequest.ProtoData(
+                    rows=types.ProtoRows(serialized_rows=rows[offset:offset + ROWS_PER_APPEND])
+                ),
+            )
+            for attempt in range(APPEND_RETRIES + 1):
+                try:
+                    append_stream.send(request).result()
+                    break
+                except api_exceptions.AlreadyExists:
+                    # 이전 시도에서 이미 쓰인 offset
+                    break
+                except Exception as e:
+                    if attempt == APPEND_RETRIES:
+                        raise
+                    logger.warning(f"append 실패, 같은 offset({offset})으로 다시 보냅니다: {e}")
+                    append_stream.close()
+                    append_stream = writer.AppendRowsStream(write_client, request_template)
+    finally:
+        append_stream.close()
+
+
+def write_fact_streams(
+    table_id: str,
+    chart_date: date,
+    writes: List[Tuple[str, Path, str]],
+    mode: str
+) -> List[str]:
+    """
+    정렬 키마다 쓰기 스트림을 만들어 행을 쓰고 커밋합니다.
+
+    Args:
+        table_id: BigQuery 테이블 ID
+        chart_date: 차트 날짜
+        writes: (sort_key, 파일 경로, digest) 리스트
+        mode: 'committed' 또는 'pending'
+
+    Returns:
+        커밋된 정렬 키 리스트 (예외가 나면 그 전까지 커밋된 정렬 키는 ledger에 기록됨)
+    """
+    from google.cloud.bigquery_storage_v1 import types
+
+    write_client = get_bigquery_write_client()
+    project, dataset, table = table_id.split('.')
+    parent = write_client.table_path(project, dataset, table)
+    stream_type = types.WriteStream.Type.COMMITTED if mode == 'committed' else types.WriteStream.Type.PENDING
+
+    committed, opened = [], {}
+    for sort_key, jsonl_path, digest in writes:
+        rows = serialize_fact_rows(jsonl_path, sort_key)
+        stream = write_client.create_write_stream(
+            parent=parent, write_stream=types.WriteStream(type_=stream_type)
+        )
+        entry = {'stream': stream.name, 'rows': len(rows), 'digest': digest, 'mode': mode, 'state': 'open'}
+        # 쓰기 전에 open으로 기록 (중간에 죽으면 다음 실행에서 MERGE로 반영)
+        update_write_ledger(table_id, {get_ledger_key(chart_date, sort_key): entry})
+
+        append_rows(write_client, stream.name, rows)
+        write_client.finalize_write_stream(name=stream.name)
+        opened[sort_key] = entry
+        if mode == 'committed':
+            update_write_ledger(table_id, {get_ledger_key(chart_date, sort_key): dict(entry, state='committed')})
+            committed.append(sort_key)
+
+    if mode == 'pending' and opened:
+        response = write_client.batch_commit_write_streams(
+            types.BatchCommitWriteStreamsRequest(
+                parent=parent, write_streams=[entry['stream'] for entry in opened.values()]
+            )
+        )
+        if response.stream_errors:
+            raise Exception(f"스트림 커밋 실패: {[error.error_message for error in response.stream_errors]}")
+        update_write_ledger(table_id, {
+            get_ledger_key(chart_date, sort_key): dict(entry, state='committed')
+            for sort_key, entry in opened.items()
+        })
+        committed.extend(opened)
+    return committed
+
+
+def write_fact_weekly_charts(chart_date: date, sort_keys: List[Optional[str]], mode: str) -> bool:
+    """
+    한 날짜의 여러 정렬 키 fact_weekly_chart를 Storage Write API로 BigQuery에 적재합니다.
+
+    이미 같은 내용이 적재된 정렬 키는 건너뛰고, 테이블에 행이 있거나 이전 적재 상태를 알 수 없는
+    정렬 키와 Storage Write API 적재에 실패한 정렬 키는 merge_fact_weekly_charts로 반영합니다.
+
+    Args:
+        chart_date: 차트 날짜
+        sort_keys: 정렬 키 리스트
+        mode: 'committed' 또는 'pending'
+
+    Returns:
+        성공 여부
+    """
+    table_id = f"{BIGQUERY_PROJECT_ID}.{BIGQUERY_DATASET_ID}.fact_weekly_chart"
+    try:
+        writes, merges, skipped = plan_fact_writes(table_id, chart_date, sort_keys, load_write_ledger(table_id))
+    except Exception as e:
+        logger.warning(f"Storage Write API 적재 대상 확인 실패, MERGE로 반영합니다: {e}")
+        invalidate_bigquery_client(f"fact_weekly_chart 적재 대상 확인 실패: {e}")
+        return merge_fact_weekly_charts(chart_date, sort_keys)
+
+    if skipped:
+        logger.info(f"이미 같은 내용이 적재된 정렬 키는 건너뜁니다: {', '.join(skipped)}")
+
+    if writes:
+        start = time.perf_counter()
+        committed = []
+        try:
+            committed = write_fact_streams(table_id, chart_date, writes, mode)
+            logger.info(
+                f"✅ fact_weekly_chart Storage Write API 적재 완료 ({mode}): 정렬 키 {len(committed)}개, "
+                f"{time.perf_counter() - start:.2f}초 (load job/MERGE 없음)"
+            )
+        except Exception as e:
+            logger.warning(f"Storage Write API 적재 실패 ({mode}), 남은 정렬 키는 MERGE로 반영합니다: {e}")
+            invalidate_bigquery_write_client(f"Storage Write API 적재 실패: {e}")
+        merges.extend(sort_key for sort_key, _, _ in writes if sort_key not in committed)
+
+    if not merges:
+        return True
+
+    logger.info(f"MERGE로 반영할 정렬 키: {', '.join(str(sort_key) for sort_key in merges)}")
+    if not merge_fact_weekly_charts(chart_date, merges):
+        return False
+
+    # MERGE로 반영한 내용도 기록 (같은 내용이면 다음 실행에서 건너뜀)
+    entries = {}
+    for sort_key in merges:
+        jsonl_path = get_chart_jsonl_path(chart_date, sort_key)
+        if sort_key and jsonl_path.exists():
+            entries[get_ledger_key(chart_date, sort_key)] = {
+                'stream': None, 'rows': None, 'digest': compute_file_digest(jsonl_path),
+                'mode': 'merge', 'state': 'merged',
+            }
+    if entries:
+        update_write_ledger(table_id, entries)
+    return True
@@ -0,0 +1,351 @@
+"""
+dim_webtoon 저장소 모듈
+
+dim_webtoon을 스냅샷 + 변경 로그(changelog) 형태로 관리합니다.
+- dim_webtoon.jsonl: 스냅샷 (webtoon_id별 레코드 1개, 기존 파일 형식과 동일)
+- dim_webtoon.changelog.jsonl: 스냅샷 이후 새로 추가되거나 내용이 바뀐 레코드만 append
+- webtoon_id → (파일, 바이트 오프셋) 인덱스를 메모리에 유지하여 필요한 레코드만 읽음
+- 변경 로그가 임계치를 넘으면 스냅샷으로 합침 (compaction)
+
+실행마다 전체 파일을 다시 쓰지 않으므로, 기록 비용은 전체 웹툰 수가 아니라
+변경된 레코드 수에 비례합니다.
+
+저장소가 열려 있는 동안 dim_webtoon 파일 잠금을 유지하므로, 같은 DATA_DIR을 쓰는
+다른 실행은 인덱스를 읽기 전부터 기다리게 됩니다.
+
+인덱스는 저장소를 닫을 때 파일 상태(inode, 크기, 수정 시각)와 함께 warm 캐시에 남겨 두고,
+다음에 열 때 파일이 그대로이면 다시 스캔하지 않습니다 (Cloud Function warm 인스턴스).
+"""
+
+import json
+import logging
+import os
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src.models import DIM_WEBTOON_COLUMNS, compute_dim_webtoon_fingerprint
+from src.utils import (
+    atomic_write,
+    file_lock,
+    format_timestamp,
+    get_dim_compaction_threshold,
+    get_dim_webtoon_changelog_path,
+    get_dim_webtoon_jsonl_path,
+    serialize_datetime_for_json,
+)
+from src.warm_cache import WarmCache
+
+logger = logging.getLogger(__name__)
+
+
+# 인덱스의 파일 구분값
+SNAPSHOT = 0
+CHANGELOG = 1
+
+# 마지막으로 닫은 저장소의 인덱스 (파일 상태가 같을 때만 재사용)
+_INDEX_CACHE = WarmCache('dim_index', ttl=3600)
+
+
+class DimWebtoonStore:
+    """
+    스냅샷 + 변경 로그 기반 dim_webtoon 저장소입니다.
+
+    사용 예:
+        with DimWebtoonStore() as store:
+            changed = store.upsert(dim_records)
+            store.maybe_compact()
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Optional[Path] = None,
+        changelog_path: Optional[Path] = None,
+        compaction_threshold: Optional[int] = None,
+        lock: bool = True
+    ) -> None:
+        """
+        Args:
+            snapshot_path: 스냅샷 파일 경로 (None이면 기본 경로)
+            changelog_path: 변경 로그 파일 경로 (None이면 기본 경로)
+            compaction_threshold: compaction 기준 변경 로그 레코드 수 (None이면 환경 변수/기본값)
+            lock: close()까지 스냅샷 파일 잠금을 유지할지 여부 (잠금은 연 스레드에서 닫아야 함)
+        """
+        self.snapshot_path = snapshot_path or get_dim_webtoon_jsonl_path()
+        self.changelog_path = changelog_path or get_dim_webtoon_changelog_path()
+        self.compaction_threshold = (
+            compaction_threshold if compaction_threshold is not None else get_dim_compaction_threshold()
+        )
+
+        self._index: Dict[str, Tuple[int, int]] = {}
+        self._changelog_rows = 0
+        self._readers = {}
+        # 기록 도중 실패하면 인덱스가 파일과 어긋날 수 있으므로 캐시하지 않음
+        self._dirty = False
+
+        self._locked = lock
+        self._lock = ExitStack()
+        if lock:
+            self._lock.enter_context(file_lock(self.snapshot_path))
+        try:
+            self._load_index()
+        except BaseException:
+            self._lock.close()
+            raise
+
+    # ------------------------------------------------------------------
+    # 인덱스
+    # ------------------------------------------------------------------
+
+    def _paths(self) -> Dict[int, Path]:
+        return {SNAPSHOT: self.snapshot_path, CHANGELOG: self.changelog_path}
+
+    def _file_state(self) -> Tuple:
+        """인덱스 캐시 검증용 파일 상태 (경로, inode, 크기, 수정 시각)"""
+        state = []
+        for path in self._paths().values():
+            try:
+                stat = path.stat()
+                state.append((str(path), stat.st_ino, stat.st_size, stat.st_mtime_ns))
+            except FileNotFoundError:
+                state.append((str(path), None))
+        return tuple(state)
+
+    def _load_index(self) -> None:
+        """스냅샷과 변경 로그를 순서대로 읽어 webtoon_id별 최신 위치를 인덱싱합니다."""
+        file_state = self._file_state()
+        cached = _INDEX_CACHE.peek(lambda entry: entry[0] == file_state)
+        if cached is not None:
+            _, index, self._changelog_rows = cached
+            self._index = dict(index)
+            logger.info(
+                f"dim_webtoon 인덱스 재사용 (warm 캐시): {len(self._index)}개 웹툰 "
+                f"(변경 로그 {self._changelog_rows}개 레코드)"
+            )
+            return
+
+        for source, path in self._paths().items():
+            if not path.exists():
+                continue
+
+            rows = 0
+            with open(path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    if line.strip():
+                        try:
+                            webtoon_id = json.loads(line).get('webtoon_id')
+                        except json.JSONDecodeError as e:
+                            logger.error(f"dim_webtoon 레코드 파싱 오류 ({path.name}, 오프셋 {offset}): {e}")
+                            webtoon_id = None
+                        if webtoon_id:
+                            self._index[str(webtoon_id)] = (source, offset)
+                            rows += 1
+                    offset += len(line)
+
+            if source == CHANGELOG:
+                self._changelog_rows = rows
+
+        logger.info(
+            f"dim_webtoon 인덱스 로드 완료: {len(self._index)}개 웹툰 "
+            f"(변경 로그 {self._changelog_rows}개 레코드)"
+        )
+
+    def _read_line(self, source: int, offset: int) -> bytes:
+        reader = self._readers.get(source)
+        if reader is None:
+            reader = open(self._paths()[source], 'rb')
+            self._readers[source] = reader
+        reader.seek(offset)
+        return reader.readline()
+
+    def _close_readers(self) -> None:
+        for reader in self._readers.values():
+            reader.close()
+        self._readers = {}
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, webtoon_id: str) -> bool:
+        return str(webtoon_id) in self._index
+
+    def ids(self) -> Set[str]:
+        """저장된 webtoon_id 집합을 반환합니다."""
+        return set(self._index)
+
+    @property
+    def changelog_rows(self) -> int:
+        """마지막 compaction 이후 변경 로그에 쌓인 레코드 수"""
+        return self._changelog_rows
+
+    def get(self, webtoon_id: str) -> Optional[Dict]:
+        """
+        webtoon_id의 최신 레코드를 반환합니다.
+
+        Args:
+            webtoon_id: 웹툰 ID
+
+        Returns:
+            dim_webtoon 레코드 (없으면 None)
+        """
+        location = self._index.get(str(webtoon_id))
+        if location is None:
+            return None
+        return json.loads(self._read_line(*location))
+
+    def records(self) -> Iterator[Dict]:
+        """
+        모든 웹툰의 최신 레코드를 순서대로 반환합니다.
+
+        Yields:
+            dim_webtoon 레코드
+        """
+        for location in list(self._index.values()):
+            yield json.loads(self._read_line(*location))
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def upsert(self, records: List[Dict]) -> List[Dict]:
+        """
+        새로 추가되거나 비즈니스 필드가 바뀐 레코드만 변경 로그에 추가합니다.
+
+        - 기존 레코드와 fingerprint가 같으면 기록하지 않음 (updated_at도 그대로)
+        - 기존 웹툰이면 created_at은 기존 값을 유지
+        - 같은 배치 안에서 중복된 webtoon_id는 처음 것만 반영
+
+        Args:
+            records: dim_webtoon 레코드 리스트
+
+        Returns:
+            변경 로그에 기록된 레코드 리스트
+        """
+        changed = []
+        lines = []
+        seen = set()
+
+        for record in records:
+            webtoon_id = str(record['webtoon_id'])
+            if webtoon_id in seen:
+                continue
+            seen.add(webtoon_id)
+
+            fingerprint = record.get('fingerprint') or compute_dim_webtoon_fingerprint(record)
+            existing = self.get(webtoon_id)
+            if existing is not None:
+                existing_fingerprint = existing.get('fingerprint') or compute_dim_webtoon_fingerprint(existing)
+                if existing_fingerprint == fingerprint:
+                    continue
+
+            row = {col: record.get(col) for col in DIM_WEBTOON_COLUMNS}
+            row['webtoon_id'] = webtoon_id
+            row['fingerprint'] = fingerprint
+            if existing is not None and existing.get('created_at'):
+                row['created_at'] = existing['created_at']
+            # CSV/Parquet 경로(merge_dim_webtoon_delta)와 같은 시각 형식으로 저장
+            for column in ('created_at', 'updated_at'):
+                if row.get(column):
+                    row[column] = format_timestamp(row[column])
+
+            changed.append(row)
+            lines.append(
+                (webtoon_id, (json.dumps(row, ensure_ascii=False, default=serialize_datetime_for_json) + '\n').encode('utf-8'))
+            )
+
+        if not lines:
+            logger.info("dim_webtoon 변경 사항 없음")
+            return changed
+
+        self.changelog_path.parent.mkdir(parents=True, exist_ok=True)
+        self._dirty = True
+        with open(self.changelog_path, 'ab') as f:
+            offset = f.tell()
+            for webtoon_id, line in lines:
+                f.write(line)
+                self._index[webtoon_id] = (CHANGELOG, offset)
+                offset += len(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self._dirty = False
+
+        # 읽기 핸들은 append 이후 다시 열어 최신 내용을 보도록 함
+        self._close_readers()
+        self._changelog_rows += len(lines)
+        logger.info(f"dim_webtoon 변경 로그 기록: {len(lines)}개 레코드 (누적 {self._changelog_rows}개)")
+        return changed
+
+    def maybe_compact(self) -> bool:
+        """
+        변경 로그 레코드 수가 임계치 이상이면 compaction을 실행합니다.
+
+        Returns:
+            compaction 실행 여부
+        """
+        if self._changelog_rows < self.compaction_threshold:
+            return False
+        self.compact()
+        return True
+
+    def compact(self) -> None:
+        """
+        스냅샷과 변경 로그를 webtoon_id별 최신 레코드 하나씩만 담은 새 스냅샷으로 합치고,
+        변경 로그를 비웁니다. 레코드는 다시 직렬화하지 않고 원본 라인을 그대로 복사합니다.
+
+        새 스냅샷은 원자적으로 교체되므로, 교체 후 변경 로그를 지우기 전에 중단되어도
+        변경 로그 레코드가 같은 내용으로 다시 반영될 뿐 데이터는 유실되지 않습니다.
+        """
+        new_index = {}
+        self._dirty = True
+        with atomic_write(self.snapshot_path, 'wb') as f:
+            offset = 0
+            for webtoon_id, location in self._index.items():
+                line = self._read_line(*location)
+                if not line.endswith(b'\n'):
+                    line += b'\n'
+                f.write(line)
+                new_index[webtoon_id] = (SNAPSHOT, offset)
+                offset += len(line)
+
+        self._close_readers()
+        if self.changelog_path.exists():
+            self.changelog_path.unlink()
+
+        logger.info(
+            f"dim_webtoon compaction 완료: {len(new_index)}개 웹툰 "
+            f"(변경 로그 {self._changelog_rows}개 레코드 반영)"
+        )
+        self._index = new_index
+        self._changelog_rows = 0
+        self._dirty = False
+
+    # ------------------------------------------------------------------
+    # 컨텍스트 매니저
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """
+        열려 있는 읽기 핸들을 닫고 파일 잠금을 해제합니다.
+        잠금을 잡은 저장소는 해제 전에 인덱스를 warm 캐시에 남깁니다.
+        """
+        self._close_readers()
+        try:
+            if self._locked and not self._dirty:
+                _INDEX_CACHE.put((self._file_state(), self._index, self._changelog_rows))
+            elif self._dirty:
+                _INDEX_CACHE.invalidate('dim_webtoon 기록 실패')
+        finally:
+            self._lock.close()
+
+    def __enter__(self) -> 'DimWebtoonStore':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._dirty = True
+        self.close()
@@ -21,6 +21,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from src.utils import get_raw_html_dir, setup_logging
+from src.warm_cache import WarmCache
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +96,34 @@ def create_session() -> requests.Session:
     return session
 
 
+# API 호출용 세션은 warm 인스턴스에서 재사용 (연결 풀/TLS 세션 유지)
+_SESSION_CACHE = WarmCache(
+    'http_session',
+    create_session,
+    ttl=1800,
+    health_check=lambda session: 'https://' in session.adapters,
+    close=lambda session: session.close(),
+)
+
+
+def get_session() -> requests.Session:
+    """
+    API 호출용 requests 세션을 반환합니다.
+    warm 인스턴스에서는 이전 호출의 세션을 재사용합니다 (TTL: WARM_CACHE_TTL_HTTP_SESSION_SECONDS, 기본 1800초).
+    
+    헤더를 바꿔야 하는 경우(모바일 HTML 수집 등)에는 create_session()으로 새 세션을 만들어 사용하세요.
+    
+    Returns:
+        requests.Session 객체
+    """
+    return _SESSION_CACHE.get()
+
+
+def invalidate_session(reason: str = '오류') -> None:
+    """캐시된 API 세션을 버립니다 (연결 오류 후 다음 호출에서 새 세션 사용)."""
+    _SESSION_CACHE.invalidate(reason)
+
+
 def try_api_endpoints(weekday: Optional[str] = None, filter_type: Optional[str] = None, collect_all_weekdays: bool = False, sort_key: Optional[str] = None, chart_date: Optional[date] = None) -> Optional[dict]:
     """
     카카오 웹툰 API 엔드포인트를 호출하여 데이터를 가져옵니다.
@@ -123,7 +152,7 @@ def try_api_endpoints(weekday: Optional[str] = None, filter_type: Optional[str]
             f"카카오 웹툰 API는 항상 현재 시점({date.today()})의 데이터만 제공합니다. "
             f"실제로는 현재 시점의 데이터가 수집됩니다."
         )
-    session = create_session()
+    session = get_session()
     
     # 기본값 설정
     if filter_type is None:
@@ -174,10 +203,14 @@ def try_api_endpoints(weekday: Optional[str] = None, filter_type: Optional[str]
                 
             except Exception as e:
                 logger.warning(f"API 호출 실패 ({url}): {e}")
+                if isinstance(e, requests.ConnectionError):
+                    invalidate_session(f"연결 오류: {e}")
+                    session = get_session()
                 continue
         
         if not all_data:
             logger.error("모든 요일 API 호출 실패")
+            invalidate_session('모든 요일 API 호출 실패')
             return None
         
         # 모든 요일 데이터를 합친 구조로 반환
@@ -238,9 +271,13 @@ def try_api_endpoints(weekday: Optional[str] = None, filter_type: Optional[str]
             
         except Exception as e:
             logger.warning(f"API 호출 실패 ({url}): {e}")
+            if isinstance(e, requests.ConnectionError):
+                invalidate_session(f"연결 오류: {e}")
+                session = get_session()
             continue
     
     logger.error("모든 API 엔드포인트 시도 실패")
+    invalidate_session('모든 API 엔드포인트 시도 실패')
     return None
 
 
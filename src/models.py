@@ -6,17 +6,288 @@
 - fact_weekly_chart: 주간 차트 히스토리 테이블 스키마
 """
 
-from datetime import date, datetime
-from typing import Dict, Any, Optional
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import hashlib
+import json
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# 파싱된 카드 레코드 (parse → transform 구간)
+# ============================================================================
+
+def intern_string(value: Any) -> Any:
+    """
+    문자열이면 intern하여 반환합니다.
+    
+    요일, 장르, 배지, 작가, 정렬 키처럼 카드 간에 반복되는 문자열이
+    카드마다 별도 객체로 남지 않고 하나의 객체를 공유하도록 합니다.
+    
+    Args:
+        value: intern할 값 (문자열이 아니면 그대로 반환)
+    
+    Returns:
+        intern된 문자열 또는 원래 값
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    return value
+
+
+def intern_strings(values: Optional[Iterable[Any]]) -> Optional[tuple]:
+    """
+    문자열 리스트를 intern된 문자열 튜플로 변환합니다.
+    
+    Args:
+        values: 문자열 리스트 (None이거나 비어 있으면 None 반환)
+    
+    Returns:
+        intern된 문자열 튜플 또는 None
+    """
+    if not values:
+        return None
+    return tuple(intern_string(value) for value in values)
+
+
+class WebtoonCard:
+    """
+    파싱된 웹툰 카드 1건을 담는 레코드입니다.
+    
+    카드마다 최대 14개 키를 가진 dict를 만드는 대신 __slots__ 기반 객체를 사용하여
+    카드당 메모리와 할당을 줄입니다. parse_api/parse에서 생성되어
+    transform의 dim_webtoon/fact_weekly_chart 레코드 생성까지 그대로 전달됩니다.
+    
+    반복되는 문자열(weekday, genre, author, badges, tags, sort_key)은 intern되며,
+    tags와 badges는 리스트 대신 튜플로 보관합니다.
+    """
+    
+    __slots__ = (
+        'rank',
+        'title',
+        'webtoon_id',
+        'author',
+        'genre',
+        'tags',
+        'seo_id',
+        'adult',
+        'catchphrase',
+        'badges',
+        'content_id',
+        'view_count',
+        'weekday',
+        'weekday_rank',
+        'sort_key',
+        'sort_name',
+    )
+    
+    # 기존 dict 기반 파싱 결과에서 사용하던 메타데이터 키
+    LEGACY_KEYS = {
+        '_sort_key': 'sort_key',
+        '_sort_name': 'sort_name',
+    }
+    
+    def __init__(
+        self,
+        rank: int,
+        title: str,
+        webtoon_id: str,
+        author: Optional[str] = None,
+        genre: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+        seo_id: Optional[str] = None,
+        adult: Optional[bool] = None,
+        catchphrase: Optional[str] = None,
+        badges: Optional[Iterable[str]] = None,
+        content_id: Optional[int] = None,
+        view_count: Optional[int] = None,
+        weekday: Optional[str] = None,
+        weekday_rank: Optional[int] = None,
+        sort_key: Optional[str] = None,
+        sort_name: Optional[str] = None
+    ) -> None:
+        self.rank = rank
+        self.title = title
+        self.webtoon_id = webtoon_id
+        self.author = intern_string(author)
+        self.genre = intern_string(genre)
+        self.tags = intern_strings(tags)
+        self.seo_id = seo_id
+        self.adult = adult
+        self.catchphrase = catchphrase
+        self.badges = intern_strings(badges)
+        self.content_id = content_id
+        self.view_count = view_count
+        self.weekday = intern_string(weekday)
+        self.weekday_rank = weekday_rank
+        self.sort_key = intern_string(sort_key)
+        self.sort_name = intern_string(sort_name)
+    
+    @classmethod
+    def from_dict(cls, item: Dict[str, Any]) -> 'WebtoonCard':
+        """
+        기존 dict 형식의 파싱 결과를 WebtoonCard로 변환합니다.
+        
+        Args:
+            item: {'rank': int, 'title': str, 'webtoon_id': str, ...} 형식의 딕셔너리
+        
+        Returns:
+            WebtoonCard 객체
+        """
+        return cls(
+            rank=item.get('rank', 0),
+            title=item.get('title', ''),
+            webtoon_id=item.get('webtoon_id', ''),
+            author=item.get('author'),
+            genre=item.get('genre'),
+            tags=item.get('tags'),
+            seo_id=item.get('seo_id'),
+            adult=item.get('adult'),
+            catchphrase=item.get('catchphrase'),
+            badges=item.get('badges'),
+            content_id=item.get('content_id'),
+            view_count=item.get('view_count'),
+            weekday=item.get('weekday'),
+            weekday_rank=item.get('weekday_rank'),
+            sort_key=item.get('_sort_key') or item.get('sort_key'),
+            sort_name=item.get('_sort_name') or item.get('sort_name'),
+        )
+    
+    def set_sort(self, sort_key: Optional[str], sort_name: Optional[str] = None) -> None:
+        """
+        정렬 메타데이터를 설정합니다.
+        
+        Args:
+            sort_key: 정렬 키
+            sort_name: 정렬 옵션 이름
+        """
+        self.sort_key = intern_string(sort_key)
+        self.sort_name = intern_string(sort_name)
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        dict.get과 같은 방식으로 필드 값을 조회합니다 (기존 코드 호환용).
+        
+        Args:
+            key: 필드명 ('_sort_key', '_sort_name' 포함)
+            default: 값이 없을 때 반환할 기본값
+        
+        Returns:
+            필드 값 (None이면 default)
+        """
+        value = getattr(self, self.LEGACY_KEYS.get(key, key), None)
+        return default if value is None else value
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        기존 파싱 결과와 같은 형식의 딕셔너리로 변환합니다.
+        값이 없는 선택 필드는 포함하지 않습니다.
+        
+        Returns:
+            웹툰 데이터 딕셔너리
+        """
+        data = {
+            'rank': self.rank,
+            'title': self.title,
+            'webtoon_id': self.webtoon_id,
+        }
+        for field in self.__slots__[3:]:
+            value = getattr(self, field)
+            if value is None:
+                continue
+            if field in ('tags', 'badges'):
+                value = list(value)
+            if field in ('sort_key', 'sort_name'):
+                field = f'_{field}'
+            data[field] = value
+        return data
+    
+    def __repr__(self) -> str:
+        return f"WebtoonCard({self.to_dict()!r})"
+
+
 # ============================================================================
 # dim_webtoon (마스터 테이블) 스키마
 # ============================================================================
 
+# fingerprint 계산에 사용하는 비즈니스 필드 (created_at, updated_at 제외)
+DIM_WEBTOON_FINGERPRINT_FIELDS = [
+    'title',
+    'author',
+    'genre',
+    'tags',
+    'seo_id',
+    'adult',
+    'catchphrase',
+    'badges',
+    'content_id',
+]
+
+
+def _normalize_fingerprint_value(value: Any) -> Any:
+    """
+    저장 형식(JSONL, CSV, Parquet, SQLite)과 무관하게 같은 값이 같은 fingerprint가 되도록 정규화합니다.
+    """
+    if value is None:
+        return None
+    if hasattr(value, 'tolist'):
+        # numpy 배열/스칼라
+        value = value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [str(v) for v in value] or None
+    if isinstance(value, float):
+        if value != value:
+            # NaN
+            return None
+        if value.is_integer():
+            return int(value)
+    return value
+
+
+def compute_dim_webtoon_fingerprint(record: Dict[str, Any]) -> str:
+    """
+    dim_webtoon 레코드의 비즈니스 필드로 fingerprint를 계산합니다.
+    비즈니스 필드가 같으면 항상 같은 값이 나오므로 변경 여부 판단에 사용합니다.
+    
+    Args:
+        record: dim_webtoon 레코드
+    
+    Returns:
+        fingerprint (sha1 hex 문자열)
+    """
+    values = [_normalize_fingerprint_value(record.get(field)) for field in DIM_WEBTOON_FINGERPRINT_FIELDS]
+    return _hash_fingerprint_values(values)
+
+
+_FINGERPRINT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def _hash_fingerprint_values(values: list) -> str:
+    return hashlib.sha1(_FINGERPRINT_ENCODER.encode(values).encode('utf-8')).hexdigest()
+
+
+def normalize_string_list(value: Any) -> Optional[list]:
+    """
+    tags, badges 값을 문자열 리스트로 정규화합니다.
+    
+    Args:
+        value: 리스트/튜플, '|'로 구분된 문자열 또는 단일 값
+    
+    Returns:
+        문자열 리스트 (값이 없으면 None)
+    """
+    if not value:
+        return None
+    if isinstance(value, (list, tuple)):
+        return [str(item) for item in value if item]
+    if isinstance(value, str):
+        return [item.strip() for item in value.split('|') if item.strip()]
+    return [str(value)]
+
+
 def create_dim_webtoon_record(
     webtoon_id: str,
     title: str,
@@ -49,7 +320,7 @@ def create_dim_webtoon_record(
         updated_at: 레코드 수정 시각 (선택, 없으면 현재 시각)
     
     Returns:
-        dim_webtoon 레코드 딕셔너리
+        dim_webtoon 레코드 딕셔너리 (비즈니스 필드의 fingerprint 포함)
     
     Raises:
         ValueError: 필수 필드가 누락된 경우
@@ -61,27 +332,11 @@ def create_dim_webtoon_record(
     
     now = datetime.now()
     
-    # tags는 리스트로 저장 (BigQuery에서는 REPEATED STRING으로 사용)
-    tags_list = None
-    if tags:
-        if isinstance(tags, list):
-            tags_list = [str(tag) for tag in tags if tag]
-        elif isinstance(tags, str):
-            tags_list = [t.strip() for t in tags.split('|') if t.strip()]
-        else:
-            tags_list = [str(tags)]
-    
-    # badges는 리스트로 저장 (BigQuery에서는 REPEATED STRING으로 사용)
-    badges_list = None
-    if badges:
-        if isinstance(badges, list):
-            badges_list = [str(badge) for badge in badges if badge]
-        elif isinstance(badges, str):
-            badges_list = [b.strip() for b in badges.split('|') if b.strip()]
-        else:
-            badges_list = [str(badges)]
+    # tags, badges는 리스트로 저장 (BigQuery에서는 REPEATED STRING으로 사용)
+    tags_list = normalize_string_list(tags)
+    badges_list = normalize_string_list(badges)
     
-    return {
+    record = {
         'webtoon_id': str(webtoon_id),
         'title': str(title),
         'author': str(author) if author else None,
@@ -95,6 +350,8 @@ def create_dim_webtoon_record(
         'created_at': created_at if created_at else now,
         'updated_at': updated_at if updated_at else now
     }
+    record['fingerprint'] = compute_dim_webtoon_fingerprint(record)
+    return record
 
 
 def validate_dim_webtoon_record(record: Dict[str, Any]) -> bool:
@@ -125,6 +382,20 @@ def validate_dim_webtoon_record(record: Dict[str, Any]) -> bool:
 # fact_weekly_chart (히스토리 테이블) 스키마
 # ============================================================================
 
+def derive_collected_period(collected_at: datetime) -> tuple:
+    """
+    수집 시각에서 (year, month, week)를 계산합니다.
+    week는 해당 월의 몇 번째 주인지 (1일~7일이 1주차)를 의미합니다.
+    
+    Args:
+        collected_at: 데이터 수집 시각
+    
+    Returns:
+        (year, month, week) 튜플
+    """
+    return collected_at.year, collected_at.month, ((collected_at.day - 1) // 7) + 1
+
+
 def create_fact_weekly_chart_record(
     chart_date: date,
     webtoon_id: str,
@@ -168,14 +439,13 @@ def create_fact_weekly_chart_record(
     
     now = datetime.now() if not collected_at else collected_at
     
+    period_year, period_month, period_week = derive_collected_period(now)
     if year is None:
-        year = now.year
+        year = period_year
     if month is None:
-        month = now.month
-    
+        month = period_month
     if week is None:
-        day_of_month = now.day
-        week = ((day_of_month - 1) // 7) + 1
+        week = period_week
     
     return {
         'chart_date': chart_date if isinstance(chart_date, date) else chart_date,
@@ -235,7 +505,8 @@ DIM_WEBTOON_SCHEMA = {
     'genre': Optional[str],
     'tags': Optional[list],
     'created_at': datetime,
-    'updated_at': datetime
+    'updated_at': datetime,
+    'fingerprint': str  # 비즈니스 필드 sha1 (변경 감지용)
 }
 
 FACT_WEEKLY_CHART_SCHEMA = {
@@ -263,7 +534,8 @@ DIM_WEBTOON_COLUMNS = [
     'badges',
     'content_id',
     'created_at',
-    'updated_at'
+    'updated_at',
+    'fingerprint'
 ]
 
 FACT_WEEKLY_CHART_COLUMNS = [
@@ -281,6 +553,142 @@ FACT_WEEKLY_CHART_COLUMNS = [
 ]
 
 
+# Parquet 저장 시 fact_weekly_chart 파티션 컬럼 (chart_date=.../sort_key=... 디렉토리)
+FACT_WEEKLY_CHART_PARTITION_COLUMNS = ['chart_date', 'sort_key']
+
+
+def get_dim_webtoon_arrow_schema():
+    """
+    dim_webtoon Parquet/Arrow 스키마를 반환합니다.
+    tags, badges는 BigQuery REPEATED STRING에 대응하는 list<string> 컬럼입니다.
+    
+    Returns:
+        pyarrow.Schema (pyarrow 필요)
+    """
+    import pyarrow as pa
+    
+    return pa.schema([
+        ('webtoon_id', pa.string()),
+        ('title', pa.string()),
+        ('author', pa.string()),
+        ('genre', pa.string()),
+        ('tags', pa.list_(pa.string())),
+        ('seo_id', pa.string()),
+        ('adult', pa.bool_()),
+        ('catchphrase', pa.string()),
+        ('badges', pa.list_(pa.string())),
+        ('content_id', pa.int64()),
+        ('created_at', pa.timestamp('us')),
+        ('updated_at', pa.timestamp('us')),
+        ('fingerprint', pa.string()),
+    ])
+
+
+def get_fact_weekly_chart_arrow_schema(include_partition_columns: bool = True):
+    """
+    fact_weekly_chart Parquet/Arrow 스키마를 반환합니다.
+    
+    Args:
+        include_partition_columns: False이면 파티션 컬럼(chart_date, sort_key)을 제외
+            (파티션 값은 디렉토리 이름에 저장되므로 파일에는 쓰지 않음)
+    
+    Returns:
+        pyarrow.Schema (pyarrow 필요)
+    """
+    import pyarrow as pa
+    
+    fields = [
+        ('chart_date', pa.date32()),
+        ('webtoon_id', pa.string()),
+        ('rank', pa.int64()),
+        ('collected_at', pa.timestamp('us')),
+        ('weekday', pa.string()),
+        ('weekday_rank', pa.int64()),
+        ('year', pa.int64()),
+        ('month', pa.int64()),
+        ('week', pa.int64()),
+        ('view_count', pa.int64()),
+        ('sort_key', pa.string()),
+    ]
+    if not include_partition_columns:
+        fields = [f for f in fields if f[0] not in FACT_WEEKLY_CHART_PARTITION_COLUMNS]
+    return pa.schema(fields)
+
+
+def _to_arrow_date(value: Any) -> Optional[date]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(str(value)[:10])
+
+
+def _to_arrow_timestamp(value: Any) -> Optional[datetime]:
+    if value is None or value == '':
+        return None
+    if not isinstance(value, datetime):
+        value = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    if value.tzinfo is not None:
+        # Arrow 스키마는 시간대 없는 UTC 기준 (BigQuery는 시간대 없는 TIMESTAMP를 UTC로 해석)
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _to_arrow_int(value: Any) -> Optional[int]:
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        if isinstance(value, str):
+            return int(value) if value.strip() else None
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+def _to_arrow_string(value: Any) -> Optional[str]:
+    return None if value is None else value if isinstance(value, str) else str(value)
+
+
+def fact_records_to_arrow_table(records: Iterable[Dict[str, Any]], sort_key: Optional[str] = None):
+    """
+    fact_weekly_chart 레코드를 BigQuery 스키마와 같은 타입의 Arrow Table로 변환합니다
+    (transform → upload 전달용, JSONL을 다시 읽고 정규화하지 않도록).
+    
+    변환 직후의 레코드(date/datetime/int)와 JSONL에서 읽은 레코드(문자열 날짜, 문자열/실수 숫자)를
+    모두 받습니다. 정수로 바꿀 수 없는 값은 null이 됩니다.
+    
+    Args:
+        records: fact_weekly_chart 레코드
+        sort_key: sort_key가 없는 레코드에 채울 정렬 키 (파티션의 정렬 키)
+    
+    Returns:
+        pyarrow.Table (get_fact_weekly_chart_arrow_schema(), pyarrow 필요)
+    """
+    import pyarrow as pa
+    
+    schema = get_fact_weekly_chart_arrow_schema()
+    converters = {
+        'date32[day]': _to_arrow_date,
+        'timestamp[us]': _to_arrow_timestamp,
+        'int64': _to_arrow_int,
+        'string': _to_arrow_string,
+    }
+    columns: Dict[str, list] = {name: [] for name in schema.names}
+    for record in records:
+        for name, values in columns.items():
+            values.append(record.get(name))
+    if sort_key is not None:
+        columns['sort_key'] = [sort_key if value is None else value for value in columns['sort_key']]
+    
+    arrays = []
+    for field in schema:
+        convert = converters[str(field.type)]
+        arrays.append(pa.array([convert(value) for value in columns[field.name]], type=field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
 # ============================================================================
 # Foreign Key 관계 검증
 # ============================================================================
@@ -311,3 +719,177 @@ def validate_foreign_key(
     
     return True
 
+
+# ============================================================================
+# 배치 레코드 빌더 (transform 단계)
+# ============================================================================
+
+class ChartRecordBatch:
+    """
+    파싱된 카드 배치를 dim_webtoon / fact_weekly_chart 컬럼 버퍼로 변환한 결과입니다.
+    
+    dim_columns, fact_columns는 컬럼명 → 값 리스트 딕셔너리로, pd.DataFrame(dim_columns)처럼
+    그대로 writer에 넘길 수 있습니다. 레코드(dict) 단위가 필요하면 dim_records(), fact_records()를 사용합니다.
+    """
+    
+    __slots__ = ('collected_at', 'dim_columns', 'fact_columns')
+    
+    def __init__(
+        self,
+        collected_at: datetime,
+        dim_columns: Dict[str, list],
+        fact_columns: Dict[str, list]
+    ) -> None:
+        self.collected_at = collected_at
+        self.dim_columns = dim_columns
+        self.fact_columns = fact_columns
+    
+    @property
+    def dim_count(self) -> int:
+        return len(self.dim_columns['webtoon_id'])
+    
+    @property
+    def fact_count(self) -> int:
+        return len(self.fact_columns['webtoon_id'])
+    
+    def dim_records(self) -> List[Dict[str, Any]]:
+        """dim_webtoon 컬럼 버퍼를 레코드 리스트로 변환합니다."""
+        return _columns_to_records(self.dim_columns, DIM_WEBTOON_COLUMNS)
+    
+    def fact_records(self) -> List[Dict[str, Any]]:
+        """fact_weekly_chart 컬럼 버퍼를 레코드 리스트로 변환합니다."""
+        return _columns_to_records(self.fact_columns, FACT_WEEKLY_CHART_COLUMNS)
+
+
+def _columns_to_records(columns: Dict[str, list], names: List[str]) -> List[Dict[str, Any]]:
+    return [dict(zip(names, row)) for row in zip(*(columns[name] for name in names))]
+
+
+def _compress(values: list, mask: List[bool]) -> list:
+    return [value for value, keep in zip(values, mask) if keep]
+
+
+def _optional_str(values: list) -> list:
+    return [str(value) if value else None for value in values]
+
+
+def _optional_int(values: list) -> Tuple[list, List[bool]]:
+    """값마다 정수로 변환합니다. 변환할 수 없는 값은 None으로 두고 검증 마스크에서 False로 표시합니다."""
+    converted = []
+    valid = []
+    for value in values:
+        try:
+            converted.append(int(value) if value is not None else None)
+            valid.append(True)
+        except (TypeError, ValueError):
+            converted.append(None)
+            valid.append(False)
+    return converted, valid
+
+
+def build_chart_record_batch(
+    cards: Iterable[Any],
+    chart_date: date,
+    sort_key: Optional[str] = None,
+    collected_at: Optional[datetime] = None
+) -> ChartRecordBatch:
+    """
+    파싱된 카드 배치를 한 번에 dim_webtoon / fact_weekly_chart 컬럼 버퍼로 변환합니다.
+    
+    create_dim_webtoon_record / create_fact_weekly_chart_record와 같은 값을 만들지만,
+    - collected_at(및 dim의 created_at, updated_at)은 배치 전체에 하나의 시각을 사용하고
+    - year, month, week는 그 시각에서 한 번만 계산하며
+    - 검증은 레코드마다가 아니라 컬럼 단위로 수행하여 실패 건수를 한 번에 로그로 남깁니다.
+    
+    Args:
+        cards: 파싱된 웹툰 카드 리스트 (WebtoonCard, 기존 dict 형식도 허용)
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (카드에 정렬 키가 없을 때 사용)
+        collected_at: 실행 단위 수집 시각 (없으면 현재 시각)
+    
+    Returns:
+        ChartRecordBatch (검증을 통과한 행만 포함)
+    """
+    now = collected_at or datetime.now()
+    year, month, week = derive_collected_period(now)
+    
+    card_list = []
+    for item in cards:
+        try:
+            card_list.append(item if isinstance(item, WebtoonCard) else WebtoonCard.from_dict(item))
+        except Exception as e:
+            logger.error(f"데이터 변환 실패: {item}, 오류: {e}")
+    
+    # 1. 컬럼 추출
+    webtoon_ids = [str(card.webtoon_id) if card.webtoon_id else '' for card in card_list]
+    titles = [str(card.title) if card.title else '' for card in card_list]
+    ranks = [card.rank if card.rank is not None else 0 for card in card_list]
+    content_ids, content_id_valid = _optional_int([card.content_id for card in card_list])
+    weekday_ranks, weekday_rank_valid = _optional_int([card.weekday_rank for card in card_list])
+    view_counts, view_count_valid = _optional_int([card.view_count for card in card_list])
+    
+    # 2. 컬럼 단위 검증 (dim은 webtoon_id/title/content_id, fact는 추가로 rank/weekday_rank/view_count)
+    #    정수로 변환할 수 없는 값이 있는 행만 제외 (레코드 단위 변환과 같이 나머지 행은 유지)
+    dim_valid = [
+        bool(webtoon_id) and bool(title) and content_ok
+        for webtoon_id, title, content_ok in zip(webtoon_ids, titles, content_id_valid)
+    ]
+    fact_valid = [
+        valid and isinstance(rank, int) and rank >= 1 and weekday_rank_ok and view_count_ok
+        for valid, rank, weekday_rank_ok, view_count_ok in zip(dim_valid, ranks, weekday_rank_valid, view_count_valid)
+    ]
+    
+    dim_invalid = len(card_list) - sum(dim_valid)
+    if dim_invalid:
+        logger.warning(
+            f"dim_webtoon 레코드 검증 실패: {dim_invalid}개 "
+            f"(webtoon_id 또는 title 누락, content_id 변환 실패 {content_id_valid.count(False)}개)"
+        )
+    fact_invalid = sum(dim_valid) - sum(fact_valid)
+    if fact_invalid:
+        logger.warning(
+            f"fact_weekly_chart 레코드 검증 실패: {fact_invalid}개 (rank는 1 이상의 정수여야 하며 "
+            f"weekday_rank 변환 실패 {weekday_rank_valid.count(False)}개, view_count 변환 실패 {view_count_valid.count(False)}개)"
+        )
+    
+    # 3. dim_webtoon 컬럼 버퍼
+    dim_cards = _compress(card_list, dim_valid)
+    dim_count = len(dim_cards)
+    dim_columns = {
+        'webtoon_id': _compress(webtoon_ids, dim_valid),
+        'title': _compress(titles, dim_valid),
+        'author': _optional_str([card.author for card in dim_cards]),
+        'genre': _optional_str([card.genre for card in dim_cards]),
+        'tags': [normalize_string_list(card.tags) for card in dim_cards],
+        'seo_id': _optional_str([card.seo_id for card in dim_cards]),
+        'adult': [bool(card.adult) if card.adult is not None else None for card in dim_cards],
+        'catchphrase': _optional_str([card.catchphrase for card in dim_cards]),
+        'badges': [normalize_string_list(card.badges) for card in dim_cards],
+        'content_id': _compress(content_ids, dim_valid),
+        'created_at': [now] * dim_count,
+        'updated_at': [now] * dim_count,
+    }
+    # 컬럼 값은 이미 정규화되어 있으므로 빈 리스트만 None으로 맞춰 바로 해시
+    dim_columns['fingerprint'] = [
+        _hash_fingerprint_values([value if value != [] else None for value in values])
+        for values in zip(*(dim_columns[field] for field in DIM_WEBTOON_FINGERPRINT_FIELDS))
+    ]
+    
+    # 4. fact_weekly_chart 컬럼 버퍼
+    fact_cards = _compress(card_list, fact_valid)
+    fact_count = len(fact_cards)
+    fact_columns = {
+        'chart_date': [chart_date] * fact_count,
+        'webtoon_id': _compress(webtoon_ids, fact_valid),
+        'rank': _compress(ranks, fact_valid),
+        'collected_at': [now] * fact_count,
+        'weekday': [card.weekday for card in fact_cards],
+        'weekday_rank': _compress(weekday_ranks, fact_valid),
+        'year': [year] * fact_count,
+        'month': [month] * fact_count,
+        'week': [week] * fact_count,
+        'view_count': _compress(view_counts, fact_valid),
+        'sort_key': [card.sort_key or sort_key for card in fact_cards],
+    }
+    
+    return ChartRecordBatch(now, dim_columns, fact_columns)
@@ -6,6 +6,7 @@ Extract → Parse → Transform 전체 플로우를 실행합니다.
 
 import argparse
 import logging
+import os
 import sys
 from datetime import date
 from pathlib import Path
@@ -16,21 +17,22 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.extract import extract_webtoon_chart, SORT_OPTIONS
-from src.parse import parse_html_file
-from src.transform import transform_and_save
+from src.parse import extract_api_data_from_html, parse_html_file
+from src.parse_api import parse_api_response, project_api_response
+from src.transform import TransformRun
 from src.utils import setup_logging, get_log_file_path
 
-# Selenium 기반 정렬 수집 시도
-try:
-    from src.extract_with_sort import extract_webtoon_chart_with_sort, SELENIUM_AVAILABLE
-except ImportError:
-    SELENIUM_AVAILABLE = False
-    extract_webtoon_chart_with_sort = None
-
 logger = None
 
 
-def run_pipeline(chart_date: date = None, html_file: Path = None, collect_all_weekdays: bool = False, sort_keys: list = None) -> bool:
+def run_pipeline(
+    chart_date: date = None,
+    html_file: Path = None,
+    collect_all_weekdays: bool = False,
+    sort_keys: list = None,
+    parallel: bool = False,
+    workers: Optional[int] = None
+) -> bool:
     """
     전체 파이프라인을 실행합니다.
     
@@ -39,6 +41,8 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, collect_all_we
         html_file: 이미 수집된 HTML 파일 경로 (None이면 새로 수집)
         collect_all_weekdays: True이면 모든 요일 데이터 수집
         sort_keys: 정렬 키 리스트 (None이면 ['popularity']만 수집)
+        parallel: True이면 정렬 키별 파싱/저장/업로드를 워커 풀에서 병렬 처리
+        workers: 병렬 처리 워커 수 (None이면 환경 변수 PIPELINE_WORKERS 또는 정렬 키 수)
     
     Returns:
         성공 여부
@@ -70,7 +74,31 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, collect_all_we
                 logger.error("HTML 수집 실패")
                 return False
         
-        # 각 정렬 옵션별로 파싱 및 저장
+        # 수집된 파일 결정 (이미 수집된 HTML 파일이 있으면 재호출하지 않음)
+        source_html_path = html_file if html_file else html_path
+        if html_file:
+            logger.info(f"기존 HTML 파일 사용: {html_file}")
+        
+        # API 응답이 포함된 경우 한 번만 디코딩하고, 사용하는 필드만 남긴 payload를
+        # 모든 정렬 옵션에서 공유합니다 (정렬 키별 재직렬화/임시 파일 없음)
+        slim_api_data = None
+        api_data = extract_api_data_from_html(source_html_path.read_text(encoding='utf-8'))
+        if api_data is not None:
+            slim_api_data = project_api_response(api_data)
+        del api_data
+        
+        # 정렬 옵션별 변환 결과를 모아 두었다가 한 번에 저장
+        # (dim_webtoon은 정렬 옵션과 무관하므로 실행당 한 번만 병합/저장)
+        # BigQuery에 업로드할 때는 저장한 fact_weekly_chart를 Arrow 배치로도 보관하여 파일을 다시 읽지 않음
+        upload_bigquery = os.getenv('UPLOAD_TO_BIGQUERY', 'false').lower() == 'true'
+        transform_run = TransformRun(chart_date, keep_batches=upload_bigquery and not parallel)
+        
+        if parallel:
+            return run_sort_keys_in_parallel(
+                transform_run, sort_keys, slim_api_data, source_html_path, workers
+            )
+        
+        # 각 정렬 옵션별로 파싱 및 변환
         for sort_key in sort_keys:
             if sort_key not in SORT_OPTIONS:
                 logger.warning(f"알 수 없는 정렬 키: {sort_key}, 건너뜁니다.")
@@ -81,49 +109,14 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, collect_all_we
             logger.info(f"정렬 옵션: {sort_name} ({sort_key})")
             logger.info(f"{'='*60}")
             
-            # Step 1: Extract (HTML 수집)
-            # 이미 수집된 HTML 파일 사용 (각 정렬 옵션마다 재호출하지 않음)
-            if html_file:
-                logger.info(f"기존 HTML 파일 사용: {html_file}")
-                current_html_path = html_file
-            else:
-                current_html_path = html_path
-                if current_html_path is None:
-                    logger.error(f"HTML 파일이 없습니다 ({sort_name})")
-                    all_success = False
-                    continue
-            
-            # Step 2: Parse (HTML 파싱)
+            # Step 2: Parse
             # 정렬 키를 전달하여 클라이언트 사이드에서 정렬
-            logger.info(f"HTML 파싱 시작 ({sort_name})...")
-            
-            # HTML 파일을 읽어서 API 데이터에 정렬 키 추가
-            import json
-            import re
-            html_content = current_html_path.read_text(encoding='utf-8')
-            
-            # API 데이터에 정렬 키 추가
-            json_match = re.search(r'<script[^>]*id=[\'"]webtoon-data[\'"][^>]*>(.*?)</script>', html_content, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-                api_data = json.loads(json_str)
-                api_data['_sort_key'] = sort_key
-                
-                # 수정된 API 데이터로 임시 HTML 생성
-                from pathlib import Path
-                import tempfile
-                temp_html = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8')
-                temp_html.write(f"<!-- Sort: {sort_name} -->\n<script type='application/json' id='webtoon-data'>{json.dumps(api_data, ensure_ascii=False)}</script>")
-                temp_html.close()
-                temp_html_path = Path(temp_html.name)
+            logger.info(f"파싱 시작 ({sort_name})...")
+            if slim_api_data is not None:
+                parsed_data = parse_api_response(slim_api_data, sort_key=sort_key)
             else:
-                temp_html_path = current_html_path
+                parsed_data = parse_html_file(source_html_path)
             
-            parsed_data = parse_html_file(temp_html_path)
-            
-            # 임시 파일 삭제
-            if temp_html_path != current_html_path and temp_html_path.exists():
-                temp_html_path.unlink()
             if len(parsed_data) == 0:
                 logger.error(f"파싱된 데이터가 없습니다 ({sort_name}). HTML 구조를 확인하세요.")
                 all_success = False
@@ -131,81 +124,61 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, collect_all_we
             
             logger.info(f"파싱 완료 ({sort_name}): {len(parsed_data)}개 웹툰 데이터")
             
-            # Step 3: Transform (데이터 변환 및 저장)
+            # Step 3: Transform (데이터 변환)
             # 정렬 정보를 메타데이터로 추가
             for item in parsed_data:
-                item['_sort_key'] = sort_key
-                item['_sort_name'] = sort_name
+                item.set_sort(sort_key, sort_name)
             
-            logger.info(f"데이터 변환 및 저장 시작 ({sort_name})...")
-            success = transform_and_save(parsed_data, chart_date)
+            logger.info(f"데이터 변환 시작 ({sort_name})...")
+            if not transform_run.add(parsed_data, sort_key):
+                logger.error(f"❌ {sort_name} 데이터 변환 실패")
+                all_success = False
+        
+        if not transform_run.sort_keys:
+            logger.error("저장할 데이터가 없습니다.")
+            return False
+        
+        # Step 3: 저장 (dim_webtoon 한 번, fact_weekly_chart는 정렬 키별)
+        logger.info("데이터 저장 시작...")
+        if not transform_run.flush():
+            logger.error("❌ 데이터 저장 실패")
+            return False
+        
+        saved_sort_keys = transform_run.sort_keys
+        logger.info(f"✅ 저장 완료: {', '.join(SORT_OPTIONS[k] for k in saved_sort_keys)}")
+        
+        # Step 4: GCS 업로드 (선택적, 환경 변수로 제어)
+        if os.getenv('UPLOAD_TO_GCS', 'false').lower() == 'true':
+            from src.upload_gcs import upload_chart_data_for_dates
             
-            if success:
-                logger.info(f"✅ {sort_name} 수집 완료!")
-                
-                # Step 4: GCS 업로드 (선택적, 환경 변수로 제어)
-                import os
-                if os.getenv('UPLOAD_TO_GCS', 'false').lower() == 'true':
-                    logger.info(f"GCS 업로드 시작 ({sort_name})...")
-                    from src.upload_gcs import upload_chart_data_to_gcs
-                    gcs_success = upload_chart_data_to_gcs(chart_date, sort_key=sort_key)
-                    if gcs_success:
-                        logger.info(f"✅ GCS 업로드 완료 ({sort_name})")
-                    else:
-                        logger.warning(f"⚠️ GCS 업로드 실패 ({sort_name}), 계속 진행...")
-                
-                # Step 5: BigQuery 업로드 (선택적, 환경 변수로 제어)
-                if os.getenv('UPLOAD_TO_BIGQUERY', 'false').lower() == 'true':
-                    logger.info(f"BigQuery 업로드 시작 ({sort_name})...")
-                    from src.upload_bigquery import upload_dim_webtoon, upload_fact_weekly_chart
-                    
-                    # dim_webtoon 업로드 (한 번만)
-                    if sort_key == sort_keys[0]:  # 첫 번째 정렬 옵션일 때만
-                        dim_success = upload_dim_webtoon()
-                        if dim_success:
-                            logger.info("✅ dim_webtoon 업로드 완료")
-                        else:
-                            logger.warning("⚠️ dim_webtoon 업로드 실패, 계속 진행...")
-                    
-                    # fact_weekly_chart 업로드
-                    fact_success = upload_fact_weekly_chart(chart_date, sort_key=sort_key)
-                    if fact_success:
-                        logger.info(f"✅ fact_weekly_chart 업로드 완료 ({sort_name})")
-                    else:
-                        logger.warning(f"⚠️ fact_weekly_chart 업로드 실패 ({sort_name}), 계속 진행...")
-                
-                # Step 4: GCS 업로드 (선택적, 환경 변수로 제어)
-                if os.getenv('UPLOAD_TO_GCS', 'false').lower() == 'true':
-                    logger.info(f"GCS 업로드 시작 ({sort_name})...")
-                    from src.upload_gcs import upload_chart_data_to_gcs
-                    gcs_success = upload_chart_data_to_gcs(chart_date, sort_key=sort_key)
-                    if gcs_success:
-                        logger.info(f"✅ GCS 업로드 완료 ({sort_name})")
-                    else:
-                        logger.warning(f"⚠️ GCS 업로드 실패 ({sort_name}), 계속 진행...")
-                
-                # Step 5: BigQuery 업로드 (선택적, 환경 변수로 제어)
-                if os.getenv('UPLOAD_TO_BIGQUERY', 'false').lower() == 'true':
-                    logger.info(f"BigQuery 업로드 시작 ({sort_name})...")
-                    from src.upload_bigquery import upload_dim_webtoon, upload_fact_weekly_chart
-                    
-                    # dim_webtoon 업로드 (한 번만)
-                    if sort_key == sort_keys[0]:  # 첫 번째 정렬 옵션일 때만
-                        dim_success = upload_dim_webtoon()
-                        if dim_success:
-                            logger.info("✅ dim_webtoon 업로드 완료")
-                        else:
-                            logger.warning("⚠️ dim_webtoon 업로드 실패, 계속 진행...")
-                    
-                    # fact_weekly_chart 업로드
-                    fact_success = upload_fact_weekly_chart(chart_date, sort_key=sort_key)
-                    if fact_success:
-                        logger.info(f"✅ fact_weekly_chart 업로드 완료 ({sort_name})")
-                    else:
-                        logger.warning(f"⚠️ fact_weekly_chart 업로드 실패 ({sort_name}), 계속 진행...")
+            # 정렬 키별 원본 JSON을 워커 풀에서 동시에 업로드
+            sort_names = ', '.join(SORT_OPTIONS[k] for k in saved_sort_keys)
+            logger.info(f"GCS 업로드 시작 ({sort_names})...")
+            gcs_report = upload_chart_data_for_dates([chart_date], saved_sort_keys)
+            gcs_report.log_summary()
+            if gcs_report.success:
+                logger.info(f"✅ GCS 업로드 완료 ({sort_names})")
             else:
-                logger.error(f"❌ {sort_name} 데이터 변환 및 저장 실패")
-                all_success = False
+                failed = ', '.join(result.gcs_path for result in gcs_report.failed)
+                logger.warning(f"⚠️ GCS 업로드 일부 실패 ({failed}), 계속 진행...")
+        
+        # Step 5: BigQuery 업로드 (선택적, 환경 변수로 제어)
+        if upload_bigquery:
+            logger.info("BigQuery 업로드 시작...")
+            from src.upload_bigquery import upload_to_bigquery
+            
+            # dim_webtoon(BigQuery 반영분과 fingerprint가 다른 레코드만)과 fact_weekly_chart(모든 정렬 키를
+            # 임시 테이블 하나와 MERGE 한 번으로)를 동시에 적재하고, MERGE는 적재가 끝난 테이블부터 실행
+            sort_names = ', '.join(SORT_OPTIONS[k] for k in saved_sort_keys)
+            upload_jobs = upload_to_bigquery(
+                [chart_date], saved_sort_keys, dim_delta=transform_run.dim_delta,
+                fact_batches={chart_date: transform_run.fact_batches},
+            )
+            upload_jobs.log_summary()
+            if upload_jobs.success:
+                logger.info(f"✅ BigQuery 업로드 완료 (dim_webtoon, fact_weekly_chart: {sort_names})")
+            else:
+                logger.warning(f"⚠️ BigQuery 업로드 일부 실패 ({sort_names}), 계속 진행...")
         
         if all_success:
             logger.info(f"\n✅ 모든 정렬 옵션 수집 완료!")
@@ -221,6 +194,87 @@ def run_pipeline(chart_date: date = None, html_file: Path = None, collect_all_we
         return False
 
 
+def run_sort_keys_in_parallel(
+    transform_run: TransformRun,
+    sort_keys: list,
+    slim_api_data: Optional[dict],
+    source_html_path: Path,
+    workers: Optional[int] = None
+) -> bool:
+    """
+    정렬 옵션별 파싱 → 저장 → 업로드를 워커 풀에서 병렬로 실행합니다 (--parallel).
+    dim_webtoon은 모든 정렬 옵션의 변환이 끝난 뒤 단일 writer가 한 번만 저장/업로드합니다.
+    
+    Args:
+        transform_run: 변환 결과를 모을 TransformRun
+        sort_keys: 정렬 키 리스트
+        slim_api_data: 작업용 API payload (None이면 HTML 파서 사용)
+        source_html_path: 수집된 HTML 파일 경로
+        workers: 워커 수 (None이면 환경 변수 PIPELINE_WORKERS 또는 정렬 키 수)
+    
+    Returns:
+        모든 정렬 옵션 저장 성공 여부 (업로드 실패는 순차 실행과 같이 경고만 남김)
+    """
+    from src.parallel import run_sort_keys_parallel
+    
+    chart_date = transform_run.chart_date
+    valid_sort_keys = []
+    for sort_key in sort_keys:
+        if sort_key not in SORT_OPTIONS:
+            logger.warning(f"알 수 없는 정렬 키: {sort_key}, 건너뜁니다.")
+            continue
+        valid_sort_keys.append(sort_key)
+    
+    def parse(sort_key):
+        if slim_api_data is not None:
+            return parse_api_response(slim_api_data, sort_key=sort_key)
+        return parse_html_file(source_html_path)
+    
+    upload_to_gcs = os.getenv('UPLOAD_TO_GCS', 'false').lower() == 'true'
+    upload_to_bigquery = os.getenv('UPLOAD_TO_BIGQUERY', 'false').lower() == 'true'
+    
+    if upload_to_gcs:
+        from src.upload_gcs import upload_chart_data_to_gcs
+    if upload_to_bigquery:
+        from src.upload_bigquery import upload_dim_webtoon_delta, upload_fact_weekly_chart
+    
+    def upload_fact(sort_key):
+        success = True
+        if upload_to_gcs and not upload_chart_data_to_gcs(chart_date, sort_key=sort_key):
+            logger.warning(f"⚠️ GCS 업로드 실패 ({SORT_OPTIONS[sort_key]}), 계속 진행...")
+            success = False
+        if upload_to_bigquery and not upload_fact_weekly_chart(chart_date, sort_key=sort_key):
+            logger.warning(f"⚠️ fact_weekly_chart 업로드 실패 ({SORT_OPTIONS[sort_key]}), 계속 진행...")
+            success = False
+        return success
+    
+    def upload_dim(records):
+        return upload_dim_webtoon_delta(records)
+    
+    report = run_sort_keys_parallel(
+        transform_run,
+        valid_sort_keys,
+        parse=parse,
+        upload_fact=upload_fact if (upload_to_gcs or upload_to_bigquery) else None,
+        upload_dim=upload_dim if upload_to_bigquery else None,
+        workers=workers,
+        sort_names=SORT_OPTIONS,
+    )
+    
+    saved_sort_keys = report.saved_sort_keys
+    if not saved_sort_keys:
+        logger.error("저장할 데이터가 없습니다.")
+        return False
+    logger.info(f"✅ 저장 완료: {', '.join(SORT_OPTIONS[k] for k in saved_sort_keys)}")
+    
+    if len(saved_sort_keys) == len(valid_sort_keys):
+        logger.info("\n✅ 모든 정렬 옵션 수집 완료!")
+        return True
+    else:
+        logger.error("\n❌ 일부 정렬 옵션 수집 실패")
+        return False
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='카카오 웹툰 주간 차트 수집 파이프라인')
     parser.add_argument(
@@ -249,6 +303,16 @@ if __name__ == "__main__":
         action='store_true',
         help='모든 정렬 옵션 수집 (popularity, views, createdAt, popularityMale, popularityFemale)'
     )
+    parser.add_argument(
+        '--parallel',
+        action='store_true',
+        help='정렬 옵션별 파싱/저장/업로드를 병렬로 실행'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='--parallel 워커 수 (기본값: 환경 변수 PIPELINE_WORKERS 또는 정렬 옵션 수)'
+    )
     
     args = parser.parse_args()
     
@@ -283,7 +347,9 @@ if __name__ == "__main__":
         chart_date=chart_date,
         html_file=html_file,
         collect_all_weekdays=args.all_weekdays,
-        sort_keys=sort_keys
+        sort_keys=sort_keys,
+        parallel=args.parallel,
+        workers=args.workers
     )
     sys.exit(0 if success else 1)
 
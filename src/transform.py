@@ -1,7 +1,8 @@
 """
 Transform 모듈: 데이터 변환 및 정규화
 
-이 모듈은 파싱된 데이터를 스키마에 맞게 변환하고 CSV로 저장합니다.
+이 모듈은 파싱된 데이터를 스키마에 맞게 변환하고 JSONL, CSV, Parquet 또는
+로컬 웨어하우스(SQLite)에 저장합니다.
 - dim_webtoon (마스터 테이블) 데이터 생성 및 저장
 - fact_weekly_chart (히스토리 테이블) 데이터 생성 및 저장
 - 멱등성 보장 (중복 체크)
@@ -9,40 +10,81 @@ Transform 모듈: 데이터 변환 및 정규화
 주의: 실제 수집되는 데이터 필드에 따라 스키마가 수정될 수 있습니다.
 """
 
+from __future__ import annotations
+
+import ast
 import csv
+import importlib.util
 import json
 import logging
+import threading
 from datetime import date, datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set
-
-import pandas as pd
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from src.dim_store import DimWebtoonStore
+from src.warehouse import LocalWarehouse
 from src.models import (
-    create_dim_webtoon_record,
-    create_fact_weekly_chart_record,
-    validate_dim_webtoon_record,
-    validate_fact_weekly_chart_record,
+    WebtoonCard,
+    build_chart_record_batch,
+    compute_dim_webtoon_fingerprint,
+    fact_records_to_arrow_table,
     validate_foreign_key,
     DIM_WEBTOON_COLUMNS,
     FACT_WEEKLY_CHART_COLUMNS,
+    FACT_WEEKLY_CHART_PARTITION_COLUMNS,
+    get_dim_webtoon_arrow_schema,
+    get_fact_weekly_chart_arrow_schema,
 )
 from src.utils import (
     get_chart_csv_path,
     get_chart_jsonl_path,
     get_dim_webtoon_csv_path,
     get_dim_webtoon_jsonl_path,
+    get_dim_webtoon_changelog_path,
+    get_dim_webtoon_parquet_path,
+    get_chart_parquet_path,
+    get_fact_weekly_chart_parquet_dir,
+    get_warehouse_path,
     get_data_format,
     format_date,
     format_datetime,
     parse_date,
+    TIMESTAMP_FORMAT,
     parse_datetime,
     setup_logging,
     ensure_dir,
+    atomic_write,
+    file_lock,
+    serialize_datetime_for_json,
+    LazyModule,
 )
 
+# pandas/numpy는 이력 전체를 다루는 경로(CSV/Parquet 병합, 이력 조회)에서만 필요하므로
+# 처음 사용할 때 import (JSONL 일일 실행 경로는 pandas 없이 동작)
+pd = LazyModule('pandas')
+np = LazyModule('numpy')
+
+# pyarrow는 DATA_FORMAT=parquet과 BigQuery 업로드용 Arrow 배치(TransformRun keep_batches)에서만 필요
+# (pyarrow.dataset이 pandas를 import하므로 함께 지연 로드)
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+# keep_batches를 요청했지만 pyarrow가 없다는 경고는 프로세스당 한 번만
+_KEEP_BATCHES_WARNED = [False]
+pa = LazyModule('pyarrow')
+pa_ds = LazyModule('pyarrow.dataset')
+pq = LazyModule('pyarrow.parquet')
+
 logger = logging.getLogger(__name__)
 
+# JSONL 저장 시 한 번에 write하는 라인 수
+JSONL_WRITE_CHUNK_ROWS = 10000
+
+# JSONL 저장 시 파일 버퍼 크기 (bytes)
+JSONL_WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Parquet 저장 시 압축 코덱
+PARQUET_COMPRESSION = 'zstd'
+
 
 def serialize_for_json(obj):
     """
@@ -60,32 +102,26 @@ def serialize_for_json(obj):
 
 def load_dim_webtoon_jsonl() -> pd.DataFrame:
     """
-    dim_webtoon JSONL 파일을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    dim_webtoon JSONL 스냅샷과 변경 로그를 합쳐 최신 레코드를 로드합니다.
+    파일이 없으면 빈 DataFrame 반환.
     
     Returns:
         dim_webtoon DataFrame
     """
-    file_path = get_dim_webtoon_jsonl_path()
-    
-    if not file_path.exists():
-        logger.info("dim_webtoon.jsonl 파일이 없습니다. 새로 생성합니다.")
-        return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
-    
     try:
-        records = []
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                if line.strip():
-                    record = json.loads(line)
-                    # datetime 문자열을 datetime 객체로 변환
-                    if 'created_at' in record and record['created_at']:
-                        record['created_at'] = datetime.fromisoformat(record['created_at'].replace('Z', '+00:00'))
-                    if 'updated_at' in record and record['updated_at']:
-                        record['updated_at'] = datetime.fromisoformat(record['updated_at'].replace('Z', '+00:00'))
-                    records.append(record)
-        
-        if len(records) == 0:
-            return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
+        with DimWebtoonStore() as store:
+            if len(store) == 0:
+                logger.info("dim_webtoon.jsonl 파일이 없습니다. 새로 생성합니다.")
+                return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
+            
+            records = []
+            for record in store.records():
+                # datetime 문자열을 datetime 객체로 변환
+                if 'created_at' in record and record['created_at']:
+                    record['created_at'] = datetime.fromisoformat(record['created_at'].replace('Z', '+00:00'))
+                if 'updated_at' in record and record['updated_at']:
+                    record['updated_at'] = datetime.fromisoformat(record['updated_at'].replace('Z', '+00:00'))
+                records.append(record)
         
         df = pd.DataFrame(records)
         logger.info(f"dim_webtoon.jsonl 로드 완료: {len(df)}개 레코드")
@@ -106,6 +142,10 @@ def load_dim_webtoon() -> pd.DataFrame:
     data_format = get_data_format()
     if data_format == 'jsonl':
         return load_dim_webtoon_jsonl()
+    elif data_format == 'parquet':
+        return load_dim_webtoon_parquet()
+    elif data_format == 'sqlite':
+        return load_dim_webtoon_sqlite()
     else:
         return load_dim_webtoon_csv()
 
@@ -131,18 +171,22 @@ def load_dim_webtoon_csv() -> pd.DataFrame:
             df['tags'] = None
             logger.debug("기존 CSV에 tags 컬럼이 없어 추가했습니다.")
         
-        # tags를 파이프로 구분된 문자열에서 리스트로 변환 (BigQuery REPEATED STRING용)
-        if 'tags' in df.columns:
-            def convert_tags_to_list(tags_str):
-                if tags_str is None or (isinstance(tags_str, float) and pd.isna(tags_str)):
-                    return None
-                if isinstance(tags_str, list):
-                    return tags_str  # 이미 리스트인 경우
-                if isinstance(tags_str, str):
-                    return [t.strip() for t in tags_str.split('|') if t.strip()]
+        # tags, badges를 파이프로 구분된 문자열에서 리스트로 변환 (BigQuery REPEATED STRING용)
+        def convert_tags_to_list(tags_str):
+            if tags_str is None or (isinstance(tags_str, float) and pd.isna(tags_str)):
                 return None
-            
-            df['tags'] = df['tags'].apply(convert_tags_to_list)
+            if isinstance(tags_str, list):
+                return tags_str  # 이미 리스트인 경우
+            if isinstance(tags_str, str):
+                if tags_str.startswith('[') and tags_str.endswith(']'):
+                    # 예전 CSV는 badges 리스트를 repr 문자열로 저장함
+                    return [str(t) for t in ast.literal_eval(tags_str) if t] or None
+                return [t.strip() for t in tags_str.split('|') if t.strip()]
+            return None
+        
+        for column in ('tags', 'badges'):
+            if column in df.columns:
+                df[column] = df[column].apply(convert_tags_to_list)
         
         # created_at, updated_at을 datetime 타입으로 변환
         if 'created_at' in df.columns:
@@ -157,21 +201,22 @@ def load_dim_webtoon_csv() -> pd.DataFrame:
         return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
 
 
-def load_fact_weekly_chart_jsonl(chart_date: date) -> pd.DataFrame:
+def load_fact_weekly_chart_jsonl(chart_date: date, sort_key: Optional[str] = None) -> pd.DataFrame:
     """
-    fact_weekly_chart JSONL 파일을 로드합니다 (날짜별 파일).
+    fact_weekly_chart JSONL 파일을 로드합니다 (날짜별, 정렬 키별 파일).
     파일이 없으면 빈 DataFrame 반환.
     
     Args:
         chart_date: 수집 날짜
+        sort_key: 정렬 키 (None이면 기본 파일명)
     
     Returns:
         fact_weekly_chart DataFrame
     """
-    file_path = get_chart_jsonl_path(chart_date)
+    file_path = get_chart_jsonl_path(chart_date, sort_key)
     
     if not file_path.exists():
-        logger.info(f"fact_weekly_chart {format_date(chart_date)}.jsonl 파일이 없습니다.")
+        logger.info(f"fact_weekly_chart {file_path.name} 파일이 없습니다.")
         return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
     
     try:
@@ -191,27 +236,32 @@ def load_fact_weekly_chart_jsonl(chart_date: date) -> pd.DataFrame:
             return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
         
         df = pd.DataFrame(records)
-        logger.info(f"fact_weekly_chart {format_date(chart_date)}.jsonl 로드 완료: {len(df)}개 레코드")
+        logger.info(f"fact_weekly_chart {file_path.name} 로드 완료: {len(df)}개 레코드")
         return df
     except Exception as e:
         logger.error(f"fact_weekly_chart JSONL 로드 실패: {e}")
         return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
 
 
-def load_fact_weekly_chart(chart_date: date) -> pd.DataFrame:
+def load_fact_weekly_chart(chart_date: date, sort_key: Optional[str] = None) -> pd.DataFrame:
     """
     fact_weekly_chart 파일을 로드합니다 (JSONL 또는 CSV).
     DATA_FORMAT 환경 변수에 따라 형식을 결정합니다.
     
     Args:
         chart_date: 수집 날짜
+        sort_key: 정렬 키 (CSV 제외, None이면 기본 파일명/파티션)
     
     Returns:
         fact_weekly_chart DataFrame
     """
     data_format = get_data_format()
     if data_format == 'jsonl':
-        return load_fact_weekly_chart_jsonl(chart_date)
+        return load_fact_weekly_chart_jsonl(chart_date, sort_key)
+    elif data_format == 'parquet':
+        return load_fact_weekly_chart_parquet(chart_date, sort_key)
+    elif data_format == 'sqlite':
+        return load_fact_weekly_chart_sqlite(chart_date, sort_key)
     else:
         return load_fact_weekly_chart_csv(chart_date)
 
@@ -276,11 +326,272 @@ def load_fact_weekly_chart_csv(chart_date: date) -> pd.DataFrame:
         return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
 
 
+def require_pyarrow() -> None:
+    """
+    Parquet 형식 사용 시 pyarrow 설치 여부를 확인합니다.
+    
+    Raises:
+        ImportError: pyarrow가 설치되어 있지 않은 경우
+    """
+    if not PYARROW_AVAILABLE:
+        raise ImportError("DATA_FORMAT=parquet을 사용하려면 pyarrow가 필요합니다: pip install pyarrow")
+
+
+def arrow_table_to_dataframe(table: 'pa.Table') -> pd.DataFrame:
+    """
+    Arrow Table을 DataFrame으로 변환합니다.
+    JSONL 로더와 같은 형태가 되도록 정수 컬럼의 null은 None으로, list 컬럼은 리스트로 변환합니다.
+    
+    Args:
+        table: Arrow Table
+    
+    Returns:
+        DataFrame
+    """
+    df = table.to_pandas(integer_object_nulls=True, date_as_object=True)
+    for field in table.schema:
+        if pa.types.is_list(field.type):
+            df[field.name] = [list(v) if v is not None else None for v in df[field.name]]
+    return df
+
+
+def load_dim_webtoon_parquet() -> pd.DataFrame:
+    """
+    dim_webtoon Parquet 파일을 로드합니다. 파일이 없으면 빈 DataFrame 반환.
+    
+    Returns:
+        dim_webtoon DataFrame
+    """
+    require_pyarrow()
+    file_path = get_dim_webtoon_parquet_path()
+    
+    if not file_path.exists():
+        logger.info("dim_webtoon.parquet 파일이 없습니다. 새로 생성합니다.")
+        return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
+    
+    try:
+        df = arrow_table_to_dataframe(pq.read_table(file_path))
+        logger.info(f"dim_webtoon.parquet 로드 완료: {len(df)}개 레코드")
+        return df
+    except Exception as e:
+        logger.error(f"dim_webtoon.parquet 로드 실패: {e}")
+        return pd.DataFrame(columns=DIM_WEBTOON_COLUMNS)
+
+
+def get_fact_weekly_chart_dataset() -> 'pa_ds.Dataset':
+    """
+    fact_weekly_chart Parquet 데이터셋을 반환합니다.
+    chart_date, sort_key는 디렉토리 이름(hive 파티션)에서 복원됩니다.
+    
+    Returns:
+        pyarrow.dataset.Dataset
+    """
+    require_pyarrow()
+    schema = get_fact_weekly_chart_arrow_schema()
+    partitioning = pa_ds.partitioning(
+        pa.schema([schema.field(col) for col in FACT_WEEKLY_CHART_PARTITION_COLUMNS]),
+        flavor='hive'
+    )
+    return pa_ds.dataset(
+        get_fact_weekly_chart_parquet_dir(),
+        schema=schema,
+        format='parquet',
+        partitioning=partitioning
+    )
+
+
+def load_fact_weekly_chart_history(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    sort_keys: Optional[List[Optional[str]]] = None,
+    weekdays: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None
+) -> pd.DataFrame:
+    """
+    Parquet 데이터셋에서 조건에 맞는 fact_weekly_chart 레코드를 로드합니다.
+    
+    chart_date, sort_key 조건은 파티션 디렉토리 단위로 걸러지고(읽지 않을 파일은 열지 않음),
+    weekday 조건은 row group 통계로 걸러집니다 (predicate pushdown).
+    
+    Args:
+        start_date: 시작 날짜 (포함, None이면 제한 없음)
+        end_date: 종료 날짜 (포함, None이면 제한 없음)
+        sort_keys: 정렬 키 리스트 (None 원소는 정렬 키 없는 파티션, None이면 전체)
+        weekdays: 요일 리스트 (None이면 전체)
+        columns: 읽을 컬럼 리스트 (None이면 전체)
+    
+    Returns:
+        fact_weekly_chart DataFrame
+    """
+    dataset = get_fact_weekly_chart_dataset()
+    
+    conditions = []
+    if start_date is not None:
+        conditions.append(pa_ds.field('chart_date') >= start_date)
+    if end_date is not None:
+        conditions.append(pa_ds.field('chart_date') <= end_date)
+    if sort_keys is not None:
+        named_keys = [k for k in sort_keys if k is not None]
+        condition = pa_ds.field('sort_key').isin(named_keys)
+        if None in sort_keys:
+            condition = condition | pa_ds.field('sort_key').is_null()
+        conditions.append(condition)
+    if weekdays is not None:
+        conditions.append(pa_ds.field('weekday').isin(weekdays))
+    
+    filter_expression = None
+    for condition in conditions:
+        filter_expression = condition if filter_expression is None else filter_expression & condition
+    
+    table = dataset.to_table(columns=columns or FACT_WEEKLY_CHART_COLUMNS, filter=filter_expression)
+    return arrow_table_to_dataframe(table)
+
+
+def load_fact_weekly_chart_parquet(chart_date: date, sort_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    fact_weekly_chart Parquet 파티션(날짜, 정렬 키)을 로드합니다.
+    파티션이 없으면 빈 DataFrame 반환.
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (None이면 정렬 키 없는 파티션)
+    
+    Returns:
+        fact_weekly_chart DataFrame
+    """
+    require_pyarrow()
+    
+    try:
+        df = load_fact_weekly_chart_history(start_date=chart_date, end_date=chart_date, sort_keys=[sort_key])
+        if len(df) == 0:
+            logger.info(f"fact_weekly_chart {format_date(chart_date)} ({sort_key}) Parquet 파티션이 없습니다.")
+            return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
+        
+        logger.info(f"fact_weekly_chart {format_date(chart_date)} ({sort_key}) Parquet 로드 완료: {len(df)}개 레코드")
+        return df
+    except Exception as e:
+        logger.error(f"fact_weekly_chart Parquet 로드 실패: {e}")
+        return pd.DataFrame(columns=FACT_WEEKLY_CHART_COLUMNS)
+
+
+def load_dim_webtoon_sqlite() -> pd.DataFrame:
+    """
+    로컬 웨어하우스에서 dim_webtoon을 로드합니다.
+    
+    Returns:
+        dim_webtoon DataFrame
+    """
+    with LocalWarehouse() as warehouse:
+        records = warehouse.load_dim_webtoon()
+    logger.info(f"dim_webtoon 웨어하우스 로드 완료: {len(records)}개 레코드")
+    return pd.DataFrame(records, columns=DIM_WEBTOON_COLUMNS)
+
+
+def load_fact_weekly_chart_sqlite(chart_date: date, sort_key: Optional[str] = None) -> pd.DataFrame:
+    """
+    로컬 웨어하우스에서 날짜, 정렬 키에 해당하는 fact_weekly_chart를 로드합니다.
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (None이면 정렬 키 없는 레코드)
+    
+    Returns:
+        fact_weekly_chart DataFrame
+    """
+    with LocalWarehouse() as warehouse:
+        records = warehouse.load_fact_weekly_chart(start_date=chart_date, end_date=chart_date, sort_keys=[sort_key])
+    logger.info(f"fact_weekly_chart {format_date(chart_date)} ({sort_key}) 웨어하우스 로드 완료: {len(records)}개 레코드")
+    return pd.DataFrame(records, columns=FACT_WEEKLY_CHART_COLUMNS)
+
+
+def format_timestamp_column(series: pd.Series) -> List[Optional[str]]:
+    """
+    datetime 컬럼 전체를 한 번에 ISO 형식 문자열로 변환합니다.
+    pd.Timestamp.isoformat()과 같은 결과를 만듭니다 (마이크로초/나노초가 0이면 생략).
+    
+    Args:
+        series: datetime64 컬럼
+    
+    Returns:
+        ISO 형식 문자열 리스트 (NaT는 None)
+    """
+    if series.dt.tz is not None:
+        # 타임존이 있으면 오프셋 표기를 그대로 맞추기 위해 Timestamp.isoformat 사용
+        return [None if pd.isna(value) else value.isoformat() for value in series]
+    
+    missing = series.isna().to_numpy()
+    values = series.to_numpy()
+    
+    # 초 단위 문자열을 기본으로, 소수부가 있는 값만 마이크로초/나노초 문자열로 교체
+    seconds = values.astype('datetime64[s]')
+    text = np.datetime_as_string(seconds, unit='s').astype(object)
+    micros = values.astype('datetime64[us]')
+    has_micro = micros != seconds
+    if has_micro.any():
+        text = np.where(has_micro, np.datetime_as_string(micros, unit='us'), text)
+    if np.datetime_data(values.dtype)[0] == 'ns':
+        has_nano = values != micros
+        if has_nano.any():
+            text = np.where(has_nano, np.datetime_as_string(values, unit='ns'), text)
+    
+    text[missing] = None
+    return text.tolist()
+
+
+def column_to_json_values(series: pd.Series) -> list:
+    """
+    DataFrame 컬럼을 JSON 직렬화 가능한 파이썬 값 리스트로 일괄 변환합니다.
+    - datetime 컬럼은 ISO 형식 문자열로 변환
+    - NaN/NaT/None은 None(JSON null)으로 변환 (리스트 값은 그대로 유지)
+    
+    Args:
+        series: 변환할 컬럼
+    
+    Returns:
+        파이썬 값 리스트
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return format_timestamp_column(series)
+    
+    missing = series.isna().to_numpy()
+    values = series.to_numpy(dtype=object, copy=bool(missing.any()))
+    if missing.any():
+        values[missing] = None
+    return values.tolist()
+
+
+def write_jsonl_dataframe(df: pd.DataFrame, file_path: Path) -> None:
+    """
+    DataFrame을 JSONL 파일로 저장합니다 (컬럼 단위 변환).
+    
+    행마다 iterrows/to_dict를 호출하는 대신 컬럼 단위로 타입을 변환한 뒤,
+    JSONL_WRITE_CHUNK_ROWS개 라인씩 모아서 기록합니다.
+    
+    Args:
+        df: 저장할 DataFrame
+        file_path: 저장할 JSONL 파일 경로
+    """
+    columns = [str(col) for col in df.columns]
+    column_values = [column_to_json_values(df[col]) for col in df.columns]
+    encode = json.JSONEncoder(ensure_ascii=False, default=serialize_for_json).encode
+    
+    with atomic_write(file_path, 'w', buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+        chunk = []
+        for row in zip(*column_values):
+            chunk.append(encode(dict(zip(columns, row))))
+            if len(chunk) >= JSONL_WRITE_CHUNK_ROWS:
+                f.write('\n'.join(chunk) + '\n')
+                chunk = []
+        if chunk:
+            f.write('\n'.join(chunk) + '\n')
+
+
 def save_dim_webtoon_jsonl(df: pd.DataFrame) -> None:
     """
     dim_webtoon DataFrame을 JSONL 파일로 저장합니다.
     
     tags는 리스트 그대로 저장됩니다 (BigQuery REPEATED STRING용).
+    전체 스냅샷을 새로 쓰므로 기존 변경 로그는 삭제합니다.
     
     Args:
         df: 저장할 DataFrame
@@ -289,27 +600,14 @@ def save_dim_webtoon_jsonl(df: pd.DataFrame) -> None:
     
     try:
         # 컬럼 순서 보장
-        df = df[DIM_WEBTOON_COLUMNS].copy() if all(col in df.columns for col in DIM_WEBTOON_COLUMNS) else df.copy()
+        df = df[DIM_WEBTOON_COLUMNS] if all(col in df.columns for col in DIM_WEBTOON_COLUMNS) else df
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            for _, row in df.iterrows():
-                record = row.to_dict()
-                # datetime을 ISO 형식 문자열로 변환
-                if 'created_at' in record and pd.notna(record['created_at']):
-                    if isinstance(record['created_at'], pd.Timestamp):
-                        record['created_at'] = record['created_at'].isoformat()
-                if 'updated_at' in record and pd.notna(record['updated_at']):
-                    if isinstance(record['updated_at'], pd.Timestamp):
-                        record['updated_at'] = record['updated_at'].isoformat()
-                # None을 null로 변환 (리스트는 그대로 유지)
-                def convert_value(val):
-                    if isinstance(val, list):
-                        return val  # 리스트는 그대로
-                    if pd.isna(val):
-                        return None
-                    return val
-                record = {k: convert_value(v) for k, v in record.items()}
-                f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
+        with file_lock(file_path):
+            write_jsonl_dataframe(df, file_path)
+            
+            changelog_path = get_dim_webtoon_changelog_path()
+            if changelog_path.exists():
+                changelog_path.unlink()
         
         logger.info(f"dim_webtoon.jsonl 저장 완료: {len(df)}개 레코드")
     except Exception as e:
@@ -321,7 +619,7 @@ def save_dim_webtoon_csv(df: pd.DataFrame) -> None:
     """
     dim_webtoon DataFrame을 CSV 파일로 저장합니다.
     
-    tags는 리스트인 경우 파이프로 구분된 문자열로 변환하여 저장합니다.
+    tags, badges는 리스트인 경우 파이프로 구분된 문자열로 변환하여 저장합니다.
     (BigQuery 적재 시에는 리스트를 REPEATED STRING으로 변환)
     
     Args:
@@ -333,24 +631,151 @@ def save_dim_webtoon_csv(df: pd.DataFrame) -> None:
         # 컬럼 순서 보장
         df = df[DIM_WEBTOON_COLUMNS].copy() if all(col in df.columns for col in DIM_WEBTOON_COLUMNS) else df.copy()
         
-        # tags를 리스트에서 파이프로 구분된 문자열로 변환 (CSV 저장용)
-        if 'tags' in df.columns:
-            def convert_tags_to_string(tags):
-                if tags is None or (isinstance(tags, float) and pd.isna(tags)):
-                    return None
-                if isinstance(tags, list):
-                    return '|'.join(str(tag) for tag in tags if tag)
-                return str(tags) if tags else None
-            
-            df['tags'] = df['tags'].apply(convert_tags_to_string)
+        # tags, badges를 리스트에서 파이프로 구분된 문자열로 변환 (CSV 저장용)
+        def convert_tags_to_string(tags):
+            if tags is None or (isinstance(tags, float) and pd.isna(tags)):
+                return None
+            if isinstance(tags, list):
+                return '|'.join(str(tag) for tag in tags if tag)
+            return str(tags) if tags else None
+        
+        for column in ('tags', 'badges'):
+            if column in df.columns:
+                df[column] = df[column].apply(convert_tags_to_string)
         
-        df.to_csv(file_path, index=False, encoding='utf-8')
+        with file_lock(file_path), atomic_write(file_path) as f:
+            df.to_csv(f, index=False)
         logger.info(f"dim_webtoon.csv 저장 완료: {len(df)}개 레코드")
     except Exception as e:
         logger.error(f"dim_webtoon.csv 저장 실패: {e}")
         raise
 
 
+def column_to_arrow(series: pd.Series, arrow_type: 'pa.DataType') -> 'pa.Array':
+    """
+    DataFrame 컬럼을 Arrow 타입에 맞게 변환합니다.
+    JSONL/CSV에서 읽은 문자열 날짜, NaN이 섞인 정수 컬럼 등도 처리합니다.
+    
+    Args:
+        series: DataFrame 컬럼
+        arrow_type: 대상 Arrow 타입
+    
+    Returns:
+        Arrow Array
+    """
+    if pa.types.is_list(arrow_type):
+        values = [list(v) if isinstance(v, (list, tuple, np.ndarray)) else None for v in series]
+        return pa.array(values, type=arrow_type)
+    
+    if pa.types.is_timestamp(arrow_type):
+        try:
+            values = pd.to_datetime(series, format='ISO8601')
+        except (ValueError, TypeError):
+            # timezone이 섞여 있으면 UTC로 맞춤
+            values = pd.to_datetime(series, format='ISO8601', utc=True)
+        if values.dt.tz is not None:
+            values = values.dt.tz_convert('UTC').dt.tz_localize(None)
+        return pa.array(values.astype('datetime64[us]'), type=arrow_type, from_pandas=True)
+    
+    if pa.types.is_date(arrow_type):
+        values = pd.to_datetime(series, format='ISO8601')
+        return pa.array(values.dt.date.where(values.notna(), None), type=arrow_type, from_pandas=True)
+    
+    if pa.types.is_integer(arrow_type):
+        return pa.array(pd.to_numeric(series), type=arrow_type, from_pandas=True)
+    
+    if pa.types.is_boolean(arrow_type):
+        return pa.array(series, type=arrow_type, from_pandas=True)
+    
+    values = [None if v is None or (isinstance(v, float) and np.isnan(v)) else str(v) for v in series]
+    return pa.array(values, type=arrow_type)
+
+
+def dataframe_to_arrow_table(df: pd.DataFrame, schema: 'pa.Schema') -> 'pa.Table':
+    """
+    DataFrame을 스키마에 맞는 Arrow Table로 변환합니다.
+    스키마에 있지만 DataFrame에 없는 컬럼은 null로 채웁니다.
+    
+    Args:
+        df: 변환할 DataFrame
+        schema: Arrow 스키마
+    
+    Returns:
+        Arrow Table
+    """
+    arrays = []
+    for field in schema:
+        if field.name in df.columns:
+            series = df[field.name]
+        else:
+            series = pd.Series([None] * len(df), dtype=object)
+        arrays.append(column_to_arrow(series, field.type))
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def save_dim_webtoon_parquet(df: pd.DataFrame) -> None:
+    """
+    dim_webtoon DataFrame을 Parquet 파일로 저장합니다.
+    
+    tags, badges는 list<string> 컬럼으로 저장됩니다 (BigQuery REPEATED STRING용).
+    
+    Args:
+        df: 저장할 DataFrame
+    """
+    require_pyarrow()
+    file_path = get_dim_webtoon_parquet_path()
+    
+    try:
+        table = dataframe_to_arrow_table(df, get_dim_webtoon_arrow_schema())
+        with file_lock(file_path), atomic_write(file_path, 'wb') as f:
+            pq.write_table(table, f, compression=PARQUET_COMPRESSION)
+        logger.info(f"dim_webtoon.parquet 저장 완료: {len(df)}개 레코드")
+    except Exception as e:
+        logger.error(f"dim_webtoon.parquet 저장 실패: {e}")
+        raise
+
+
+def dataframe_to_records(df: pd.DataFrame) -> List[Dict]:
+    """
+    DataFrame을 레코드 리스트로 변환합니다 (NaN/NaT는 None).
+    
+    Args:
+        df: 변환할 DataFrame
+    
+    Returns:
+        레코드 리스트
+    """
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+
+def save_dim_webtoon_sqlite(df: pd.DataFrame) -> None:
+    """
+    dim_webtoon DataFrame을 로컬 웨어하우스에 upsert합니다.
+    
+    Args:
+        df: 저장할 DataFrame
+    """
+    with LocalWarehouse() as warehouse:
+        warehouse.upsert_dim_webtoon(dataframe_to_records(df))
+
+
+def get_dim_webtoon_path() -> Path:
+    """
+    DATA_FORMAT에 해당하는 dim_webtoon 파일 경로를 반환합니다 (잠금 대상).
+    
+    Returns:
+        dim_webtoon 파일 Path 객체 (sqlite는 웨어하우스 파일)
+    """
+    data_format = get_data_format()
+    if data_format == 'jsonl':
+        return get_dim_webtoon_jsonl_path()
+    if data_format == 'parquet':
+        return get_dim_webtoon_parquet_path()
+    if data_format == 'sqlite':
+        return get_warehouse_path()
+    return get_dim_webtoon_csv_path()
+
+
 def save_dim_webtoon(df: pd.DataFrame) -> None:
     """
     dim_webtoon DataFrame을 저장합니다 (JSONL 또는 CSV).
@@ -362,6 +787,10 @@ def save_dim_webtoon(df: pd.DataFrame) -> None:
     data_format = get_data_format()
     if data_format == 'jsonl':
         save_dim_webtoon_jsonl(df)
+    elif data_format == 'parquet':
+        save_dim_webtoon_parquet(df)
+    elif data_format == 'sqlite':
+        save_dim_webtoon_sqlite(df)
     else:
         save_dim_webtoon_csv(df)
 
@@ -387,13 +816,153 @@ def save_fact_weekly_chart_jsonl(df: pd.DataFrame, chart_date: date, sort_key: O
         raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
 
     records = df.to_dict(orient='records')
-    with open(file_path, 'w', encoding='utf-8') as f:
+    with file_lock(file_path), atomic_write(file_path) as f:
         for record in records:
             # NaN 값을 None으로 변환 (JSON null)
             record = {k: (None if (isinstance(v, float) and pd.isna(v)) else v) for k, v in record.items()}
             f.write(json.dumps(record, ensure_ascii=False, default=serialize_for_json) + '\n')
     
-    logger.info(f"fact_weekly_chart {format_date(chart_date)}.jsonl 저장 완료: {len(df)}개 레코드")
+    logger.info(f"fact_weekly_chart {file_path.name} 저장 완료: {len(df)}개 레코드")
+
+
+def fact_weekly_chart_key(record: Dict) -> Tuple[str, str, str, str]:
+    """
+    fact_weekly_chart 레코드의 (chart_date, webtoon_id, weekday, sort_key) 복합 키를 반환합니다.
+    fact_weekly_chart_key_hashes와 같이 None은 빈 문자열로 취급합니다.
+    
+    Args:
+        record: fact_weekly_chart 레코드 (chart_date는 date 또는 ISO 문자열)
+    
+    Returns:
+        복합 키 튜플
+    """
+    chart_date = record.get('chart_date')
+    if isinstance(chart_date, date):
+        chart_date = chart_date.isoformat()
+    return (
+        str(chart_date) if chart_date is not None else '',
+        str(record.get('webtoon_id') or ''),
+        record.get('weekday') or '',
+        record.get('sort_key') or '',
+    )
+
+
+def iter_jsonl_lines(file_path: Path) -> Iterator[str]:
+    """
+    JSONL 파일의 비어 있지 않은 라인을 하나씩 반환합니다 (줄바꿈 포함).
+    
+    Args:
+        file_path: JSONL 파일 경로
+    
+    Yields:
+        JSON 라인 문자열
+    """
+    with open(file_path, 'r', encoding='utf-8', buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+        for line in f:
+            if line.strip():
+                yield line if line.endswith('\n') else line + '\n'
+
+
+def iter_json_lines(records: Iterable[Dict]) -> Iterator[str]:
+    """
+    레코드를 JSON 라인으로 하나씩 직렬화합니다 (date/datetime은 ISO 문자열).
+    
+    Args:
+        records: 레코드 iterable
+    
+    Yields:
+        JSON 라인 문자열
+    """
+    encode = json.JSONEncoder(ensure_ascii=False, default=serialize_datetime_for_json).encode
+    for record in records:
+        yield encode(record) + '\n'
+
+
+def write_lines(lines: Iterable[str], f) -> int:
+    """
+    라인을 JSONL_WRITE_CHUNK_ROWS개씩 모아서 기록합니다 (메모리는 청크 크기로 제한).
+    
+    Args:
+        lines: 기록할 라인 iterable
+        f: 텍스트 파일 객체
+    
+    Returns:
+        기록한 라인 수
+    """
+    count = 0
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= JSONL_WRITE_CHUNK_ROWS:
+            f.write(''.join(chunk))
+            count += len(chunk)
+            chunk = []
+    if chunk:
+        f.write(''.join(chunk))
+        count += len(chunk)
+    return count
+
+
+def append_fact_weekly_chart_jsonl(
+    fact_records: Iterable[Dict],
+    chart_date: date,
+    sort_key: Optional[str] = None,
+    collect: Optional[List[Dict]] = None
+) -> int:
+    """
+    새 fact_weekly_chart 레코드 중 파일에 없는 키만 JSONL 파티션에 추가합니다 (pandas 미사용).
+    
+    기존 파일은 한 줄씩 읽어 키만 확인하고, 새 레코드가 있으면 기존 라인을 그대로 복사한 뒤
+    새 라인을 덧붙인 파일로 원자적으로 교체합니다. 메모리는 파일 크기가 아니라
+    이번 실행의 새 레코드 수에 비례합니다 (멱등성 보장).
+    
+    Args:
+        fact_records: 새 fact_weekly_chart 레코드 iterable
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (None이면 기본 파일명)
+        collect: 지정하면 저장 후 파일에 있는 모든 레코드(기존 + 추가, 파일 순서)를 여기에 담음
+            (업로드로 넘길 Arrow 배치용, 기존 라인을 모두 디코딩하므로 메모리는 파티션 크기에 비례)
+    
+    Returns:
+        실제로 추가된 레코드 수
+    """
+    file_path = get_chart_jsonl_path(chart_date, sort_key)
+    
+    # 새 레코드 안에서 중복된 키는 처음 것만 유지
+    pending: Dict[Tuple[str, str, str, str], Dict] = {}
+    new_count = 0
+    for record in fact_records:
+        new_count += 1
+        pending.setdefault(fact_weekly_chart_key(record), record)
+    
+    with file_lock(file_path):
+        existing_count = 0
+        if file_path.exists():
+            for line in iter_jsonl_lines(file_path):
+                existing_count += 1
+                if collect is not None:
+                    record = json.loads(line)
+                    collect.append(record)
+                    pending.pop(fact_weekly_chart_key(record), None)
+                elif pending:
+                    pending.pop(fact_weekly_chart_key(json.loads(line)), None)
+        if collect is not None:
+            collect.extend(pending.values())
+        
+        if not pending:
+            logger.info(f"모든 레코드가 중복입니다. 데이터 변경 없음.")
+            return 0
+        
+        if existing_count:
+            logger.info(f"중복 제거: {new_count - len(pending)}개 중복 레코드 제거됨 (남은 레코드: {len(pending)}개)")
+        
+        with atomic_write(file_path, buffering=JSONL_WRITE_BUFFER_SIZE) as f:
+            if existing_count:
+                write_lines(iter_jsonl_lines(file_path), f)
+            write_lines(iter_json_lines(pending.values()), f)
+    
+    logger.info(f"fact_weekly_chart {file_path.name} 저장 완료: {existing_count + len(pending)}개 레코드")
+    return len(pending)
 
 
 def save_fact_weekly_chart_csv(df: pd.DataFrame, chart_date: date) -> None:
@@ -409,13 +978,76 @@ def save_fact_weekly_chart_csv(df: pd.DataFrame, chart_date: date) -> None:
     try:
         # 컬럼 순서 보장
         df = df[FACT_WEEKLY_CHART_COLUMNS] if all(col in df.columns for col in FACT_WEEKLY_CHART_COLUMNS) else df
-        df.to_csv(file_path, index=False, encoding='utf-8')
+        with file_lock(file_path), atomic_write(file_path) as f:
+            df.to_csv(f, index=False)
         logger.info(f"fact_weekly_chart {format_date(chart_date)}.csv 저장 완료: {len(df)}개 레코드")
     except Exception as e:
         logger.error(f"fact_weekly_chart CSV 저장 실패: {e}")
         raise
 
 
+def save_fact_weekly_chart_parquet(df: pd.DataFrame, chart_date: date, sort_key: Optional[str] = None) -> None:
+    """
+    fact_weekly_chart DataFrame을 Parquet 파티션(chart_date=.../sort_key=...)으로 저장합니다.
+    파티션 컬럼은 디렉토리 이름에 저장되므로 파일에는 쓰지 않습니다.
+    
+    Args:
+        df: 저장할 DataFrame (같은 날짜, 같은 정렬 키의 레코드)
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (None이면 정렬 키 없는 파티션)
+    """
+    require_pyarrow()
+    file_path = get_chart_parquet_path(chart_date, sort_key)
+    
+    try:
+        table = dataframe_to_arrow_table(df, get_fact_weekly_chart_arrow_schema(include_partition_columns=False))
+        with file_lock(file_path), atomic_write(file_path, 'wb') as f:
+            pq.write_table(table, f, compression=PARQUET_COMPRESSION)
+        logger.info(f"fact_weekly_chart {format_date(chart_date)} ({sort_key}) Parquet 저장 완료: {len(df)}개 레코드")
+    except Exception as e:
+        logger.error(f"fact_weekly_chart Parquet 저장 실패: {e}")
+        raise
+
+
+def save_fact_weekly_chart_sqlite(df: pd.DataFrame, chart_date: date, sort_key: Optional[str] = None) -> None:
+    """
+    fact_weekly_chart DataFrame을 로컬 웨어하우스에 upsert합니다.
+    
+    Args:
+        df: 저장할 DataFrame
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (레코드에 정렬 키가 없을 때 사용)
+    """
+    records = dataframe_to_records(df)
+    for record in records:
+        if record.get('sort_key') is None:
+            record['sort_key'] = sort_key
+    
+    with LocalWarehouse() as warehouse:
+        warehouse.upsert_fact_weekly_chart(records)
+
+
+def get_fact_weekly_chart_path(chart_date: date, sort_key: Optional[str] = None) -> Path:
+    """
+    DATA_FORMAT에 해당하는 fact_weekly_chart 파티션 파일 경로를 반환합니다 (잠금 대상).
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (CSV는 날짜별 파일 하나이므로 무시)
+    
+    Returns:
+        fact_weekly_chart 파일 Path 객체 (sqlite는 웨어하우스 파일)
+    """
+    data_format = get_data_format()
+    if data_format == 'jsonl':
+        return get_chart_jsonl_path(chart_date, sort_key)
+    if data_format == 'parquet':
+        return get_chart_parquet_path(chart_date, sort_key)
+    if data_format == 'sqlite':
+        return get_warehouse_path()
+    return get_chart_csv_path(chart_date)
+
+
 def save_fact_weekly_chart(df: pd.DataFrame, chart_date: date, sort_key: Optional[str] = None) -> None:
     """
     fact_weekly_chart DataFrame을 저장합니다 (JSONL 또는 CSV).
@@ -429,78 +1061,106 @@ def save_fact_weekly_chart(df: pd.DataFrame, chart_date: date, sort_key: Optiona
     data_format = get_data_format()
     if data_format == 'jsonl':
         save_fact_weekly_chart_jsonl(df, chart_date, sort_key)
+    elif data_format == 'parquet':
+        save_fact_weekly_chart_parquet(df, chart_date, sort_key)
+    elif data_format == 'sqlite':
+        save_fact_weekly_chart_sqlite(df, chart_date, sort_key)
     else:
         save_fact_weekly_chart_csv(df, chart_date)
 
 
 def transform_parsed_data_to_models(
-    parsed_data: List[Dict[str, any]],
+    parsed_data: List[WebtoonCard],
     chart_date: date,
-    sort_key: Optional[str] = None
+    sort_key: Optional[str] = None,
+    collected_at: Optional[datetime] = None
 ) -> tuple[List[Dict], List[Dict]]:
     """
     파싱된 데이터를 모델 스키마에 맞게 변환합니다.
     
-    실제 수집되는 필드에 따라 이 함수를 수정해야 할 수 있습니다.
+    배치 전체를 build_chart_record_batch로 한 번에 변환하므로 collected_at이
+    배치 안에서 동일하고, 검증 실패는 컬럼 단위로 집계되어 로그로 남습니다.
     
     Args:
-        parsed_data: 파싱된 웹툰 차트 데이터 리스트
+        parsed_data: 파싱된 웹툰 차트 데이터 리스트 (WebtoonCard, 기존 dict 형식도 허용)
         chart_date: 수집 날짜
+        sort_key: 정렬 키 (카드에 정렬 키가 없을 때 사용)
+        collected_at: 수집 시각 (없으면 현재 시각)
     
     Returns:
         (dim_webtoon_records, fact_weekly_chart_records) 튜플
     """
-    dim_records = []
-    fact_records = []
+    batch = build_chart_record_batch(parsed_data, chart_date, sort_key, collected_at)
     
-    for item in parsed_data:
-        try:
-            # dim_webtoon 레코드 생성
-            # 카카오 웹툰 API에서 수집 가능한 모든 필드 포함
-            dim_record = create_dim_webtoon_record(
-                webtoon_id=item.get('webtoon_id', ''),
-                title=item.get('title', ''),
-                author=item.get('author'),  # 선택적 필드 (차트 API에서 수집)
-                genre=item.get('genre'),    # 선택적 필드 (card.genreFilters에서 수집)
-                tags=item.get('tags'),      # 선택적 필드 (content.seoKeywords에서 수집)
-                seo_id=item.get('seo_id'),  # 선택적 필드 (content.seoId)
-                adult=item.get('adult'),     # 선택적 필드 (content.adult)
-                catchphrase=item.get('catchphrase'),  # 선택적 필드 (content.catchphraseTwoLines)
-                badges=item.get('badges'),   # 선택적 필드 (content.badges의 title)
-                content_id=item.get('content_id'),  # 선택적 필드 (content.id)
-            )
-            
-            if validate_dim_webtoon_record(dim_record):
-                dim_records.append(dim_record)
-            else:
-                logger.warning(f"dim_webtoon 레코드 검증 실패: {item}")
-                continue
-            
-            # fact_weekly_chart 레코드 생성
-            # collected_at은 자동으로 현재 시각이 설정됨
-            fact_record = create_fact_weekly_chart_record(
-                chart_date=chart_date,
-                webtoon_id=item.get('webtoon_id', ''),
-                rank=item.get('rank', 0),
-                weekday=item.get('weekday'),  # 요일 정보
-                weekday_rank=item.get('weekday_rank'),  # 요일별 순위
-                view_count=item.get('view_count'),  # 조회수 (있는 경우)
-                sort_key=item.get('_sort_key') or sort_key,  # 정렬 키
-                # year, month, week는 collected_at에서 자동 계산됨
-            )
-            
-            if validate_fact_weekly_chart_record(fact_record):
-                fact_records.append(fact_record)
-            else:
-                logger.warning(f"fact_weekly_chart 레코드 검증 실패: {item}")
-                continue
-                
-        except Exception as e:
-            logger.error(f"데이터 변환 실패: {item}, 오류: {e}")
+    logger.info(f"데이터 변환 완료: dim_webtoon {batch.dim_count}개, fact_weekly_chart {batch.fact_count}개")
+    return batch.dim_records(), batch.fact_records()
+
+
+def merge_dim_webtoon_delta(
+    existing_df: pd.DataFrame,
+    new_records: List[Dict]
+) -> Tuple[pd.DataFrame, List[Dict]]:
+    """
+    새로운 dim_webtoon 레코드를 기존 데이터와 병합하고, 실제로 바뀐 레코드(delta)를 함께 반환합니다.
+    
+    - fingerprint(비즈니스 필드 해시)가 기존과 같은 레코드는 그대로 둠 (updated_at 유지)
+    - 새 웹툰이거나 fingerprint가 바뀐 레코드만 교체하며, created_at은 기존 값을 유지
+    
+    Args:
+        existing_df: 기존 dim_webtoon DataFrame
+        new_records: 새로운 레코드 리스트
+    
+    Returns:
+        (병합된 DataFrame, 추가/변경된 레코드 리스트) 튜플
+    """
+    if len(new_records) == 0:
+        return existing_df, []
+    
+    # 새 레코드와 겹치는 기존 레코드만 fingerprint 비교 (fingerprint가 없는 기존 행은 계산)
+    existing_by_id = {}
+    if len(existing_df) > 0:
+        new_ids = {str(r['webtoon_id']) for r in new_records}
+        overlap_df = existing_df[existing_df['webtoon_id'].astype(str).isin(new_ids)]
+        for record in dataframe_to_records(overlap_df):
+            existing_by_id[str(record['webtoon_id'])] = record
+    
+    changed = []
+    seen = set()
+    for record in new_records:
+        webtoon_id = str(record['webtoon_id'])
+        if webtoon_id in seen:
             continue
+        seen.add(webtoon_id)
+        
+        fingerprint = record.get('fingerprint') or compute_dim_webtoon_fingerprint(record)
+        existing = existing_by_id.get(webtoon_id)
+        if existing is not None:
+            if (existing.get('fingerprint') or compute_dim_webtoon_fingerprint(existing)) == fingerprint:
+                continue
+        
+        row = dict(record, webtoon_id=webtoon_id, fingerprint=fingerprint)
+        if existing is not None and existing.get('created_at') is not None:
+            row['created_at'] = existing['created_at']
+        changed.append(row)
     
-    logger.info(f"데이터 변환 완료: dim_webtoon {len(dim_records)}개, fact_weekly_chart {len(fact_records)}개")
-    return dim_records, fact_records
+    logger.info(f"dim_webtoon 변경 감지: {len(changed)}개 추가/변경 (입력 {len(seen)}개)")
+    
+    if not changed:
+        return existing_df, []
+    
+    changed_df = pd.DataFrame(changed)
+    if len(existing_df) == 0:
+        return changed_df, changed
+    
+    changed_ids = {r['webtoon_id'] for r in changed}
+    unchanged_df = existing_df[~existing_df['webtoon_id'].astype(str).isin(changed_ids)]
+    combined_df = pd.concat([unchanged_df, changed_df], ignore_index=True)
+    
+    # 시각 컬럼 형식 통일
+    combined_df['updated_at'] = pd.to_datetime(combined_df['updated_at'], format='ISO8601').dt.strftime(TIMESTAMP_FORMAT)
+    combined_df['created_at'] = pd.to_datetime(combined_df['created_at'], format='ISO8601').dt.strftime(TIMESTAMP_FORMAT)
+    
+    return combined_df.reset_index(drop=True), changed
 
 
 def merge_dim_webtoon(
@@ -509,7 +1169,7 @@ def merge_dim_webtoon(
 ) -> pd.DataFrame:
     """
     새로운 dim_webtoon 레코드를 기존 데이터와 병합합니다.
-    중복된 webtoon_id는 업데이트합니다.
+    비즈니스 필드가 바뀐 webtoon_id만 업데이트합니다 (merge_dim_webtoon_delta 참고).
     
     Args:
         existing_df: 기존 dim_webtoon DataFrame
@@ -518,32 +1178,46 @@ def merge_dim_webtoon(
     Returns:
         병합된 DataFrame
     """
-    if len(new_records) == 0:
-        return existing_df
-    
-    new_df = pd.DataFrame(new_records)
-    
-    if len(existing_df) == 0:
-        return new_df
-    
-    # 모든 레코드를 합치고, webtoon_id 기준으로 중복 제거 (최신 것만 유지)
-    # updated_at이 최신인 것을 유지하도록 정렬
-    combined_df = pd.concat([existing_df, new_df], ignore_index=True)
+    merged_df, _ = merge_dim_webtoon_delta(existing_df, new_records)
+    return merged_df
+
+
+# fact_weekly_chart 중복 판단 키 (같은 날짜에 같은 웹툰이 여러 요일/정렬 옵션에 나타날 수 있음)
+FACT_WEEKLY_CHART_KEY_COLUMNS = ['chart_date', 'webtoon_id', 'weekday', 'sort_key']
+
+
+def fact_weekly_chart_key_hashes(df: pd.DataFrame) -> pd.Series:
+    """
+    (chart_date, webtoon_id, weekday, sort_key) 복합 키를 64비트 해시로 변환합니다.
+    weekday, sort_key의 None은 빈 문자열과 같은 키로 취급합니다 (BigQuery MERGE의 COALESCE와 동일).
     
-    # updated_at을 datetime으로 변환
-    combined_df['updated_at'] = pd.to_datetime(combined_df['updated_at'])
+    컬럼별로 고유값만 문자열로 바꿔 해시한 뒤(chart_date, weekday, sort_key는 고유값이 적음)
+    행에 펼쳐서 결합하므로, 행 단위 문자열 변환/튜플 생성이 없습니다.
     
-    # webtoon_id 기준으로 정렬 (updated_at 최신순)
-    combined_df = combined_df.sort_values('updated_at', ascending=False)
+    Args:
+        df: fact_weekly_chart DataFrame (키 컬럼이 없으면 None으로 간주)
     
-    # webtoon_id 기준으로 중복 제거 (첫 번째 것만 유지 = 최신 것)
-    combined_df = combined_df.drop_duplicates(subset=['webtoon_id'], keep='first')
+    Returns:
+        행별 키 해시 (uint64 Series, df와 같은 인덱스)
+    """
+    combined = np.full(len(df), 0x345678, dtype=np.uint64)
+    multiplier = np.uint64(1000003)
     
-    # updated_at을 다시 문자열로 변환
-    combined_df['updated_at'] = combined_df['updated_at'].dt.strftime('%Y-%m-%d %H:%M:%S.%f')
-    combined_df['created_at'] = pd.to_datetime(combined_df['created_at']).dt.strftime('%Y-%m-%d %H:%M:%S.%f')
+    for position, col in enumerate(FACT_WEEKLY_CHART_KEY_COLUMNS):
+        if col in df.columns:
+            codes, uniques = pd.factorize(df[col])
+        else:
+            codes, uniques = np.full(len(df), -1, dtype=np.intp), []
+        
+        # 결측(-1)은 마지막 원소인 ''로 매핑
+        labels = np.append(pd.Index(uniques).astype(str).to_numpy(dtype=object), '')
+        column_hashes = pd.util.hash_array(labels)[codes]
+        
+        combined ^= column_hashes
+        combined *= multiplier
+        multiplier += np.uint64(82520 + 2 * (len(FACT_WEEKLY_CHART_KEY_COLUMNS) - position))
     
-    return combined_df.reset_index(drop=True)
+    return pd.Series(combined, index=df.index)
 
 
 def merge_fact_weekly_chart(
@@ -553,11 +1227,10 @@ def merge_fact_weekly_chart(
 ) -> pd.DataFrame:
     """
     새로운 fact_weekly_chart 레코드를 기존 데이터와 병합합니다.
-    같은 날짜의 중복 레코드는 제거합니다 (멱등성 보장).
+    이미 있는 키의 레코드는 추가하지 않습니다 (멱등성 보장).
     
-    주의: 같은 날짜에 같은 웹툰이 여러 요일에 나타날 수 있으므로,
-    (chart_date, webtoon_id, weekday) 조합으로 중복을 체크합니다.
-    weekday가 None인 경우 (chart_date, webtoon_id)로 체크합니다.
+    (chart_date, webtoon_id, weekday, sort_key) 복합 키를 해시한 뒤
+    기존 키 해시에 없는 새 레코드만 남기는 anti-join으로 처리합니다.
     
     Args:
         existing_df: 기존 fact_weekly_chart DataFrame
@@ -571,106 +1244,253 @@ def merge_fact_weekly_chart(
         return existing_df
     
     new_df = pd.DataFrame(new_records)
+    new_hashes = fact_weekly_chart_key_hashes(new_df)
     
-    # 기존 레코드가 있으면 중복 체크
-    if len(existing_df) > 0:
-        # (chart_date, webtoon_id, weekday) 조합으로 중복 체크
-        # weekday가 None인 경우도 고려
-        existing_df['weekday'] = existing_df['weekday'].fillna('')
-        new_df['weekday'] = new_df['weekday'].fillna('')
-        
-        # 기존 레코드의 (chart_date, webtoon_id, weekday) 조합 집합
-        existing_combos = set(
-            zip(
-                existing_df['chart_date'].astype(str),
-                existing_df['webtoon_id'].astype(str),
-                existing_df['weekday'].astype(str)
+    # 새 레코드 안에서 중복된 키는 처음 것만 유지
+    keep = ~new_hashes.duplicated().to_numpy()
+    
+    # 기존 레코드가 없으면 그대로 추가
+    if len(existing_df) == 0:
+        return new_df[keep].reset_index(drop=True)
+    
+    # anti-join: 기존 키 해시에 없는 레코드만 추가
+    keep &= ~new_hashes.isin(fact_weekly_chart_key_hashes(existing_df)).to_numpy()
+    new_df_filtered = new_df[keep]
+    
+    removed_count = len(new_df) - len(new_df_filtered)
+    if len(new_df_filtered) > 0:
+        logger.info(f"중복 제거: {removed_count}개 중복 레코드 제거됨 (남은 레코드: {len(new_df_filtered)}개)")
+        return pd.concat([existing_df, new_df_filtered], ignore_index=True)
+    else:
+        logger.info(f"모든 레코드가 중복입니다. 데이터 변경 없음.")
+        return existing_df
+
+
+def log_missing_foreign_keys(fact_records: List[Dict], webtoon_ids: Set[str]) -> None:
+    """
+    fact_weekly_chart 레코드 중 dim_webtoon에 없는 webtoon_id를 경고로 남깁니다.
+    
+    Args:
+        fact_records: fact_weekly_chart 레코드 리스트
+        webtoon_ids: dim_webtoon에 존재하는 webtoon_id 집합
+    """
+    invalid_facts = [
+        r for r in fact_records
+        if r['webtoon_id'] not in webtoon_ids
+    ]
+    if invalid_facts:
+        logger.warning(f"Foreign Key 검증 실패: {len(invalid_facts)}개 레코드의 webtoon_id가 dim_webtoon에 없습니다.")
+
+
+class TransformRun:
+    """
+    한 번의 파이프라인 실행 동안 변환 결과를 모아 두었다가 한 번에 저장합니다.
+    
+    dim_webtoon 레코드는 정렬 옵션과 무관하게 같으므로 실행 단위로 한 번만
+    병합/저장하고, fact_weekly_chart 레코드는 정렬 키별로 모아 flush 시 저장합니다.
+    
+    add()는 여러 스레드에서 동시에 호출할 수 있고, 정렬 키별 저장(flush_fact)과
+    dim_webtoon 저장(flush_dim)을 따로 호출할 수도 있습니다 (src.parallel 참고).
+    
+    사용 예:
+        run = TransformRun(chart_date)
+        for sort_key in sort_keys:
+            run.add(parsed_data, sort_key)
+        run.flush()
+    """
+    
+    def __init__(
+        self,
+        chart_date: date,
+        collected_at: Optional[datetime] = None,
+        keep_batches: bool = False
+    ) -> None:
+        """
+        Args:
+            chart_date: 수집 날짜
+            collected_at: 실행 단위 수집 시각 (없으면 현재 시각, 모든 정렬 키에 동일하게 사용)
+            keep_batches: True이면 flush_fact가 저장한 파티션 내용을 BigQuery 스키마 타입의 Arrow Table로
+                fact_batches에 남김 (업로드가 파일을 다시 읽고 정규화하지 않도록, pyarrow 필요)
+        """
+        self.chart_date = chart_date
+        self.collected_at = collected_at or datetime.now()
+        self.dim_records: Dict[str, Dict] = {}
+        self.fact_records: Dict[Optional[str], List[Dict]] = {}
+        # 정렬 키 → 저장된 fact_weekly_chart 파티션 전체 (keep_batches일 때만, upload_to_bigquery로 전달)
+        self.keep_batches = keep_batches and PYARROW_AVAILABLE
+        if keep_batches and not PYARROW_AVAILABLE and not _KEEP_BATCHES_WARNED[0]:
+            _KEEP_BATCHES_WARNED[0] = True
+            logger.warning(
+                "pyarrow가 설치되어 있지 않아 fact_weekly_chart Arrow 배치를 보관하지 않습니다 "
+                "(BigQuery 업로드는 저장된 파일을 다시 읽음)."
             )
-        )
+        self.fact_batches: Dict[Optional[str], 'pa.Table'] = {}
+        # flush 후 실제로 추가/변경된 dim_webtoon 레코드 (업로드 대상)
+        self.dim_delta: List[Dict] = []
+        self._lock = threading.Lock()
+    
+    @property
+    def sort_keys(self) -> List[Optional[str]]:
+        """변환 결과가 추가된 정렬 키 목록 (추가된 순서)"""
+        return list(self.fact_records)
+    
+    def add(self, parsed_data: List[WebtoonCard], sort_key: Optional[str] = None) -> bool:
+        """
+        파싱된 데이터를 변환하여 실행 컨텍스트에 추가합니다 (파일 I/O 없음).
         
-        # 새로운 레코드의 (chart_date, webtoon_id, weekday) 조합
-        new_combos = list(
-            zip(
-                new_df['chart_date'].astype(str),
-                new_df['webtoon_id'].astype(str),
-                new_df['weekday'].astype(str)
-            )
+        Args:
+            parsed_data: 파싱된 웹툰 차트 데이터 리스트 (WebtoonCard)
+            sort_key: 정렬 키 (None이면 기본 파일명)
+        
+        Returns:
+            변환된 레코드가 있으면 True
+        """
+        dim_records, fact_records = transform_parsed_data_to_models(
+            parsed_data, self.chart_date, sort_key, collected_at=self.collected_at
         )
         
-        # 중복되지 않은 레코드만 필터링
-        new_df_filtered = new_df[
-            [combo not in existing_combos for combo in new_combos]
-        ]
+        if len(dim_records) == 0 and len(fact_records) == 0:
+            logger.warning("변환된 레코드가 없습니다.")
+            return False
+        
+        with self._lock:
+            # 같은 webtoon_id는 처음 변환된 레코드만 유지
+            for record in dim_records:
+                self.dim_records.setdefault(record['webtoon_id'], record)
+            self.fact_records.setdefault(sort_key, []).extend(fact_records)
+        return True
+    
+    def flush_dim(self) -> List[Dict]:
+        """
+        모아 둔 dim_webtoon을 한 번 병합/저장합니다 (실행당 한 번, 단일 writer).
+        읽기 → 병합 → 쓰기 전체를 잠가 동시에 실행된 다른 run의 변경을 덮어쓰지 않도록 합니다.
+        
+        Returns:
+            추가/변경된 dim_webtoon 레코드 리스트 (self.dim_delta에도 저장)
+        """
+        dim_records = list(self.dim_records.values())
+        all_fact_records = [r for records in self.fact_records.values() for r in records]
+        
+        data_format = get_data_format()
         
-        if len(new_df_filtered) > 0:
-            removed_count = len(new_df) - len(new_df_filtered)
-            logger.info(f"중복 제거: {removed_count}개 중복 레코드 제거됨 (남은 레코드: {len(new_df_filtered)}개)")
-            return pd.concat([existing_df, new_df_filtered], ignore_index=True)
+        if data_format == 'sqlite':
+            # 로컬 웨어하우스는 ON CONFLICT upsert로 처리 (기존 데이터를 읽어 병합하지 않음)
+            with LocalWarehouse() as warehouse:
+                log_missing_foreign_keys(all_fact_records, warehouse.webtoon_ids() | set(self.dim_records))
+                self.dim_delta = warehouse.upsert_dim_webtoon(dim_records)
+        elif data_format == 'jsonl':
+            # JSONL은 전체를 다시 쓰지 않고 변경분만 변경 로그에 추가
+            with DimWebtoonStore() as store:
+                log_missing_foreign_keys(all_fact_records, store.ids() | set(self.dim_records))
+                self.dim_delta = store.upsert(dim_records)
+                store.maybe_compact()
         else:
-            logger.info(f"모든 레코드가 중복입니다. 데이터 변경 없음.")
-            return existing_df
-    else:
-        # 기존 레코드가 없으면 그대로 추가
-        return new_df
+            with file_lock(get_dim_webtoon_path()):
+                existing_dim_df = load_dim_webtoon()
+                existing_webtoon_ids = set(existing_dim_df['webtoon_id'].astype(str)) if len(existing_dim_df) > 0 else set()
+                
+                # fact_records의 webtoon_id가 모두 존재하는지 확인 (일단 경고만 하고 진행)
+                log_missing_foreign_keys(all_fact_records, existing_webtoon_ids | set(self.dim_records))
+                
+                merged_dim_df, self.dim_delta = merge_dim_webtoon_delta(existing_dim_df, dim_records)
+                if self.dim_delta:
+                    save_dim_webtoon(merged_dim_df)
+        
+        return self.dim_delta
+    
+    def flush_fact(self, sort_key: Optional[str]) -> None:
+        """
+        정렬 키 하나의 fact_weekly_chart를 저장합니다 (파티션 단위 잠금).
+        정렬 키마다 파티션이 다르므로 여러 스레드에서 동시에 호출할 수 있습니다.
+        
+        Args:
+            sort_key: 정렬 키
+        """
+        fact_records = self.fact_records.get(sort_key, [])
+        data_format = get_data_format()
+        
+        if data_format == 'sqlite':
+            with LocalWarehouse() as warehouse:
+                warehouse.upsert_fact_weekly_chart(fact_records)
+                if self.keep_batches:
+                    saved = warehouse.load_fact_weekly_chart(self.chart_date, self.chart_date, [sort_key])
+                    self.fact_batches[sort_key] = fact_records_to_arrow_table(saved, sort_key)
+            return
+        
+        if data_format == 'jsonl':
+            # 일일 실행 경로: DataFrame 없이 라인 단위로 병합/기록
+            saved = [] if self.keep_batches else None
+            append_fact_weekly_chart_jsonl(fact_records, self.chart_date, sort_key, collect=saved)
+            if saved is not None:
+                self.fact_batches[sort_key] = fact_records_to_arrow_table(saved, sort_key)
+            return
+        
+        with file_lock(get_fact_weekly_chart_path(self.chart_date, sort_key)):
+            existing_fact_df = load_fact_weekly_chart(self.chart_date, sort_key)
+            merged_fact_df = merge_fact_weekly_chart(existing_fact_df, fact_records, self.chart_date)
+            save_fact_weekly_chart(merged_fact_df, self.chart_date, sort_key)
+        if self.keep_batches:
+            # CSV는 날짜별 파일 하나에 모든 정렬 키가 있으므로 이 정렬 키의 레코드만 남김
+            saved = [
+                record for record in dataframe_to_records(merged_fact_df)
+                if record.get('sort_key') in (None, sort_key)
+            ]
+            self.fact_batches[sort_key] = fact_records_to_arrow_table(saved, sort_key)
+    
+    def flush(self) -> bool:
+        """
+        모아 둔 dim_webtoon을 한 번 병합/저장하고, 정렬 키별 fact_weekly_chart를 저장합니다.
+        멱등성을 보장합니다. 추가/변경된 dim_webtoon 레코드는 self.dim_delta에 남습니다.
+        
+        Returns:
+            성공 여부
+        """
+        if not self.dim_records and not self.fact_records:
+            logger.warning("저장할 변환 결과가 없습니다.")
+            return False
+        
+        try:
+            # 1. dim_webtoon 저장 (실행당 한 번)
+            self.flush_dim()
+            
+            # 2. fact_weekly_chart 저장 (정렬 키별)
+            for sort_key in self.fact_records:
+                self.flush_fact(sort_key)
+            
+            logger.info(
+                f"데이터 변환 및 저장 완료: chart_date={format_date(self.chart_date)}, "
+                f"dim_webtoon {len(self.dim_records)}개 (변경 {len(self.dim_delta)}개), 정렬 옵션 {len(self.fact_records)}개"
+            )
+            return True
+        
+        except Exception as e:
+            logger.error(f"데이터 변환 및 저장 실패: {e}")
+            raise
 
 
 def transform_and_save(
-    parsed_data: List[Dict[str, any]],
+    parsed_data: List[WebtoonCard],
     chart_date: date,
     sort_key: Optional[str] = None
 ) -> bool:
     """
-    파싱된 데이터를 변환하여 CSV로 저장합니다.
+    파싱된 데이터를 변환하여 저장합니다.
     멱등성을 보장합니다.
     
+    여러 정렬 옵션을 한 번에 처리할 때는 TransformRun을 사용하세요.
+    
     Args:
-        parsed_data: 파싱된 웹툰 차트 데이터 리스트
+        parsed_data: 파싱된 웹툰 차트 데이터 리스트 (WebtoonCard)
         chart_date: 수집 날짜
         sort_key: 정렬 키 (None이면 기본 파일명)
     
     Returns:
         성공 여부
     """
-    try:
-        # 1. 파싱된 데이터를 모델로 변환
-        dim_records, fact_records = transform_parsed_data_to_models(parsed_data, chart_date, sort_key)
-        
-        if len(dim_records) == 0 and len(fact_records) == 0:
-            logger.warning("변환된 레코드가 없습니다.")
-            return False
-        
-        # 2. 기존 데이터 로드
-        existing_dim_df = load_dim_webtoon()
-        existing_fact_df = load_fact_weekly_chart(chart_date)
-        
-        # 3. Foreign Key 검증
-        existing_webtoon_ids = set(existing_dim_df['webtoon_id'].astype(str)) if len(existing_dim_df) > 0 else set()
-        new_webtoon_ids = {r['webtoon_id'] for r in dim_records}
-        all_webtoon_ids = existing_webtoon_ids | new_webtoon_ids
-        
-        # fact_records의 webtoon_id가 모두 존재하는지 확인
-        invalid_facts = [
-            r for r in fact_records
-            if r['webtoon_id'] not in all_webtoon_ids
-        ]
-        if invalid_facts:
-            logger.warning(f"Foreign Key 검증 실패: {len(invalid_facts)}개 레코드의 webtoon_id가 dim_webtoon에 없습니다.")
-            # 일단 경고만 하고 진행 (dim_webtoon에 추가될 예정)
-        
-        # 4. 데이터 병합 (멱등성 보장)
-        merged_dim_df = merge_dim_webtoon(existing_dim_df, dim_records)
-        merged_fact_df = merge_fact_weekly_chart(existing_fact_df, fact_records, chart_date)
-        
-        # 5. CSV 저장
-        save_dim_webtoon(merged_dim_df)
-        save_fact_weekly_chart(merged_fact_df, chart_date, sort_key)
-        
-        logger.info(f"데이터 변환 및 저장 완료: chart_date={format_date(chart_date)}")
-        return True
-        
-    except Exception as e:
-        logger.error(f"데이터 변환 및 저장 실패: {e}")
-        raise
+    run = TransformRun(chart_date)
+    if not run.add(parsed_data, sort_key):
+        return False
+    return run.flush()
 
 
 if __name__ == "__main__":
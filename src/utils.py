@@ -8,11 +8,57 @@
 등
 """
 
+import importlib
+import importlib.util
 import logging
 import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from datetime import date, datetime
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Dict, Iterator, Optional
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    # Windows 등 fcntl이 없는 환경에서는 프로세스 내부 잠금만 사용
+    FCNTL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule:
+    """
+    처음 속성에 접근할 때 모듈을 import하는 프록시입니다.
+    
+    pandas처럼 import 비용이 큰 모듈을 모듈 최상단에서 바로 import하지 않고,
+    실제로 사용하는 코드 경로에서만 로드되도록 할 때 사용합니다.
+    
+    사용 예:
+        pd = LazyModule('pandas')
+        df = pd.DataFrame(...)  # 이 시점에 pandas import
+    """
+    
+    def __init__(self, name: str) -> None:
+        self.__dict__['_name'] = name
+        self.__dict__['_module'] = None
+    
+    def _load(self) -> Any:
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self.__dict__['_name'])
+            self.__dict__['_module'] = module
+        return module
+    
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+    
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_module'] is not None else 'not loaded'
+        return f"<LazyModule {self.__dict__['_name']!r} ({state})>"
 
 
 def setup_logging(level: int = logging.INFO, log_file: Optional[Path] = None) -> None:
@@ -48,6 +94,23 @@ def setup_logging(level: int = logging.INFO, log_file: Optional[Path] = None) ->
     root_logger.setLevel(level)
 
 
+def is_module_available(name: str) -> bool:
+    """
+    모듈을 import하지 않고 설치 여부만 확인합니다.
+    
+    Args:
+        name: 모듈 이름 (예: 'google.cloud.bigquery')
+    
+    Returns:
+        설치되어 있으면 True
+    """
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # 상위 패키지가 없는 경우
+        return False
+
+
 def get_data_dir() -> Path:
     """
     데이터 디렉토리 경로를 반환합니다.
@@ -133,7 +196,7 @@ def get_data_format() -> str:
     없으면 기본값 'jsonl'을 반환합니다.
     
     Returns:
-        'jsonl' 또는 'csv'
+        'jsonl', 'csv', 'parquet' 또는 'sqlite'
     """
     return os.getenv('DATA_FORMAT', 'jsonl').lower()
 
@@ -172,6 +235,164 @@ def get_dim_webtoon_jsonl_path() -> Path:
     return processed_dir / 'dim_webtoon.jsonl'
 
 
+# Parquet 파티션 값이 None일 때 사용하는 디렉토리 이름 (hive 규칙)
+PARQUET_NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def get_parquet_dir() -> Path:
+    """
+    Parquet 형식 테이블 저장 디렉토리 경로를 반환합니다.
+    JSONL/CSV 파일과 섞이지 않도록 processed/parquet 아래에 저장합니다.
+    
+    Returns:
+        processed/parquet 디렉토리 Path 객체
+    """
+    parquet_dir = get_processed_dir() / 'parquet'
+    parquet_dir.mkdir(parents=True, exist_ok=True)
+    return parquet_dir
+
+
+def get_dim_webtoon_parquet_path() -> Path:
+    """
+    dim_webtoon Parquet 파일 경로를 반환합니다.
+    
+    Returns:
+        Parquet 파일 Path 객체
+    """
+    return get_parquet_dir() / 'dim_webtoon.parquet'
+
+
+def get_fact_weekly_chart_parquet_dir() -> Path:
+    """
+    fact_weekly_chart Parquet 데이터셋 루트 디렉토리 경로를 반환합니다.
+    하위는 chart_date=YYYY-MM-DD/sort_key=<정렬 키>/ 형식(hive)으로 파티션됩니다.
+    
+    Returns:
+        데이터셋 루트 Path 객체
+    """
+    dataset_dir = get_parquet_dir() / 'fact_weekly_chart'
+    dataset_dir.mkdir(parents=True, exist_ok=True)
+    return dataset_dir
+
+
+def get_chart_parquet_path(chart_date: date, sort_key: Optional[str] = None) -> Path:
+    """
+    주간 차트 Parquet 파일 경로를 반환합니다 (날짜/정렬 키 파티션별 파일).
+    
+    Args:
+        chart_date: 수집 날짜
+        sort_key: 정렬 키 (None이면 hive 기본 파티션)
+    
+    Returns:
+        Parquet 파일 Path 객체
+    """
+    partition_dir = (
+        get_fact_weekly_chart_parquet_dir()
+        / f"chart_date={chart_date.strftime('%Y-%m-%d')}"
+        / f"sort_key={sort_key or PARQUET_NULL_PARTITION}"
+    )
+    partition_dir.mkdir(parents=True, exist_ok=True)
+    return partition_dir / 'part-0.parquet'
+
+
+def get_warehouse_path() -> Path:
+    """
+    로컬 웨어하우스(SQLite) 데이터베이스 파일 경로를 반환합니다 (DATA_FORMAT=sqlite).
+    
+    Returns:
+        데이터베이스 파일 Path 객체
+    """
+    processed_dir = get_processed_dir()
+    return processed_dir / 'warehouse.db'
+
+
+def get_dim_webtoon_changelog_path() -> Path:
+    """
+    dim_webtoon 변경 로그(JSONL) 파일 경로를 반환합니다.
+    스냅샷(dim_webtoon.jsonl) 이후 변경된 레코드만 이 파일에 추가됩니다.
+    
+    Returns:
+        JSONL 파일 Path 객체
+    """
+    processed_dir = get_processed_dir()
+    return processed_dir / 'dim_webtoon.changelog.jsonl'
+
+
+def get_dim_webtoon_bigquery_manifest_path() -> Path:
+    """
+    BigQuery dim_webtoon에 반영된 레코드의 fingerprint manifest(JSON) 파일 경로를 반환합니다.
+    이 manifest와 fingerprint가 같은 레코드는 다시 업로드하지 않습니다.
+
+    Returns:
+        JSON 파일 Path 객체
+    """
+    processed_dir = get_processed_dir()
+    return processed_dir / 'dim_webtoon.bigquery_manifest.json'
+
+
+def get_fact_weekly_chart_write_ledger_path() -> Path:
+    """
+    fact_weekly_chart Storage Write API 적재 기록(JSON) 파일 경로를 반환합니다.
+    (chart_date, sort_key)별로 적재한 스트림, 행 수, 파일 digest를 기록합니다.
+
+    Returns:
+        JSON 파일 Path 객체
+    """
+    processed_dir = get_processed_dir()
+    return processed_dir / 'fact_weekly_chart.write_ledger.json'
+
+
+def get_dim_compaction_threshold() -> int:
+    """
+    dim_webtoon 변경 로그를 스냅샷으로 합치는(compaction) 기준 레코드 수를 반환합니다.
+    환경 변수 DIM_WEBTOON_COMPACTION_THRESHOLD가 설정되어 있으면 그 값을 사용합니다.
+    
+    Returns:
+        변경 로그 레코드 수 임계치 (기본값: 1000)
+    """
+    return int(os.getenv('DIM_WEBTOON_COMPACTION_THRESHOLD', '1000'))
+
+
+def get_pipeline_workers(default: int) -> int:
+    """
+    정렬 키 병렬 처리(--parallel) 워커 수를 반환합니다.
+    환경 변수 PIPELINE_WORKERS가 설정되어 있으면 그 값을 사용합니다.
+    
+    Args:
+        default: 환경 변수가 없을 때 사용할 값 (보통 정렬 키 수)
+    
+    Returns:
+        워커 수 (1 이상)
+    """
+    return max(1, int(os.getenv('PIPELINE_WORKERS', str(default))))
+
+
+def get_warm_cache_ttl(name: str, default: float) -> float:
+    """
+    warm 인스턴스 캐시(src.warm_cache)의 TTL(초)을 반환합니다.
+    환경 변수 WARM_CACHE_TTL_<NAME>_SECONDS, WARM_CACHE_TTL_SECONDS 순서로 확인합니다.
+    
+    Args:
+        name: 캐시 이름 (예: 'bigquery_client' → WARM_CACHE_TTL_BIGQUERY_CLIENT_SECONDS)
+        default: 환경 변수가 없을 때 사용할 값
+    
+    Returns:
+        TTL (초, 0 이하이면 캐시하지 않음)
+    """
+    value = os.getenv(f'WARM_CACHE_TTL_{name.upper()}_SECONDS', os.getenv('WARM_CACHE_TTL_SECONDS'))
+    return float(value) if value is not None else default
+
+
+def serialize_datetime_for_json(obj):
+    """
+    json.dumps의 default 인자로 사용하는 헬퍼 함수.
+    datetime, date 객체(pd.Timestamp 포함)를 ISO 형식 문자열로 변환합니다.
+    """
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
 def get_logs_dir() -> Path:
     """
     로그 파일 저장 디렉토리 경로를 반환합니다.
@@ -216,6 +437,194 @@ def ensure_dir(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+def fsync_dir(path: Path) -> None:
+    """
+    디렉토리 엔트리 변경(파일 생성/rename)을 디스크에 반영합니다.
+    디렉토리 fsync를 지원하지 않는 환경에서는 무시합니다.
+    
+    Args:
+        path: 디렉토리 경로
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_write(
+    path: Path,
+    mode: str = 'w',
+    encoding: Optional[str] = 'utf-8',
+    buffering: int = -1
+) -> Iterator[IO]:
+    """
+    같은 디렉토리의 임시 파일에 기록한 뒤 fsync 후 rename하여 파일을 원자적으로 교체합니다.
+    
+    중간에 예외가 나거나 프로세스가 죽어도 기존 파일은 그대로 남고, 읽는 쪽은
+    항상 이전 파일 또는 완성된 새 파일만 보게 됩니다.
+    임시 파일 이름은 '.'으로 시작하므로 Parquet 데이터셋 스캔에서도 제외됩니다.
+    
+    사용 예:
+        with atomic_write(file_path) as f:
+            f.write(...)
+    
+    Args:
+        path: 최종 파일 경로
+        mode: 'w'(텍스트) 또는 'wb'(바이너리)
+        encoding: 텍스트 모드 인코딩 (바이너리 모드에서는 무시)
+        buffering: open()의 buffering 인자
+    
+    Yields:
+        임시 파일 객체
+    """
+    path = Path(path)
+    ensure_dir(path.parent)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    
+    try:
+        binary = 'b' in mode
+        with os.fdopen(
+            fd, mode, buffering=buffering,
+            encoding=None if binary else encoding,
+            newline=None if binary else ''
+        ) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise
+    
+    fsync_dir(path.parent)
+
+
+class _FileLockState:
+    """경로별 잠금 상태 (스레드 간 RLock + 프로세스 간 flock 파일 디스크립터)"""
+    
+    __slots__ = ('rlock', 'depth', 'fd')
+    
+    def __init__(self) -> None:
+        self.rlock = threading.RLock()
+        self.depth = 0
+        self.fd: Optional[int] = None
+
+
+_FILE_LOCKS: Dict[str, _FileLockState] = {}
+_FILE_LOCKS_GUARD = threading.Lock()
+
+
+def get_lock_path(path: Path) -> Path:
+    """
+    테이블/파티션 파일의 잠금 파일 경로를 반환합니다 (같은 디렉토리의 숨김 파일).
+    
+    Args:
+        path: 잠글 대상 파일 경로
+    
+    Returns:
+        잠금 파일 Path 객체 (예: .dim_webtoon.jsonl.lock)
+    """
+    path = Path(path)
+    return path.parent / f'.{path.name}.lock'
+
+
+def get_lock_timeout() -> Optional[float]:
+    """
+    파일 잠금 대기 시간(초)을 반환합니다.
+    환경 변수 FILE_LOCK_TIMEOUT_SECONDS가 설정되어 있으면 그 값을 사용합니다.
+    
+    Returns:
+        대기 시간 (기본값: 600초, 0 이하이면 무제한 대기 None)
+    """
+    timeout = float(os.getenv('FILE_LOCK_TIMEOUT_SECONDS', '600'))
+    return timeout if timeout > 0 else None
+
+
+@contextmanager
+def file_lock(path: Path, timeout: Optional[float] = -1) -> Iterator[None]:
+    """
+    테이블/파티션 파일 단위의 배타적 advisory 잠금을 겁니다.
+    
+    - 프로세스 간: 잠금 파일에 fcntl.flock (같은 DATA_DIR을 쓰는 다른 실행과 직렬화)
+    - 스레드 간: 경로별 RLock (병렬 워커끼리 직렬화)
+    - 같은 스레드에서는 재진입 가능 (바깥에서 잡은 잠금 안에서 저장 함수가 다시 잠가도 됨)
+    
+    사용 예:
+        with file_lock(get_dim_webtoon_jsonl_path()):
+            ... 읽기 → 병합 → 쓰기 ...
+    
+    Args:
+        path: 잠글 대상 파일 경로 (잠금 파일은 get_lock_path로 결정)
+        timeout: 최대 대기 시간(초). -1이면 get_lock_timeout(), None이면 무제한
+    
+    Raises:
+        TimeoutError: 대기 시간 안에 잠금을 얻지 못한 경우
+    """
+    lock_path = get_lock_path(path)
+    key = os.path.abspath(lock_path)
+    if timeout == -1:
+        timeout = get_lock_timeout()
+    deadline = None if timeout is None else time.monotonic() + timeout
+    
+    with _FILE_LOCKS_GUARD:
+        state = _FILE_LOCKS.setdefault(key, _FileLockState())
+    
+    if not state.rlock.acquire(timeout=-1 if timeout is None else timeout):
+        raise TimeoutError(f"파일 잠금 대기 시간 초과: {lock_path}")
+    
+    try:
+        if state.depth == 0 and FCNTL_AVAILABLE:
+            ensure_dir(lock_path.parent)
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _acquire_flock(fd, lock_path, deadline)
+            except BaseException:
+                os.close(fd)
+                raise
+            state.fd = fd
+        
+        state.depth += 1
+        try:
+            yield
+        finally:
+            state.depth -= 1
+            if state.depth == 0 and state.fd is not None:
+                fcntl.flock(state.fd, fcntl.LOCK_UN)
+                os.close(state.fd)
+                state.fd = None
+    finally:
+        state.rlock.release()
+
+
+def _acquire_flock(fd: int, lock_path: Path, deadline: Optional[float]) -> None:
+    if deadline is None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return
+    
+    waited = False
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return
+        except BlockingIOError:
+            if not waited:
+                logger.info(f"다른 실행이 잠금을 사용 중입니다. 대기: {lock_path.name}")
+                waited = True
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"파일 잠금 대기 시간 초과: {lock_path}")
+            time.sleep(0.05)
+
+
 def format_datetime(dt: datetime) -> str:
     """
     datetime을 CSV 저장용 문자열로 변환합니다.
@@ -229,6 +638,25 @@ def format_datetime(dt: datetime) -> str:
     return dt.strftime('%Y-%m-%d %H:%M:%S')
 
 
+# dim_webtoon created_at/updated_at 저장 형식 (CSV/Parquet 병합과 JSONL 변경 로그가 같은 형식을 사용)
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S.%f'
+
+
+def format_timestamp(value) -> str:
+    """
+    dim_webtoon의 created_at/updated_at을 저장용 문자열로 변환합니다.
+    
+    Args:
+        value: datetime 객체 또는 ISO 형식 문자열 (이전 실행에서 저장된 값)
+    
+    Returns:
+        TIMESTAMP_FORMAT 형식 문자열 (YYYY-MM-DD HH:MM:SS.ffffff)
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return value.strftime(TIMESTAMP_FORMAT)
+
+
 def parse_datetime(dt_str: str) -> datetime:
     """
     CSV에서 읽은 datetime 문자열을 datetime 객체로 변환합니다.
@@ -0,0 +1,332 @@
+"""
+로컬 웨어하우스 모듈 (SQLite)
+
+DATA_FORMAT=sqlite일 때 dim_webtoon, fact_weekly_chart를 파일 대신
+내장 데이터베이스(processed/warehouse.db)에 저장합니다.
+- dim_webtoon: webtoon_id 기본 키
+- fact_weekly_chart: (chart_date, webtoon_id, weekday, sort_key) 고유 인덱스
+- upsert는 ON CONFLICT로 처리 (upload_bigquery.py의 MERGE와 같은 규칙)
+
+중복 제거를 위해 기존 파일 전체를 pandas로 읽을 필요가 없고,
+기간/정렬 키별 히스토리 조회도 인덱스를 사용합니다.
+"""
+
+import json
+import logging
+import sqlite3
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from src.models import (
+    DIM_WEBTOON_COLUMNS,
+    FACT_WEEKLY_CHART_COLUMNS,
+    compute_dim_webtoon_fingerprint,
+)
+from src.utils import get_warehouse_path
+
+logger = logging.getLogger(__name__)
+
+
+# 동시 실행 시 SQLite 쓰기 잠금 대기 시간 (초)
+WAREHOUSE_BUSY_TIMEOUT_SECONDS = 60
+
+WAREHOUSE_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS dim_webtoon (
+        webtoon_id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        author TEXT,
+        genre TEXT,
+        tags TEXT,
+        seo_id TEXT,
+        adult INTEGER,
+        catchphrase TEXT,
+        badges TEXT,
+        content_id INTEGER,
+        created_at TEXT,
+        updated_at TEXT,
+        fingerprint TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS fact_weekly_chart (
+        chart_date TEXT NOT NULL,
+        webtoon_id TEXT NOT NULL,
+        rank INTEGER NOT NULL,
+        collected_at TEXT,
+        weekday TEXT,
+        weekday_rank INTEGER,
+        year INTEGER,
+        month INTEGER,
+        week INTEGER,
+        view_count INTEGER,
+        sort_key TEXT
+    )
+    """,
+    # weekday, sort_key가 NULL인 레코드도 중복으로 판단하도록 COALESCE 사용
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS ux_fact_weekly_chart_key
+    ON fact_weekly_chart (chart_date, webtoon_id, COALESCE(weekday, ''), COALESCE(sort_key, ''))
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_fact_weekly_chart_sort_key_date
+    ON fact_weekly_chart (sort_key, chart_date)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_fact_weekly_chart_webtoon_id
+    ON fact_weekly_chart (webtoon_id)
+    """,
+]
+
+# dim_webtoon upsert: created_at은 유지하고 나머지 필드와 updated_at을 갱신 (BigQuery MERGE와 동일)
+# fingerprint가 같으면 갱신하지 않음 (updated_at 유지)
+DIM_WEBTOON_UPSERT_SQL = f"""
+INSERT INTO dim_webtoon ({', '.join(DIM_WEBTOON_COLUMNS)})
+VALUES ({', '.join('?' for _ in DIM_WEBTOON_COLUMNS)})
+ON CONFLICT (webtoon_id) DO UPDATE SET
+    title = excluded.title,
+    author = excluded.author,
+    genre = excluded.genre,
+    tags = excluded.tags,
+    seo_id = excluded.seo_id,
+    adult = excluded.adult,
+    catchphrase = excluded.catchphrase,
+    badges = excluded.badges,
+    content_id = excluded.content_id,
+    updated_at = excluded.updated_at,
+    fingerprint = excluded.fingerprint
+WHERE dim_webtoon.fingerprint IS NOT excluded.fingerprint
+"""
+
+# fact_weekly_chart upsert: 같은 키의 레코드는 새 값으로 갱신 (BigQuery MERGE와 동일)
+FACT_WEEKLY_CHART_UPSERT_SQL = f"""
+INSERT INTO fact_weekly_chart ({', '.join(FACT_WEEKLY_CHART_COLUMNS)})
+VALUES ({', '.join('?' for _ in FACT_WEEKLY_CHART_COLUMNS)})
+ON CONFLICT (chart_date, webtoon_id, COALESCE(weekday, ''), COALESCE(sort_key, '')) DO UPDATE SET
+    rank = excluded.rank,
+    collected_at = excluded.collected_at,
+    weekday_rank = excluded.weekday_rank,
+    year = excluded.year,
+    month = excluded.month,
+    week = excluded.week,
+    view_count = excluded.view_count
+"""
+
+
+def _to_sql_value(value: Any) -> Any:
+    """Python 값을 SQLite에 저장할 값으로 변환합니다."""
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return json.dumps(list(value), ensure_ascii=False)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, float) and value != value:
+        # NaN은 NULL로 저장
+        return None
+    if hasattr(value, 'item'):
+        # numpy 스칼라
+        return value.item()
+    return value
+
+
+def _dim_webtoon_row(record: Dict) -> Dict:
+    """SQLite 행을 dim_webtoon 레코드로 변환합니다."""
+    row = dict(record)
+    for field in ('tags', 'badges'):
+        if row.get(field) is not None:
+            row[field] = json.loads(row[field])
+    if row.get('adult') is not None:
+        row['adult'] = bool(row['adult'])
+    for field in ('created_at', 'updated_at'):
+        if row.get(field):
+            row[field] = datetime.fromisoformat(row[field])
+    return row
+
+
+def _fact_weekly_chart_row(record: Dict) -> Dict:
+    """SQLite 행을 fact_weekly_chart 레코드로 변환합니다."""
+    row = dict(record)
+    if row.get('chart_date'):
+        row['chart_date'] = date.fromisoformat(row['chart_date'])
+    if row.get('collected_at'):
+        row['collected_at'] = datetime.fromisoformat(row['collected_at'])
+    return row
+
+
+class LocalWarehouse:
+    """
+    SQLite 기반 로컬 웨어하우스입니다.
+
+    사용 예:
+        with LocalWarehouse() as warehouse:
+            warehouse.upsert_dim_webtoon(dim_records)
+            warehouse.upsert_fact_weekly_chart(fact_records)
+    """
+
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        """
+        Args:
+            db_path: 데이터베이스 파일 경로 (None이면 기본 경로)
+        """
+        self.db_path = db_path or get_warehouse_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # 다른 실행이 쓰기 트랜잭션 중이면 SQLite 잠금을 최대 WAREHOUSE_BUSY_TIMEOUT_SECONDS초 대기
+        self.connection = sqlite3.connect(str(self.db_path), timeout=WAREHOUSE_BUSY_TIMEOUT_SECONDS)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.ensure_schema()
+
+    def ensure_schema(self) -> None:
+        """테이블과 인덱스가 없으면 생성하고, 이전 버전 테이블에 없는 컬럼을 추가합니다."""
+        with self.connection:
+            for statement in WAREHOUSE_SCHEMA:
+                self.connection.execute(statement)
+
+            dim_columns = {row[1] for row in self.connection.execute('PRAGMA table_info(dim_webtoon)')}
+            if 'fingerprint' not in dim_columns:
+                self.connection.execute('ALTER TABLE dim_webtoon ADD COLUMN fingerprint TEXT')
+
+    # ------------------------------------------------------------------
+    # upsert
+    # ------------------------------------------------------------------
+
+    def upsert_dim_webtoon(self, records: Iterable[Dict]) -> List[Dict]:
+        """
+        dim_webtoon 레코드를 upsert합니다.
+        새 웹툰이거나 fingerprint가 바뀐 레코드만 기록합니다.
+
+        Args:
+            records: dim_webtoon 레코드
+
+        Returns:
+            추가/변경된 레코드 리스트 (delta)
+        """
+        existing = dict(self.connection.execute('SELECT webtoon_id, fingerprint FROM dim_webtoon'))
+
+        changed = []
+        seen = set()
+        for record in records:
+            webtoon_id = str(record['webtoon_id'])
+            if webtoon_id in seen:
+                continue
+            seen.add(webtoon_id)
+
+            fingerprint = record.get('fingerprint') or compute_dim_webtoon_fingerprint(record)
+            if existing.get(webtoon_id) == fingerprint:
+                continue
+            changed.append(dict(record, webtoon_id=webtoon_id, fingerprint=fingerprint))
+
+        rows = [
+            tuple(_to_sql_value(record.get(col)) for col in DIM_WEBTOON_COLUMNS)
+            for record in changed
+        ]
+        with self.connection:
+            self.connection.executemany(DIM_WEBTOON_UPSERT_SQL, rows)
+        logger.info(f"dim_webtoon upsert 완료: {len(changed)}개 추가/변경 (입력 {len(seen)}개, {self.db_path.name})")
+        return changed
+
+    def upsert_fact_weekly_chart(self, records: Iterable[Dict]) -> int:
+        """
+        fact_weekly_chart 레코드를 upsert합니다.
+        (chart_date, webtoon_id, weekday, sort_key)가 같은 레코드는 갱신합니다.
+
+        Args:
+            records: fact_weekly_chart 레코드
+
+        Returns:
+            처리한 레코드 수
+        """
+        rows = [
+            tuple(_to_sql_value(record.get(col)) for col in FACT_WEEKLY_CHART_COLUMNS)
+            for record in records
+        ]
+        with self.connection:
+            self.connection.executemany(FACT_WEEKLY_CHART_UPSERT_SQL, rows)
+        logger.info(f"fact_weekly_chart upsert 완료: {len(rows)}개 레코드 ({self.db_path.name})")
+        return len(rows)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def webtoon_ids(self) -> Set[str]:
+        """dim_webtoon에 저장된 webtoon_id 집합을 반환합니다."""
+        return {row[0] for row in self.connection.execute('SELECT webtoon_id FROM dim_webtoon')}
+
+    def load_dim_webtoon(self) -> List[Dict]:
+        """
+        dim_webtoon 전체 레코드를 반환합니다.
+
+        Returns:
+            dim_webtoon 레코드 리스트
+        """
+        cursor = self.connection.execute(f"SELECT {', '.join(DIM_WEBTOON_COLUMNS)} FROM dim_webtoon")
+        return [_dim_webtoon_row(row) for row in cursor]
+
+    def load_fact_weekly_chart(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        sort_keys: Optional[List[Optional[str]]] = None,
+        weekdays: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """
+        조건에 맞는 fact_weekly_chart 레코드를 반환합니다.
+
+        Args:
+            start_date: 시작 날짜 (포함, None이면 제한 없음)
+            end_date: 종료 날짜 (포함, None이면 제한 없음)
+            sort_keys: 정렬 키 리스트 (None 원소는 정렬 키 없는 레코드, None이면 전체)
+            weekdays: 요일 리스트 (None이면 전체)
+
+        Returns:
+            fact_weekly_chart 레코드 리스트
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if start_date is not None:
+            conditions.append('chart_date >= ?')
+            params.append(start_date.isoformat())
+        if end_date is not None:
+            conditions.append('chart_date <= ?')
+            params.append(end_date.isoformat())
+        if sort_keys is not None:
+            named_keys = [k for k in sort_keys if k is not None]
+            sort_conditions = []
+            if named_keys:
+                sort_conditions.append(f"sort_key IN ({', '.join('?' for _ in named_keys)})")
+                params.extend(named_keys)
+            if None in sort_keys:
+                sort_conditions.append('sort_key IS NULL')
+            conditions.append('(' + ' OR '.join(sort_conditions or ['0']) + ')')
+        if weekdays is not None:
+            conditions.append(f"weekday IN ({', '.join('?' for _ in weekdays)})")
+            params.extend(weekdays)
+
+        query = f"SELECT {', '.join(FACT_WEEKLY_CHART_COLUMNS)} FROM fact_weekly_chart"
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY chart_date, sort_key, rank'
+
+        return [_fact_weekly_chart_row(row) for row in self.connection.execute(query, params)]
+
+    # ------------------------------------------------------------------
+    # 컨텍스트 매니저
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """데이터베이스 연결을 닫습니다."""
+        self.connection.close()
+
+    def __enter__(self) -> 'LocalWarehouse':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()